@@ -0,0 +1,38 @@
+"""Compare two benchmark result files written by `benchmarks/run.py`.
+
+poetry run python benchmarks/compare.py before.json after.json
+"""
+
+import json
+import sys
+from typing import Any, Dict, Iterator, Tuple
+
+
+def flatten(results: Dict[str, Any], prefix: str = "") -> Iterator[Tuple[str, float]]:
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            yield from flatten(value, name)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def main(before_path: str, after_path: str) -> None:
+    with open(before_path) as file:
+        before = dict(flatten(json.load(file)["results"]))
+    with open(after_path) as file:
+        after = dict(flatten(json.load(file)["results"]))
+
+    width = max(len(name) for name in before) if before else 0
+    for name, old in before.items():
+        if name not in after:
+            continue
+        new = after[name]
+        change = (new - old) / old * 100 if old else 0.0
+        print(f"{name:<{width}}  {old:>14.2f}  {new:>14.2f}  {change:>+8.1f}%")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        sys.exit(f"usage: {sys.argv[0]} BEFORE.json AFTER.json")
+    main(sys.argv[1], sys.argv[2])
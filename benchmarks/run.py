@@ -0,0 +1,371 @@
+"""Benchmarks for the provider hot paths.
+
+Runs against a local stub Horizon server and prints the results as JSON, so runs
+from different commits can be compared with `benchmarks/compare.py`:
+
+    poetry run python benchmarks/run.py --output before.json
+    poetry run python benchmarks/run.py --output after.json
+    poetry run python benchmarks/compare.py before.json after.json
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Optional
+
+from openfeature import api
+from stub_server import DEFAULT_TOGGLES, StubHorizonServer
+
+from openfeature_provider_hyphen import (HyphenEvaluationContext,
+                                         HyphenProvider, HyphenProviderOptions,
+                                         HyphenUser, Urllib3Transport)
+from openfeature_provider_hyphen.utils import (parse_evaluation_response,
+                                               prepare_evaluate_payload)
+
+
+def make_context(index: int) -> HyphenEvaluationContext:
+    return HyphenEvaluationContext(
+        targeting_key=f"user-{index}",
+        attributes={
+            "user": HyphenUser(
+                id=f"user-{index}",
+                email=f"user-{index}@example.com",
+                custom_attributes={"plan": "premium"},
+            ),
+            "ip_address": "192.168.1.1",
+            "custom_attributes": {"device": "mobile", "platform": "ios"},
+        },
+    )
+
+
+TRANSPORTS = {"requests": lambda: None, "urllib3": Urllib3Transport}
+TRANSPORT = "requests"
+
+
+def make_provider(server_url: str, **options: Any) -> HyphenProvider:
+    options.setdefault("enable_toggle_usage", False)
+    options.setdefault("transport", TRANSPORTS[TRANSPORT]())
+    return HyphenProvider(
+        "public-benchmark",
+        HyphenProviderOptions(
+            application="benchmark",
+            environment="production",
+            horizon_urls=[server_url],
+            **options,
+        ),
+    )
+
+
+def summarize(durations_ns: List[int]) -> Dict[str, float]:
+    """Summarize per-operation durations in microseconds."""
+    ordered = sorted(durations_ns)
+
+    def percentile(p: float) -> float:
+        return ordered[min(len(ordered) - 1, int(len(ordered) * p))] / 1000
+
+    return {
+        "count": len(ordered),
+        "mean_us": statistics.fmean(ordered) / 1000,
+        "p50_us": percentile(0.5),
+        "p90_us": percentile(0.9),
+        "p99_us": percentile(0.99),
+        "max_us": ordered[-1] / 1000,
+    }
+
+
+def measure(fn: Callable[[int], Any], iterations: int) -> Dict[str, float]:
+    durations = []
+    for index in range(iterations):
+        start = time.perf_counter_ns()
+        fn(index)
+        durations.append(time.perf_counter_ns() - start)
+    return summarize(durations)
+
+
+def bench_cache_hit(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url)
+    context = make_context(0)
+    provider.resolve_boolean_details("bool-flag", False, context)
+    return measure(
+        lambda _: provider.resolve_boolean_details("bool-flag", False, context),
+        args.iterations,
+    )
+
+
+def bench_cache_miss(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url)
+    contexts = [make_context(index) for index in range(args.miss_iterations)]
+    return measure(
+        lambda index: provider.resolve_boolean_details(
+            "bool-flag", False, contexts[index]
+        ),
+        args.miss_iterations,
+    )
+
+
+def bench_prepare_evaluate_payload(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url)
+    context = provider._prepare_context(make_context(0))
+    return measure(lambda _: prepare_evaluate_payload(context), args.iterations)
+
+
+def bench_cache_key(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url)
+    context = provider._prepare_context(make_context(0))
+    generate = provider.hyphen_client.cache.generate_cache_key_fn
+    return measure(lambda _: generate(context), args.iterations)
+
+
+def bench_thread_throughput(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url, cache_l1_max_size=args.contexts)
+    contexts = [make_context(index) for index in range(args.contexts)]
+    for context in contexts:
+        provider.resolve_boolean_details("bool-flag", False, context)
+
+    per_thread = args.iterations // args.threads
+    barrier = threading.Barrier(args.threads + 1)
+
+    def worker():
+        barrier.wait()
+        for index in range(per_thread):
+            provider.resolve_boolean_details(
+                "bool-flag", False, contexts[index % len(contexts)]
+            )
+
+    threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    total = per_thread * args.threads
+    return {
+        "threads": args.threads,
+        "operations": total,
+        "ops_per_sec": total / elapsed,
+    }
+
+
+def bench_asyncio_throughput(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url, cache_l1_max_size=args.contexts)
+    contexts = [make_context(index) for index in range(args.contexts)]
+    for context in contexts:
+        provider.resolve_boolean_details("bool-flag", False, context)
+
+    per_task = args.iterations // args.tasks
+
+    async def task():
+        for index in range(per_task):
+            provider.resolve_boolean_details(
+                "bool-flag", False, contexts[index % len(contexts)]
+            )
+            if index % 100 == 0:
+                await asyncio.sleep(0)
+
+    async def main():
+        await asyncio.gather(*(task() for _ in range(args.tasks)))
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    elapsed = time.perf_counter() - start
+    total = per_task * args.tasks
+    return {"tasks": args.tasks, "operations": total, "ops_per_sec": total / elapsed}
+
+
+def bench_memory_per_context(args, server: StubHorizonServer) -> Dict[str, Any]:
+    provider = make_provider(server.url, cache_l1_max_size=args.contexts)
+    cache = provider.hyphen_client.cache
+    contexts = [
+        provider._prepare_context(make_context(i)) for i in range(args.contexts)
+    ]
+    body = {"toggles": DEFAULT_TOGGLES}
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for context in contexts:
+        cache.set(context, parse_evaluation_response(json.loads(json.dumps(body))))
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    allocated = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    return {
+        "contexts": args.contexts,
+        "bytes_total": allocated,
+        "bytes_per_context": allocated / args.contexts,
+    }
+
+
+def cache_bytes(cache, contexts, outcomes: int) -> int:
+    """Memory allocated by caching one response per context, with `outcomes` distinct ones."""
+    bodies = []
+    for outcome in range(outcomes):
+        toggles = json.loads(json.dumps(DEFAULT_TOGGLES))
+        toggles["number-flag"]["value"] = outcome
+        bodies.append(json.dumps({"toggles": toggles}))
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for index, context in enumerate(contexts):
+        body = json.loads(bodies[index % outcomes])
+        cache.set(context, parse_evaluation_response(body))
+    gc.collect()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    return sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+
+
+def bench_memory_scaling(args, server: StubHorizonServer) -> Dict[str, Any]:
+    """Cache memory by number of distinct contexts and of distinct flag outcomes."""
+    results: Dict[str, Any] = {}
+    for interned in (False, True):
+        runs = {}
+        for contexts_count in (args.contexts, args.contexts * 10):
+            for outcomes in (1, 10, 100):
+                provider = make_provider(
+                    server.url,
+                    cache_l1_max_size=contexts_count,
+                    cache_intern_responses=interned,
+                )
+                contexts = [
+                    provider._prepare_context(make_context(i))
+                    for i in range(contexts_count)
+                ]
+                allocated = cache_bytes(
+                    provider.hyphen_client.cache, contexts, outcomes
+                )
+                runs[f"{contexts_count}_contexts_{outcomes}_outcomes"] = {
+                    "bytes_total": allocated,
+                    "bytes_per_context": allocated / contexts_count,
+                }
+        results["interned" if interned else "not_interned"] = runs
+    return results
+
+
+def bench_telemetry_overhead(args, server: StubHorizonServer) -> Dict[str, Any]:
+    results = {}
+    context = make_context(0)
+    for enabled in (False, True):
+        provider = make_provider(server.url, enable_toggle_usage=enabled)
+        api.set_provider(provider)
+        client = api.get_client()
+        client.get_boolean_value("bool-flag", False, context)
+        results["enabled" if enabled else "disabled"] = measure(
+            lambda _: client.get_boolean_value("bool-flag", False, context),
+            args.miss_iterations,
+        )
+    api.clear_providers()
+    results["overhead_us"] = (
+        results["enabled"]["mean_us"] - results["disabled"]["mean_us"]
+    )
+    return results
+
+
+def bench_import_time(args, server: StubHorizonServer) -> Dict[str, Any]:
+    """Time importing the package and constructing a provider in a fresh interpreter."""
+    code = (
+        "from openfeature_provider_hyphen import HyphenProvider, HyphenProviderOptions\n"
+        "HyphenProvider('public-key', "
+        "HyphenProviderOptions(application='app', environment='production'))"
+    )
+    totals = []
+    for _ in range(5):
+        stderr = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stderr
+        total = 0
+        for line in stderr.splitlines():
+            fields = line[len("import time:") :].split("|")
+            # Top-level imports only, their cumulative time includes nested ones
+            if len(fields) == 3 and fields[1].strip().isdigit():
+                if not fields[2].startswith("  "):
+                    total += int(fields[1])
+        totals.append(total)
+    return {"import_us": statistics.median(totals)}
+
+
+BENCHMARKS = {
+    "cache_hit": bench_cache_hit,
+    "cache_miss": bench_cache_miss,
+    "prepare_evaluate_payload": bench_prepare_evaluate_payload,
+    "cache_key": bench_cache_key,
+    "thread_throughput": bench_thread_throughput,
+    "asyncio_throughput": bench_asyncio_throughput,
+    "memory_per_context": bench_memory_per_context,
+    "memory_scaling": bench_memory_scaling,
+    "telemetry_overhead": bench_telemetry_overhead,
+    "import_time": bench_import_time,
+}
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--only", nargs="*", choices=sorted(BENCHMARKS))
+    parser.add_argument("--iterations", type=int, default=20000)
+    parser.add_argument("--miss-iterations", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--tasks", type=int, default=100)
+    parser.add_argument("--contexts", type=int, default=1000)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default="requests")
+    parser.add_argument("--output", help="Write results to this file")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    global TRANSPORT
+    args = parse_args(argv)
+    TRANSPORT = args.transport
+    names = args.only or list(BENCHMARKS)
+    results = {}
+    with StubHorizonServer(latency_seconds=args.latency_ms / 1000) as server:
+        for name in names:
+            print(f"Running {name}...", file=sys.stderr)
+            results[name] = BENCHMARKS[name](args, server)
+
+    report = {
+        "meta": {
+            "commit": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""Local stub of the Horizon API used by the benchmarks."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+DEFAULT_TOGGLES = {
+    "bool-flag": {"key": "bool-flag", "value": True, "type": "boolean"},
+    "string-flag": {"key": "string-flag", "value": "blue", "type": "string"},
+    "number-flag": {"key": "number-flag", "value": 42, "type": "number"},
+    "object-flag": {
+        "key": "object-flag",
+        "value": {"limit": 10, "regions": ["us", "eu"]},
+        "type": "object",
+    },
+}
+
+
+class StubHorizonServer:
+    """Threaded HTTP server answering the evaluate and telemetry endpoints.
+
+    Args:
+        latency_seconds: Artificial delay added to every response
+        toggles: Toggles returned by the evaluate endpoint
+    """
+
+    def __init__(self, latency_seconds: float = 0.0, toggles: Optional[dict] = None):
+        self.latency_seconds = latency_seconds
+        self.body = json.dumps({"toggles": toggles or DEFAULT_TOGGLES}).encode()
+        self.requests = {"/toggle/evaluate": 0, "/toggle/telemetry": 0}
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = "http://127.0.0.1:%d" % self.server.server_address[1]
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def _handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def do_POST(self):
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                with stub._lock:
+                    stub.requests[self.path] = stub.requests.get(self.path, 0) + 1
+                if stub.latency_seconds:
+                    time.sleep(stub.latency_seconds)
+                body = stub.body if self.path == "/toggle/evaluate" else b"{}"
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self) -> "StubHorizonServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.server.shutdown()
+        self.server.server_close()
@@ -4,9 +4,44 @@ Hyphen provider for OpenFeature Python SDK.
 This package provides integration between OpenFeature and Hyphen's feature flag service.
 """
 
-from .provider import HyphenProvider
-from .types import (Evaluation, EvaluationResponse, HyphenEvaluationContext,
-                    HyphenProviderOptions, HyphenUser, TelemetryPayload)
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .cache_backends import (CacheBackend, MemoryCacheBackend,
+                                 RedisCacheBackend, SqliteCacheBackend)
+    from .provider import HyphenProvider
+    from .transports import (AsyncTransport, InMemoryTransport,
+                             RequestsTransport, ThreadedAsyncTransport,
+                             Transport, TransportError, TransportResponse,
+                             Urllib3Transport)
+    from .types import (Evaluation, EvaluationResponse,
+                        HyphenEvaluationContext, HyphenProviderOptions,
+                        HyphenUser, TelemetryPayload)
+
+# Submodules are imported on first access, so importing the package does not
+# pull in the HTTP stack and cache dependencies.
+_EXPORTS = {
+    "HyphenProvider": ".provider",
+    "HyphenProviderOptions": ".types",
+    "HyphenUser": ".types",
+    "HyphenEvaluationContext": ".types",
+    "Evaluation": ".types",
+    "EvaluationResponse": ".types",
+    "TelemetryPayload": ".types",
+    "CacheBackend": ".cache_backends",
+    "MemoryCacheBackend": ".cache_backends",
+    "RedisCacheBackend": ".cache_backends",
+    "SqliteCacheBackend": ".cache_backends",
+    "Transport": ".transports",
+    "AsyncTransport": ".transports",
+    "TransportError": ".transports",
+    "TransportResponse": ".transports",
+    "RequestsTransport": ".transports",
+    "Urllib3Transport": ".transports",
+    "InMemoryTransport": ".transports",
+    "ThreadedAsyncTransport": ".transports",
+}
 
 __all__ = [
     "HyphenProvider",
@@ -16,4 +51,29 @@ __all__ = [
     "Evaluation",
     "EvaluationResponse",
     "TelemetryPayload",
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "SqliteCacheBackend",
+    "Transport",
+    "AsyncTransport",
+    "TransportError",
+    "TransportResponse",
+    "RequestsTransport",
+    "Urllib3Transport",
+    "InMemoryTransport",
+    "ThreadedAsyncTransport",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(list(globals()) + __all__)
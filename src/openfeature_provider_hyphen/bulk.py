@@ -0,0 +1,190 @@
+import copy
+import json
+import logging
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from math import isnan
+from typing import (TYPE_CHECKING, Any, Dict, Hashable, List, Mapping,
+                    Optional, Sequence, Tuple, Union)
+
+from openfeature.evaluation_context import EvaluationContext
+
+if TYPE_CHECKING:
+    from .provider import HyphenProvider
+
+logger = logging.getLogger(__name__)
+
+# Array typecodes and flag types of the supported default value types
+_TYPECODES = {bool: "b", int: "q", float: "d"}
+_FLAG_TYPES = {bool: "boolean", int: "number", float: "number", str: "string"}
+_NUMPY_DTYPES = {"b": "bool", "q": "int64", "d": "float64"}
+
+Values = Union[array, List[Any]]
+
+
+@dataclass
+class BulkEvaluationResult:
+    """Values of a flag evaluated for many users, in row order."""
+
+    values: Values
+    """
+    Typed `array.array` for boolean (0/1), integer and float flags, a list for
+    string and object flags. Rows that failed hold the default value.
+    """
+    distinct_contexts: int
+    """The number of distinct contexts that were evaluated."""
+    errors: int
+    """The number of rows that got the default value because evaluation failed."""
+
+    def to_numpy(self) -> Any:
+        """Get the values as a NumPy array (requires `pip install numpy`)."""
+        numpy = _numpy()
+        if isinstance(self.values, array):
+            return numpy.asarray(self.values, dtype=_NUMPY_DTYPES[self.values.typecode])
+        return numpy.asarray(self.values, dtype=object)
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as error:
+        raise ImportError(
+            "Converting bulk evaluations requires the numpy package: pip install numpy"
+        ) from error
+    return numpy
+
+
+def column_values(column: Any) -> List[Any]:
+    """Convert a column (list, NumPy array, pandas Series, Arrow array) to a list.
+
+    Float NaN values, which pandas uses for missing values, become None.
+    """
+    if hasattr(column, "to_pylist"):
+        values = column.to_pylist()
+    elif hasattr(column, "tolist"):
+        values = column.tolist()
+    else:
+        values = list(column)
+    return [
+        None if isinstance(value, float) and isnan(value) else value for value in values
+    ]
+
+
+def _cell_key(value: Any) -> Hashable:
+    # Keeps True, 1 and 1.0 apart, and groups unhashable values such as lists
+    # (from Arrow list columns) by their JSON encoding
+    try:
+        hash(value)
+    except TypeError:
+        return type(value), json.dumps(value, sort_keys=True, default=str)
+    return type(value), value
+
+
+def _group_rows(
+    targeting_keys: List[Any],
+    ip_addresses: Optional[List[Any]],
+    custom_attributes: Dict[str, List[Any]],
+) -> Tuple[List[Tuple[Any, ...]], List[int]]:
+    """Find the distinct rows and the index of each row's distinct row."""
+    names = list(custom_attributes)
+    columns = [targeting_keys, ip_addresses or [None] * len(targeting_keys)]
+    columns.extend(custom_attributes[name] for name in names)
+    for column in columns:
+        if len(column) != len(targeting_keys):
+            raise ValueError("All columns must have the same length")
+
+    distinct: Dict[Tuple[Hashable, ...], int] = {}
+    rows = []
+    inverse = []
+    for row in zip(*columns):
+        key = tuple(_cell_key(value) for value in row)
+        index = distinct.get(key)
+        if index is None:
+            index = distinct[key] = len(rows)
+            rows.append(row)
+        inverse.append(index)
+    return rows, inverse
+
+
+def _build_context(row: Tuple[Any, ...], names: List[str]) -> EvaluationContext:
+    targeting_key, ip_address, *values = row
+    attributes: Dict[str, Any] = {}
+    if ip_address is not None:
+        attributes["ip_address"] = ip_address
+    custom = {name: value for name, value in zip(names, values) if value is not None}
+    if custom:
+        attributes["custom_attributes"] = custom
+    return EvaluationContext(
+        targeting_key=None if targeting_key is None else str(targeting_key),
+        attributes=attributes,
+    )
+
+
+def _coerce(value: Any, value_type: type) -> Any:
+    if value_type is bool and isinstance(value, str):
+        return value.lower() == "true"
+    if value_type in _TYPECODES:
+        return value_type(value)
+    if isinstance(value, (dict, list)):
+        # Cached values are shared, so the result gets its own copy
+        return copy.deepcopy(value)
+    return value
+
+
+def evaluate_columns(
+    provider: "HyphenProvider",
+    flag_key: str,
+    default_value: Any,
+    targeting_keys: Sequence[Any],
+    ip_addresses: Optional[Sequence[Any]] = None,
+    custom_attributes: Optional[Mapping[str, Sequence[Any]]] = None,
+    max_workers: int = 8,
+) -> BulkEvaluationResult:
+    """Evaluate a flag for every row of columnar context data.
+
+    Rows with identical targeting key and attributes are evaluated once, and
+    distinct contexts are evaluated concurrently through the provider's client
+    and cache.
+    """
+    value_type = type(default_value)
+    expected_type = _FLAG_TYPES.get(value_type, "object")
+    names = list(custom_attributes or {})
+    rows, inverse = _group_rows(
+        column_values(targeting_keys),
+        None if ip_addresses is None else column_values(ip_addresses),
+        {name: column_values(custom_attributes[name]) for name in names},
+    )
+
+    def evaluate(row: Tuple[Any, ...]) -> Tuple[Any, bool]:
+        try:
+            context = provider._prepare_context(_build_context(row, names))
+            response = provider.hyphen_client.evaluate(context)
+        except Exception as error:
+            logger.debug("Error evaluating %s in bulk: %s", flag_key, error)
+            return default_value, False
+        evaluation = response.toggles.get(flag_key)
+        if (
+            evaluation is None
+            or evaluation.error_message
+            or evaluation.type != expected_type
+        ):
+            return default_value, False
+        return _coerce(evaluation.value, value_type), True
+
+    results: List[Tuple[Any, bool]] = []
+    if rows:
+        workers = min(max_workers, len(rows))
+        with ThreadPoolExecutor(workers, thread_name_prefix="hyphen-bulk") as pool:
+            results = list(pool.map(evaluate, rows))
+
+    failed = [not succeeded for _, succeeded in results]
+    errors = sum(failed[index] for index in inverse)
+    distinct_values = [value for value, _ in results]
+    values: Values = [distinct_values[index] for index in inverse]
+    typecode = _TYPECODES.get(value_type)
+    if typecode is not None:
+        values = array(typecode, values)
+    return BulkEvaluationResult(
+        values=values, distinct_contexts=len(rows), errors=errors
+    )
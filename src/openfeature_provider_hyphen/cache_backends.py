@@ -0,0 +1,408 @@
+import json
+import os
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from urllib.parse import unquote, urlparse
+
+from cachetools import TLRUCache
+
+from .types import EvaluationResponse
+from .utils import parse_evaluation_response, serialize_evaluation_response
+
+if TYPE_CHECKING:
+    import sqlite3
+
+
+class CacheBackend(ABC):
+    """Storage backend used by CacheClient to hold cached evaluations."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value from the backend.
+
+        Args:
+            key: The cache key
+
+        Returns:
+            The cached value if found and not expired, None otherwise
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        """Store a value in the backend.
+
+        Args:
+            key: The cache key
+            value: The value to cache
+            ttl_seconds: Time-to-live in seconds for the entry
+        """
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        """Get several values from the backend.
+
+        Args:
+            keys: The cache keys
+
+        Returns:
+            The cached values in the same order as `keys`, None for misses
+        """
+        return [self.get(key) for key in keys]
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: float) -> None:
+        """Store several values in the backend.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl_seconds: Time-to-live in seconds for the entries
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl_seconds)
+
+    def _after_fork_in_child(self) -> None:
+        """Reset locks and connections inherited from the parent process."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """In-process cache backend. This is the default backend."""
+
+    def __init__(self, maxsize: int = 100):
+        """Initialize the in-memory backend.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        self.cache = TLRUCache(maxsize=maxsize, ttu=self._time_to_use)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _time_to_use(key: str, entry: tuple, now: float) -> float:
+        return now + entry[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self.cache.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        with self._lock:
+            self.cache[key] = (ttl_seconds, value)
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+
+def encode_evaluation_response(response: EvaluationResponse) -> str:
+    """Encode an EvaluationResponse for storage outside of the process."""
+    return json.dumps(serialize_evaluation_response(response))
+
+
+def decode_evaluation_response(data: str) -> EvaluationResponse:
+    """Decode a value written by `encode_evaluation_response`."""
+    return parse_evaluation_response(json.loads(data))
+
+
+class SqliteCacheBackend(CacheBackend):
+    """Cache backend stored in a local SQLite file.
+
+    All processes on a host that point at the same file share one cache, which
+    lets pre-fork servers (gunicorn, uWSGI) avoid fetching the same context once
+    per worker. Expiry is stored as a wall-clock timestamp so every process
+    agrees on when an entry goes stale.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encode: Callable[[Any], str] = encode_evaluation_response,
+        decode: Callable[[str], Any] = decode_evaluation_response,
+        purge_interval: int = 100,
+    ):
+        """Initialize the SQLite backend.
+
+        Args:
+            path: Path of the database file shared by all processes
+            encode: Function converting a cached value to a string
+            decode: Function converting a stored string back to a value
+            purge_interval: Number of writes between removals of expired rows
+        """
+        self.path = path
+        self.encode = encode
+        self.decode = decode
+        self.purge_interval = purge_interval
+        self._lock = threading.Lock()
+        self._connection: Optional["sqlite3.Connection"] = None
+        self._pid: Optional[int] = None
+        self._writes = 0
+        self._inherited: List["sqlite3.Connection"] = []
+
+    def _after_fork_in_child(self) -> None:
+        # The inherited connection is replaced on next use, see `_connect`
+        self._lock = threading.Lock()
+
+    def _connect(self) -> "sqlite3.Connection":
+        # Connections must not be shared with forked children, so reconnect
+        # whenever we find ourselves in a different process.
+        if self._connection is None or self._pid != os.getpid():
+            import sqlite3
+
+            if self._connection is not None:
+                # Closing the parent's connection in a child could checkpoint
+                # or remove the WAL under the parent, so keep it referenced.
+                self._inherited.append(self._connection)
+            connection = sqlite3.connect(
+                self.path, timeout=5, check_same_thread=False, isolation_level=None
+            )
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS hyphen_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value, expires_at FROM hyphen_cache WHERE key = ?", (key,)
+                )
+                .fetchone()
+            )
+        if row is None or row[1] <= time.time():
+            return None
+        return self.decode(row[0])
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        data = self.encode(value)
+        now = time.time()
+        with self._lock:
+            connection = self._connect()
+            connection.execute(
+                "INSERT OR REPLACE INTO hyphen_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, data, now + ttl_seconds),
+            )
+            self._writes += 1
+            if self._writes % self.purge_interval == 0:
+                connection.execute(
+                    "DELETE FROM hyphen_cache WHERE expires_at <= ?", (now,)
+                )
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        placeholders = ", ".join("?" for _ in keys)
+        with self._lock:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT key, value, expires_at FROM hyphen_cache "
+                    f"WHERE key IN ({placeholders})",
+                    keys,
+                )
+                .fetchall()
+            )
+        now = time.time()
+        found = {key: value for key, value, expires_at in rows if expires_at > now}
+        return [self.decode(found[key]) if key in found else None for key in keys]
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: float) -> None:
+        expires_at = time.time() + ttl_seconds
+        rows = [(key, self.encode(value), expires_at) for key, value in items.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.execute("BEGIN")
+                connection.executemany(
+                    "INSERT OR REPLACE INTO hyphen_cache (key, value, expires_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+
+    def close(self) -> None:
+        """Close the database connection held by this process."""
+        with self._lock:
+            if self._connection is not None and self._pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+
+class RedisError(Exception):
+    """Raised when a Redis-compatible server returns an error reply."""
+
+
+class _RedisConnection:
+    """Minimal RESP2 connection supporting pipelined commands."""
+
+    def __init__(self, host: str, port: int, timeout: float):
+        self.sock = socket.create_connection((host, port), timeout=timeout)
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.reader = self.sock.makefile("rb")
+
+    @staticmethod
+    def _encode_command(args: tuple) -> bytes:
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            if not isinstance(arg, bytes):
+                arg = str(arg).encode()
+            parts.append(b"$%d\r\n%s\r\n" % (len(arg), arg))
+        return b"".join(parts)
+
+    def _read_reply(self) -> Any:
+        line = self.reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode()
+        if prefix == b"-":
+            return RedisError(body.decode())
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length == -1:
+                return None
+            data = self.reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length == -1:
+                return None
+            return [self._read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    def execute_many(self, commands: List[tuple]) -> List[Any]:
+        """Send all commands in one write and read their replies in order."""
+        self.sock.sendall(b"".join(self._encode_command(args) for args in commands))
+        replies = [self._read_reply() for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RedisError):
+                raise reply
+        return replies
+
+    def close(self) -> None:
+        try:
+            self.reader.close()
+        finally:
+            self.sock.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Cache backend for a Redis-compatible server.
+
+    Bulk lookups use a single `MGET` and bulk writes are pipelined, so warming or
+    reading many contexts costs one network round trip. This backend is meant to
+    be shared by many hosts and is normally used as the second tier behind the
+    in-process cache of `CacheClient`.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        prefix: str = "hyphen:",
+        socket_timeout: float = 1.0,
+        encode: Callable[[Any], str] = encode_evaluation_response,
+        decode: Callable[[str], Any] = decode_evaluation_response,
+    ):
+        """Initialize the Redis backend.
+
+        Args:
+            url: Server URL in the form `redis://[:password@]host:port/db`
+            prefix: Prefix added to every key written by this backend
+            socket_timeout: Connect and read timeout in seconds
+            encode: Function converting a cached value to a string
+            decode: Function converting a stored string back to a value
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.prefix = prefix
+        self.socket_timeout = socket_timeout
+        self.encode = encode
+        self.decode = decode
+        self._lock = threading.Lock()
+        self._connection: Optional[_RedisConnection] = None
+        self._pid: Optional[int] = None
+
+    def _after_fork_in_child(self) -> None:
+        # The inherited connection is replaced on next use, see `_connect`
+        self._lock = threading.Lock()
+
+    def _connect(self) -> _RedisConnection:
+        if self._connection is None or self._pid != os.getpid():
+            connection = _RedisConnection(self.host, self.port, self.socket_timeout)
+            setup = []
+            if self.password:
+                if self.username:
+                    setup.append(("AUTH", self.username, self.password))
+                else:
+                    setup.append(("AUTH", self.password))
+            if self.db:
+                setup.append(("SELECT", self.db))
+            if setup:
+                connection.execute_many(setup)
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def _execute_many(self, commands: List[tuple]) -> List[Any]:
+        with self._lock:
+            try:
+                return self._connect().execute_many(commands)
+            except (OSError, ConnectionError):
+                # Drop the broken connection so the next call reconnects
+                self._reset()
+                raise
+
+    def _reset(self) -> None:
+        if self._connection is not None and self._pid == os.getpid():
+            try:
+                self._connection.close()
+            except OSError:
+                pass
+        self._connection = None
+
+    @staticmethod
+    def _ttl_ms(ttl_seconds: float) -> int:
+        return int(ttl_seconds * 1000)
+
+    def get(self, key: str) -> Optional[Any]:
+        return self.get_many([key])[0]
+
+    def set(self, key: str, value: Any, ttl_seconds: float) -> None:
+        self.set_many({key: value}, ttl_seconds)
+
+    def get_many(self, keys: List[str]) -> List[Optional[Any]]:
+        if not keys:
+            return []
+        (values,) = self._execute_many([("MGET", *(self.prefix + key for key in keys))])
+        return [
+            self.decode(value.decode()) if value is not None else None
+            for value in values
+        ]
+
+    def set_many(self, items: Dict[str, Any], ttl_seconds: float) -> None:
+        ttl_ms = self._ttl_ms(ttl_seconds)
+        if not items or ttl_ms <= 0:
+            return
+        self._execute_many(
+            [
+                ("SET", self.prefix + key, self.encode(value), "PX", ttl_ms)
+                for key, value in items.items()
+            ]
+        )
+
+    def close(self) -> None:
+        """Close the connection held by this process."""
+        with self._lock:
+            self._reset()
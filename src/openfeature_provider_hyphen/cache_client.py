@@ -1,17 +1,378 @@
 import hashlib
 import json
-from dataclasses import asdict
-from typing import Callable, Optional, TypeVar
+import logging
+import threading
+import time
+import weakref
+from dataclasses import asdict, dataclass
+from typing import (Any, Callable, Dict, List, Optional, Sequence, Tuple, Type,
+                    TypeVar)
 
-from cachetools import TTLCache
+from cachetools import LRUCache
 
-from .types import HyphenEvaluationContext
+from .cache_backends import CacheBackend, MemoryCacheBackend
+from .profiling import profile_phase
+from .tracing import start_span
+from .types import Evaluation, EvaluationResponse, HyphenEvaluationContext
+from .utils import hashable_value, validate_cache_key_attributes
 
 T = TypeVar("T")
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CacheTierStats:
+    """Counters for a single cache tier."""
+
+    hits: int = 0
+    misses: int = 0
+    errors: int = 0
+    latency_seconds: float = 0.0
+    """Total time spent in lookups on this tier."""
+
+
+@dataclass
+class CachedError:
+    """Marker stored in the cache for a context whose evaluation failed.
+
+    The type, arguments and attributes of the error are kept instead of the
+    error itself, so the cache does not hold on to its traceback, and every
+    hit raises a new exception.
+    """
+
+    error_type: Type[Exception]
+    args: Tuple[Any, ...]
+    attributes: Dict[str, Any]
+
+    @classmethod
+    def from_error(cls, error: Exception) -> "CachedError":
+        return cls(type(error), error.args, dict(vars(error)))
+
+    def to_exception(self) -> Exception:
+        """Create a new exception equal to the cached one.
+
+        The exception is created without calling its `__init__`, whose
+        signature may differ from its `args`, e.g. for `TransportError`.
+        """
+        try:
+            error = self.error_type.__new__(self.error_type, *self.args)
+            error.args = self.args
+            error.__dict__.update(self.attributes)
+        except Exception:
+            return Exception(*self.args)
+        return error
+
+
+@dataclass
+class _TTLState:
+    ttl_seconds: float
+    value: Any
+    hits: int = 0
+
+
+class AdaptiveTTLPolicy:
+    """Chooses the TTL of each cache entry from how often it is hit and whether it changes.
+
+    Every time an entry is stored again (after it expired or was refreshed) its
+    previous TTL is adjusted:
+
+    - halved when the new value differs from the previous one, so flags that
+      change often are fetched more often
+    - doubled when the value did not change and the entry was hit at least
+      `hot_hits` times, so hot contexts stay cached longer
+    - reset to the minimum when the entry was not hit at all, so rarely seen
+      contexts leave the cache sooner
+
+    TTLs are kept between `min_ttl_seconds` and `max_ttl_seconds`.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        min_ttl_seconds: float,
+        max_ttl_seconds: float,
+        hot_hits: int = 2,
+        max_entries: int = 10000,
+    ):
+        """Initialize the policy.
+
+        Args:
+            ttl_seconds: TTL of entries stored for the first time
+            min_ttl_seconds: Lower bound for TTLs
+            max_ttl_seconds: Upper bound for TTLs
+            hot_hits: Hits between refreshes for an entry to be considered hot
+            max_entries: Number of entries whose history is remembered
+        """
+        if min_ttl_seconds > max_ttl_seconds:
+            raise ValueError("min_ttl_seconds must not be greater than max_ttl_seconds")
+        self.min_ttl_seconds = min_ttl_seconds
+        self.max_ttl_seconds = max_ttl_seconds
+        self.initial_ttl_seconds = self._clamp(ttl_seconds)
+        self.hot_hits = hot_hits
+        self.states: LRUCache = LRUCache(maxsize=max_entries)
+        self.increases = 0
+        self.decreases = 0
+        self._lock = threading.Lock()
+
+    def _clamp(self, ttl_seconds: float) -> float:
+        return min(self.max_ttl_seconds, max(self.min_ttl_seconds, ttl_seconds))
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    def record_hit(self, key: str) -> None:
+        """Record a cache hit for the entry."""
+        with self._lock:
+            state = self.states.get(key)
+            if state is not None:
+                state.hits += 1
+
+    def ttl_for(self, key: str, value: Any) -> float:
+        """Get the TTL for a value about to be stored, and remember it.
+
+        Args:
+            key: The cache key
+            value: The value being stored
+
+        Returns:
+            The TTL in seconds
+        """
+        with self._lock:
+            state = self.states.get(key)
+            if state is None:
+                ttl = self.initial_ttl_seconds
+            elif state.value != value:
+                ttl = self._clamp(state.ttl_seconds / 2)
+            elif state.hits >= self.hot_hits:
+                ttl = self._clamp(state.ttl_seconds * 2)
+            elif state.hits == 0:
+                ttl = self.min_ttl_seconds
+            else:
+                ttl = state.ttl_seconds
+            if state is not None:
+                if ttl > state.ttl_seconds:
+                    self.increases += 1
+                elif ttl < state.ttl_seconds:
+                    self.decreases += 1
+            self.states[key] = _TTLState(ttl, value)
+        return ttl
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the number of tracked entries, TTL adjustments and the mean TTL."""
+        with self._lock:
+            ttls = [state.ttl_seconds for state in self.states.values()]
+        return {
+            "entries": len(ttls),
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "mean_ttl_seconds": sum(ttls) / len(ttls) if ttls else 0.0,
+        }
+
+
+def _json_default(value: Any) -> Any:
+    """Serialize nested objects such as HyphenUser when hashing a context."""
+    if hasattr(value, "__dict__"):
+        return value.__dict__
+    return str(value)
+
+
+def _evaluation_content(key: str, evaluation: Evaluation) -> Tuple[Any, ...]:
+    value = hashable_value(evaluation.value)
+    # The value type keeps True and 1 apart, which compare and hash equal
+    return (
+        key,
+        evaluation.key,
+        evaluation.type,
+        type(value),
+        value,
+        evaluation.variant,
+        evaluation.reason,
+        evaluation.error_message,
+    )
+
+
+class ResponseInterner:
+    """Deduplicates evaluation responses by content.
+
+    Equal responses are replaced by one shared instance, and equal evaluations
+    by one shared `Evaluation`, so cache entries of contexts with the same
+    flag outcomes share their objects. Shared objects must not be modified;
+    the provider returns copies of object flag values.
+    Only weak references are kept, so objects no cache entry uses are freed.
+    """
+
+    def __init__(self):
+        self.responses: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+        self.evaluations: "weakref.WeakValueDictionary" = weakref.WeakValueDictionary()
+        self.hits = 0
+        self._lock = threading.Lock()
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    def intern(self, response: EvaluationResponse) -> EvaluationResponse:
+        """Get the shared response with the same content as `response`."""
+        contents = {
+            key: _evaluation_content(key, evaluation)
+            for key, evaluation in response.toggles.items()
+        }
+        try:
+            response_key = frozenset(contents.values())
+        except TypeError:
+            # Unhashable values, such as nested containers in a variant
+            return response
+        with self._lock:
+            shared = self.responses.get(response_key)
+            if shared is not None:
+                if shared is not response:
+                    self.hits += 1
+                return shared
+            toggles = {
+                key: self.evaluations.setdefault(contents[key], evaluation)
+                for key, evaluation in response.toggles.items()
+            }
+            shared = EvaluationResponse(toggles=toggles)
+            self.responses[response_key] = shared
+            return shared
+
+    def stats(self) -> Dict[str, int]:
+        """Get the number of shared responses and evaluations, and reuses."""
+        return {
+            "responses": len(self.responses),
+            "evaluations": len(self.evaluations),
+            "hits": self.hits,
+        }
+
+
+def _lookup(value: Any, name: str) -> Any:
+    if isinstance(value, dict):
+        return value.get(name)
+    return getattr(value, name, None)
+
+
+def context_partition(context: HyphenEvaluationContext) -> Tuple[str, str]:
+    """The application and environment a prepared context is evaluated in."""
+    return (
+        getattr(context, "application", None) or "",
+        getattr(context, "environment", None) or "",
+    )
+
+
+def partitioned_cache_key(
+    generate_cache_key_fn: Callable[[HyphenEvaluationContext], str],
+) -> Callable[[HyphenEvaluationContext], str]:
+    """Prefix the cache keys of a key function with the context's partition.
+
+    Used when several applications or environments share a cache, so that the
+    same context never maps to another partition's entry.
+    """
+
+    def generate_cache_key(context: HyphenEvaluationContext) -> str:
+        application, environment = context_partition(context)
+        return f"{application}/{environment}:{generate_cache_key_fn(context)}"
+
+    return generate_cache_key
+
+
+class AttributeCacheKeyGenerator:
+    """Cache key generator that only hashes the context attributes that matter.
+
+    Attribute paths are dot-separated and use the layout of the evaluate request:
+    `targeting_key`, `application`, `environment`, and attribute names such as
+    `ip_address`, `user.email` or `custom_attributes.plan`. Paths are compiled
+    once, so generating a key only walks the selected attributes.
+    """
+
+    def __init__(
+        self,
+        include: Optional[Sequence[str]] = None,
+        exclude: Optional[Sequence[str]] = None,
+    ):
+        """Initialize the key generator.
+
+        Args:
+            include: Only these attribute paths are part of the key
+            exclude: These attribute paths are left out of the key
+
+        Raises:
+            ValueError: If both include and exclude are given
+        """
+        validate_cache_key_attributes(include, exclude)
+        self.include = [tuple(path.split(".")) for path in include] if include else None
+        self.exclude: Dict[str, Any] = {}
+        for path in exclude or []:
+            node = self.exclude
+            *parents, leaf = path.split(".")
+            for name in parents:
+                node = node.setdefault(name, {})
+                if node is None:
+                    break
+            else:
+                # None marks an excluded subtree
+                node[leaf] = None
+
+    @staticmethod
+    def _fields(context: HyphenEvaluationContext) -> Dict[str, Any]:
+        fields = {
+            k: v
+            for k, v in context.__dict__.items()
+            if k != "attributes" and v is not None
+        }
+        fields.update(context.attributes or {})
+        return fields
+
+    def _extract(self, fields: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+        value: Any = fields
+        for name in path:
+            value = _lookup(value, name)
+            if value is None:
+                return None
+        return value
+
+    def _strip(self, value: Any, excluded: Dict[str, Any]) -> Any:
+        if isinstance(value, dict):
+            items = value
+        elif hasattr(value, "__dict__"):
+            items = value.__dict__
+        else:
+            return value
+        result = {}
+        for name, item in items.items():
+            if name not in excluded:
+                result[name] = item
+            elif excluded[name] is not None:
+                result[name] = self._strip(item, excluded[name])
+        return result
+
+    def __call__(self, context: HyphenEvaluationContext) -> str:
+        """Generate a cache key from the selected attributes of the context.
+
+        Args:
+            context: The evaluation context to generate a key for
+
+        Returns:
+            A string hash of the selected attributes
+        """
+        fields = self._fields(context)
+        if self.include is not None:
+            data: Any = [self._extract(fields, path) for path in self.include]
+        else:
+            data = self._strip(fields, self.exclude)
+        context_str = json.dumps(data, sort_keys=True, default=_json_default)
+        return hashlib.sha256(context_str.encode()).hexdigest()
+
 
 class CacheClient:
-    """Client for caching feature flag evaluations."""
+    """Client for caching feature flag evaluations.
+
+    Entries are always kept in a small in-process cache (L1). When a backend is
+    configured it acts as a second tier (L2) shared with other processes or
+    hosts: L1 misses are looked up there and L2 hits are copied into L1.
+
+    Failed evaluations can be cached in L1 for a short time (negative caching) so
+    that a failing context does not hit the network on every evaluation.
+    """
 
     def __init__(
         self,
@@ -19,14 +380,41 @@ class CacheClient:
         generate_cache_key_fn: Optional[
             Callable[[HyphenEvaluationContext], str]
         ] = None,
+        backend: Optional[CacheBackend] = None,
+        l1_maxsize: int = 100,
+        l1_ttl_seconds: Optional[float] = None,
+        negative_ttl_seconds: Optional[float] = None,
+        tracer: Optional[Any] = None,
+        ttl_policy: Optional[AdaptiveTTLPolicy] = None,
+        interner: Optional[ResponseInterner] = None,
     ):
         """Initialize the cache client.
 
         Args:
             ttl_seconds: Time-to-live in seconds for cache entries
             generate_cache_key_fn: Optional function to generate cache keys
+            backend: Optional shared backend used as a second cache tier
+            l1_maxsize: Maximum number of entries in the in-process tier
+            l1_ttl_seconds: Optional shorter time-to-live for the in-process tier
+            negative_ttl_seconds: Time-to-live for cached failures, None disables
+            tracer: Optional OpenTelemetry tracer for key generation and lookups
+            ttl_policy: Optional policy choosing a TTL per entry instead of `ttl_seconds`
+            interner: Optional interner deduplicating the cached responses by content
         """
-        self.cache = TTLCache(maxsize=100, ttl=ttl_seconds)
+        self.ttl_seconds = ttl_seconds
+        self.l1_ttl_seconds = (
+            ttl_seconds if l1_ttl_seconds is None else min(ttl_seconds, l1_ttl_seconds)
+        )
+        self.l1_ttl_cap_seconds = l1_ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.ttl_policy = ttl_policy
+        self.interner = interner
+        self.l1 = MemoryCacheBackend(maxsize=l1_maxsize)
+        self.l2 = backend
+        self.l1_stats = CacheTierStats()
+        self.l2_stats = CacheTierStats()
+        self.negative_hits = 0
+        self.tracer = tracer
         self.generate_cache_key_fn = (
             generate_cache_key_fn or self._default_generate_cache_key
         )
@@ -48,29 +436,194 @@ class CacheClient:
         }
 
         # Sort dictionary to ensure consistent ordering
-        context_str = json.dumps(context_dict, sort_keys=True)
+        context_str = json.dumps(context_dict, sort_keys=True, default=_json_default)
 
         # Generate SHA-256 hash
         return hashlib.sha256(context_str.encode()).hexdigest()
 
-    def get(self, context: HyphenEvaluationContext) -> Optional[T]:
+    def _l2_get_many(self, keys: List[str]) -> List[Optional[T]]:
+        start = time.perf_counter()
+        try:
+            values = self.l2.get_many(keys)
+        except Exception as error:
+            # A shared cache being unavailable must not fail evaluations
+            logger.debug("Error reading from cache backend: %s", error)
+            self.l2_stats.errors += 1
+            values = [None] * len(keys)
+        self.l2_stats.latency_seconds += time.perf_counter() - start
+        return values
+
+    def _l2_set_many(self, items: Dict[str, T], ttl_seconds: float) -> None:
+        try:
+            self.l2.set_many(items, ttl_seconds)
+        except Exception as error:
+            logger.debug("Error writing to cache backend: %s", error)
+            self.l2_stats.errors += 1
+
+    def get(
+        self, context: HyphenEvaluationContext, local_only: bool = False
+    ) -> Optional[T]:
         """Get a value from the cache.
 
         Args:
             context: The evaluation context to get the cached value for
+            local_only: Whether to skip the L2 lookup on an L1 miss
 
         Returns:
-            The cached value if found, None otherwise
+            The cached value if found, a CachedError if the context failed
+            recently, None otherwise
         """
-        key = self.generate_cache_key_fn(context)
-        return self.cache.get(key)
+        return self.get_many([context], local_only)[0]
 
-    def set(self, context: HyphenEvaluationContext, value: T) -> None:
+    def get_many(
+        self, contexts: Sequence[HyphenEvaluationContext], local_only: bool = False
+    ) -> List[Optional[T]]:
+        """Get values for several contexts, using one L2 round trip for L1 misses.
+
+        Args:
+            contexts: The evaluation contexts to get cached values for
+            local_only: Whether to skip the L2 lookup on L1 misses
+
+        Returns:
+            The cached values in the same order as `contexts`, None for misses
+        """
+        with start_span(self.tracer, "hyphen.cache.generate_key"):
+            with profile_phase("key_generation"):
+                keys = [self.generate_cache_key_fn(context) for context in contexts]
+
+        with start_span(self.tracer, "hyphen.cache.lookup") as span:
+            with profile_phase("cache_lookup"):
+                values = self._get_many(keys, local_only)
+            if self.tracer is not None:
+                hits = sum(value is not None for value in values)
+                span.set_attributes(
+                    {
+                        "hyphen.cache.keys": len(keys),
+                        "hyphen.cache.hits": hits,
+                        "hyphen.cache.hit": hits == len(keys),
+                    }
+                )
+        return values
+
+    def _get_many(self, keys: List[str], local_only: bool = False) -> List[Optional[T]]:
+        start = time.perf_counter()
+        values = [self.l1.get(key) for key in keys]
+        self.l1_stats.latency_seconds += time.perf_counter() - start
+
+        missing = [index for index, value in enumerate(values) if value is None]
+        self.l1_stats.hits += len(keys) - len(missing)
+        self.l1_stats.misses += len(missing)
+        if self.ttl_policy is not None and len(missing) < len(keys):
+            for key, value in zip(keys, values):
+                if value is not None and not isinstance(value, CachedError):
+                    self.ttl_policy.record_hit(key)
+        if self.negative_ttl_seconds is not None and len(missing) < len(keys):
+            self.negative_hits += sum(isinstance(v, CachedError) for v in values)
+        if self.l2 is None or not missing or local_only:
+            return values
+
+        found = self._l2_get_many([keys[index] for index in missing])
+        for index, value in zip(missing, found):
+            if value is not None:
+                value = self.intern(value)
+                values[index] = value
+                self.l1.set(keys[index], value, self.l1_ttl_seconds)
+                self.l2_stats.hits += 1
+            else:
+                self.l2_stats.misses += 1
+        return values
+
+    def set(self, context: HyphenEvaluationContext, value: T) -> T:
         """Set a value in the cache.
 
         Args:
             context: The evaluation context to set the cached value for
             value: The value to cache
+
+        Returns:
+            The cached value, which is the shared instance when interning
         """
+        return self.set_many([(context, value)])[0]
+
+    def set_many(self, items: Sequence[Tuple[HyphenEvaluationContext, T]]) -> List[T]:
+        """Set values for several contexts, using one L2 round trip.
+
+        Args:
+            items: Pairs of evaluation context and value to cache
+
+        Returns:
+            The cached values, in order, which are the shared instances when
+            interning
+        """
+        stored = [
+            (self.generate_cache_key_fn(context), self.intern(value))
+            for context, value in items
+        ]
+        keyed = dict(stored)
+        if self.ttl_policy is not None:
+            self._set_many_adaptive(keyed)
+        else:
+            for key, value in keyed.items():
+                self.l1.set(key, value, self.l1_ttl_seconds)
+            if self.l2 is not None and keyed:
+                self._l2_set_many(keyed, self.ttl_seconds)
+        return [value for _, value in stored]
+
+    def _set_many_adaptive(self, keyed: Dict[str, T]) -> None:
+        """Store entries with the TTL chosen by the TTL policy for each one."""
+        by_ttl: Dict[float, Dict[str, T]] = {}
+        for key, value in keyed.items():
+            ttl = self.ttl_policy.ttl_for(key, value)
+            l1_ttl = ttl
+            if self.l1_ttl_cap_seconds is not None:
+                l1_ttl = min(ttl, self.l1_ttl_cap_seconds)
+            self.l1.set(key, value, l1_ttl)
+            by_ttl.setdefault(ttl, {})[key] = value
+        if self.l2 is not None:
+            for ttl, items in by_ttl.items():
+                self._l2_set_many(items, ttl)
+
+    def intern(self, value: T) -> T:
+        """Get the shared instance of an evaluation response, when interning."""
+        if self.interner is not None and isinstance(value, EvaluationResponse):
+            return self.interner.intern(value)
+        return value
+
+    def set_error(self, context: HyphenEvaluationContext, error: Exception) -> None:
+        """Cache a failed evaluation for the negative cache TTL.
+
+        Failures are only cached in-process and never written to the shared tier.
+
+        Args:
+            context: The evaluation context that failed
+            error: The error raised by the evaluation
+        """
+        if self.negative_ttl_seconds is None:
+            return
         key = self.generate_cache_key_fn(context)
-        self.cache[key] = value
+        self.l1.set(key, CachedError.from_error(error), self.negative_ttl_seconds)
+
+    def _after_fork_in_child(self) -> None:
+        """Reset locks and connections inherited from the parent process.
+
+        Cached entries are kept, so a cache warmed before forking is shared
+        copy-on-write by every child.
+        """
+        self.l1._after_fork_in_child()
+        if self.l2 is not None:
+            self.l2._after_fork_in_child()
+        if self.ttl_policy is not None:
+            self.ttl_policy._after_fork_in_child()
+        if self.interner is not None:
+            self.interner._after_fork_in_child()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get hit, miss, error and latency counters for each cache tier."""
+        stats = {"l1": asdict(self.l1_stats), "negative_hits": self.negative_hits}
+        if self.l2 is not None:
+            stats["l2"] = asdict(self.l2_stats)
+        if self.ttl_policy is not None:
+            stats["adaptive_ttl"] = self.ttl_policy.stats()
+        if self.interner is not None:
+            stats["interned"] = self.interner.stats()
+        return stats
@@ -0,0 +1,63 @@
+import threading
+from typing import Dict, List
+
+from cachetools import LRUCache
+
+from .types import Evaluation, EvaluationResponse
+from .utils import hashable_value
+
+
+def fingerprint_evaluation(evaluation: Evaluation) -> int:
+    """Hash the parts of an evaluation that matter to the application."""
+    value = hashable_value(evaluation.value)
+    return hash((evaluation.type, value, evaluation.variant, evaluation.error_message))
+
+
+def fingerprint_response(response: EvaluationResponse) -> Dict[str, int]:
+    """Hash each flag of an evaluation response."""
+    return {
+        key: fingerprint_evaluation(evaluation)
+        for key, evaluation in response.toggles.items()
+    }
+
+
+class FlagChangeTracker:
+    """Detects which flags changed between refreshes of the same cache entry.
+
+    Only a hash per flag is kept for each entry, in a bounded LRU.
+    """
+
+    def __init__(self, max_entries: int = 10000):
+        """Initialize the tracker.
+
+        Args:
+            max_entries: Number of cache entries whose fingerprints are remembered
+        """
+        self.fingerprints: LRUCache = LRUCache(maxsize=max_entries)
+        self._lock = threading.Lock()
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    def update(self, key: str, response: EvaluationResponse) -> List[str]:
+        """Remember the response for a cache entry and diff it with the previous one.
+
+        Args:
+            key: The cache key of the entry
+            response: The refreshed response
+
+        Returns:
+            The keys of flags that were added, removed or changed, sorted. Empty
+            the first time an entry is seen.
+        """
+        current = fingerprint_response(response)
+        with self._lock:
+            previous = self.fingerprints.get(key)
+            self.fingerprints[key] = current
+        if previous is None or previous == current:
+            return []
+        return sorted(
+            flag
+            for flag in previous.keys() | current.keys()
+            if previous.get(flag) != current.get(flag)
+        )
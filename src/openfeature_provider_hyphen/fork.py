@@ -0,0 +1,29 @@
+import logging
+import os
+import weakref
+
+logger = logging.getLogger(__name__)
+
+_handlers: "weakref.WeakSet" = weakref.WeakSet()
+
+
+def register_fork_handler(obj) -> None:
+    """Call `obj._after_fork_in_child()` in the child after every `os.fork()`.
+
+    Only a weak reference is kept, so registering does not keep `obj` alive.
+    """
+    _handlers.add(obj)
+
+
+def _after_fork_in_child() -> None:
+    # Threads do not survive a fork and locks may have been held by one of
+    # them, so every registered object resets its locks, threads and sockets.
+    for obj in list(_handlers):
+        try:
+            obj._after_fork_in_child()
+        except Exception as error:
+            logger.debug("Error resetting %r after fork: %s", obj, error)
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_after_fork_in_child)
@@ -3,7 +3,8 @@ import logging
 from openfeature.flag_evaluation import FlagEvaluationDetails
 from openfeature.hook import Hook, HookContext
 
-from .types import TelemetryPayload
+from .profiling import profile_hook
+from .types import CACHE_MISS_REASON, TelemetryPayload
 from .utils import prepare_evaluate_payload, prepare_telemetry_details
 
 logger = logging.getLogger(__name__)
@@ -28,18 +29,34 @@ class TelemetryHook(Hook):
     ) -> None:
         """Process telemetry after flag evaluation.
 
+        Sampled-out evaluations return before any payload is built, and
+        non-blocking cache misses, which only returned the default value, are
+        not reported.
+
         Args:
             hook_context: Context for the hook execution
             details: Details about the flag evaluation
             hints: Additional hints from the evaluation process
         """
-        context = self.provider._prepare_context(hook_context.evaluation_context)
-        context_dict = prepare_evaluate_payload(context)
-        details_dict = prepare_telemetry_details(details)
-
-        payload = TelemetryPayload(context=context_dict, data={"toggle": details_dict})
-
-        try:
-            self.provider.hyphen_client.post_telemetry(payload)
-        except Exception as error:
-            logger.error("Unable to log usage: %s", error)
+        if details.reason == CACHE_MISS_REASON:
+            return
+        with profile_hook():
+            context = self.provider._prepare_context(hook_context.evaluation_context)
+            weight = self.provider.telemetry_sampler.sample_weight(
+                details.flag_key, context.targeting_key
+            )
+            if weight is None:
+                return
+            context_dict = prepare_evaluate_payload(context)
+            details_dict = prepare_telemetry_details(details)
+            if weight != 1.0:
+                details_dict["sampleWeight"] = weight
+
+            payload = TelemetryPayload(
+                context=context_dict, data={"toggle": details_dict}
+            )
+
+            try:
+                self.provider.hyphen_client.post_telemetry(payload)
+            except Exception as error:
+                logger.error("Unable to log usage: %s", error)
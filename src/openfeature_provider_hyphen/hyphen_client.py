@@ -1,13 +1,31 @@
+import json
 import logging
-from typing import Dict
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import requests
+from cachetools import LRUCache
+from requests.adapters import BaseAdapter, HTTPAdapter
 
-from .cache_client import CacheClient
-from .types import (Evaluation, EvaluationResponse, HyphenEvaluationContext,
+from .cache_client import (AdaptiveTTLPolicy, AttributeCacheKeyGenerator,
+                           CacheClient, CachedError, ResponseInterner,
+                           context_partition, partitioned_cache_key)
+from .changes import FlagChangeTracker
+from .fork import register_fork_handler
+from .limiter import AdaptiveConcurrencyLimiter, ConcurrencyLimitExceeded
+from .metrics import Metrics
+from .profiling import profile_phase
+from .spool import TelemetrySpool
+from .telemetry import TelemetryWorker
+from .tracing import start_span
+from .transports import RequestsTransport, ThreadedAsyncTransport
+from .types import (EvaluationResponse, HyphenEvaluationContext,
                     HyphenProviderOptions, TelemetryPayload)
-from .utils import (build_default_horizon_url, build_url,
-                    prepare_evaluate_payload, transform_dict_keys)
+from .utils import (build_default_horizon_url, build_url, compress_body,
+                    parse_evaluation_response, prepare_evaluate_payload,
+                    resolve_client_options, transform_dict_keys)
+from .warming import BackgroundFetcher
 
 logger = logging.getLogger(__name__)
 
@@ -15,12 +33,16 @@ logger = logging.getLogger(__name__)
 class HyphenClient:
     """Client for interacting with the Hyphen API."""
 
-    def __init__(self, public_key: str, options: HyphenProviderOptions):
+    def __init__(
+        self, public_key: str, options: HyphenProviderOptions, shared: bool = False
+    ):
         """Initialize the Hyphen client.
 
         Args:
             public_key: The public API key for authentication
             options: Configuration options for the client
+            shared: Whether the client is shared by providers for several
+                applications or environments, which partitions the cache
         """
         self.public_key = public_key
         self.default_horizon_url = build_default_horizon_url(public_key)
@@ -28,16 +50,309 @@ class HyphenClient:
             *(options.horizon_urls or []),
             *(self.default_horizon_url,),
         ]
+        ttl_seconds, ttl_bounds = resolve_client_options(options)
+        generate_cache_key_fn = options.generate_cache_key_fn
+        if generate_cache_key_fn is None and (
+            options.cache_key_include_attributes or options.cache_key_exclude_attributes
+        ):
+            generate_cache_key_fn = AttributeCacheKeyGenerator(
+                include=options.cache_key_include_attributes,
+                exclude=options.cache_key_exclude_attributes,
+            )
+        ttl_policy = None
+        if ttl_bounds is not None:
+            ttl_policy = AdaptiveTTLPolicy(
+                ttl_seconds,
+                min_ttl_seconds=ttl_bounds[0],
+                max_ttl_seconds=ttl_bounds[1],
+            )
         self.cache = CacheClient(
-            ttl_seconds=options.cache_ttl_seconds or 30,
-            generate_cache_key_fn=options.generate_cache_key_fn,
+            ttl_seconds=ttl_seconds,
+            generate_cache_key_fn=generate_cache_key_fn,
+            backend=options.cache_backend,
+            l1_maxsize=options.cache_l1_max_size or 100,
+            l1_ttl_seconds=options.cache_l1_ttl_seconds,
+            negative_ttl_seconds=options.negative_cache_ttl_seconds,
+            tracer=options.tracer,
+            ttl_policy=ttl_policy,
+            interner=ResponseInterner() if options.cache_intern_responses else None,
+        )
+        self.shared = shared
+        if shared:
+            self.cache.generate_cache_key_fn = partitioned_cache_key(
+                self.cache.generate_cache_key_fn
+            )
+        self.tracer = options.tracer
+        self.options = options
+        self.headers = {"Content-Type": "application/json", "x-api-key": public_key}
+        self.session: Optional[requests.Session] = None
+        self.transport = options.transport
+        if self.transport is None:
+            self.session = self._create_session()
+            self.transport = RequestsTransport(self.session)
+        self.async_transport = options.async_transport or ThreadedAsyncTransport(
+            self.transport
+        )
+        self.compression = options.request_compression
+        if self.compression is not None:
+            self._compressed_headers = {
+                **self.headers,
+                "Content-Encoding": self.compression,
+            }
+        self.idle_timeout_seconds = options.http_idle_timeout_seconds
+        self._last_request_at = time.monotonic()
+        self.change_tracker = (
+            FlagChangeTracker() if options.notify_flag_changes else None
+        )
+        self.limiter = (
+            AdaptiveConcurrencyLimiter(
+                initial_limit=options.concurrency_initial_limit,
+                max_limit=options.concurrency_max_limit,
+                max_queue_size=options.concurrency_queue_size,
+                queue_timeout_seconds=options.concurrency_queue_timeout_seconds,
+                latency_threshold_seconds=options.concurrency_latency_threshold_seconds,
+            )
+            if options.adaptive_concurrency
+            else None
+        )
+        # Last known responses, served when the limiter turns an evaluation away
+        # or when a non-blocking evaluation misses the cache
+        self.stale_responses: Optional[LRUCache] = (
+            LRUCache(maxsize=options.cache_l1_max_size or 100)
+            if self.limiter is not None or options.non_blocking_evaluation
+            else None
+        )
+        self.background_fetcher = (
+            BackgroundFetcher(
+                self.evaluate,
+                self.cache.generate_cache_key_fn,
+                max_workers=options.warm_max_workers,
+                max_pending=options.background_fetch_max_pending,
+            )
+            if options.non_blocking_evaluation
+            else None
+        )
+        self._stale_lock = threading.Lock()
+        self.on_flags_changed: Optional[Callable[[List[str]], None]] = None
+        # Listeners of shared clients, keyed by application and environment
+        self.partition_listeners: Dict[
+            Tuple[str, str], Callable[[List[str]], None]
+        ] = {}
+        self.metrics = Metrics() if options.enable_metrics else None
+        self.telemetry_spool = (
+            self._create_telemetry_spool(options.telemetry_spool_dir)
+            if options.telemetry_spool_dir
+            else None
+        )
+        # Spooling writes to disk, and non-blocking evaluations must not wait on
+        # the telemetry request, so both send telemetry in the background
+        self.telemetry_worker = (
+            TelemetryWorker(
+                self._send_telemetry,
+                options.telemetry_queue_size,
+                on_drop=self._record_dropped_telemetry,
+            )
+            if options.background_telemetry
+            or options.non_blocking_evaluation
+            or self.telemetry_spool is not None
+            else None
+        )
+        if self.metrics is not None:
+            self._register_cache_gauges(self.metrics)
+            if self.limiter is not None:
+                self._register_limiter_gauges(self.metrics)
+            if self.telemetry_worker is not None:
+                self.metrics.register_gauge(
+                    "hyphen_telemetry_queue_depth",
+                    lambda: self.telemetry_worker.queue.qsize(),
+                )
+        register_fork_handler(self)
+
+    def _after_fork_in_child(self) -> None:
+        """Reset connections, locks and worker threads inherited from the parent.
+
+        Pooled connections would otherwise be shared with the parent, and
+        threads do not survive a fork.
+        """
+        self.transport.close()
+        self.cache._after_fork_in_child()
+        if self.change_tracker is not None:
+            self.change_tracker._after_fork_in_child()
+        if self.metrics is not None:
+            self.metrics._after_fork_in_child()
+        if self.telemetry_worker is not None:
+            self.telemetry_worker._after_fork_in_child()
+        if self.telemetry_spool is not None:
+            self.telemetry_spool._after_fork_in_child()
+        if self.limiter is not None:
+            self.limiter._after_fork_in_child()
+        if self.background_fetcher is not None:
+            self.background_fetcher._after_fork_in_child()
+        self._stale_lock = threading.Lock()
+
+    def _create_telemetry_spool(self, directory: str) -> TelemetrySpool:
+        """Create the spool buffering telemetry that could not be sent."""
+        options = self.options
+        return TelemetrySpool(
+            directory,
+            self._post_telemetry,
+            max_bytes=options.telemetry_spool_max_bytes,
+            segment_bytes=options.telemetry_spool_segment_bytes,
+            retry_seconds=options.telemetry_spool_retry_seconds,
+            max_backoff_seconds=options.telemetry_spool_max_backoff_seconds,
+            on_replay=lambda count: self._record_telemetry(count, "replayed"),
+            on_evict=lambda count: self._record_telemetry(count, "dropped"),
+        )
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session with a connection pool mounted per Horizon URL."""
+        session = requests.Session()
+        session.headers.update(self.headers)
+        for base_url in self.horizon_urls:
+            session.mount(base_url.rstrip("/") + "/", self._create_adapter(base_url))
+        return session
+
+    def _create_adapter(self, base_url: str) -> BaseAdapter:
+        """Create the transport adapter used for requests to a Horizon URL."""
+        options = self.options
+        if options.http_adapter_factory is not None:
+            return options.http_adapter_factory(base_url)
+        pool_maxsize = (options.http_pool_maxsize_by_url or {}).get(
+            base_url, options.http_pool_maxsize or 10
+        )
+        return HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=pool_maxsize,
+            max_retries=options.http_max_retries,
+            pool_block=options.http_pool_block,
+        )
+
+    def prewarm_connections(self, timeout: float = 5.0) -> None:
+        """Open a connection to every Horizon URL ahead of the first evaluation.
+
+        This moves DNS, TCP and TLS setup out of the first evaluations.
+
+        Args:
+            timeout: Maximum time in seconds to wait for each URL
+        """
+
+        def warm(base_url: str) -> None:
+            try:
+                self.transport.prewarm(base_url, timeout)
+            except Exception as error:
+                logger.debug("Error pre-warming connection to %s: %s", base_url, error)
+
+        threads = [
+            threading.Thread(target=warm, args=(base_url,), daemon=True)
+            for base_url in self.horizon_urls
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout)
+        self._last_request_at = time.monotonic()
+
+    def _close_idle_connections(self) -> None:
+        """Drop pooled connections that have been idle longer than the idle timeout.
+
+        Servers and load balancers close idle keep-alive connections, so reusing
+        them after a quiet period fails and forces a failover to the next URL.
+        """
+        now = time.monotonic()
+        if now - self._last_request_at > self.idle_timeout_seconds:
+            self.transport.close()
+        self._last_request_at = now
+
+    def _register_limiter_gauges(self, metrics: Metrics) -> None:
+        """Expose the concurrency limit and requests in flight."""
+        metrics.register_gauge(
+            "hyphen_concurrency_limit", lambda: int(self.limiter.limit)
         )
-        self.session = requests.Session()
-        self.session.headers.update(
-            {"Content-Type": "application/json", "x-api-key": public_key}
+        metrics.register_gauge(
+            "hyphen_requests_in_flight", lambda: self.limiter.in_flight
+        )
+
+    def _register_cache_gauges(self, metrics: Metrics) -> None:
+        """Expose the cache tier counters through the metrics registry."""
+        tiers = [("l1", self.cache.l1_stats)]
+        if self.cache.l2 is not None:
+            tiers.append(("l2", self.cache.l2_stats))
+        for tier, stats in tiers:
+            for field in ("hits", "misses", "errors", "latency_seconds"):
+                metrics.register_gauge(
+                    f"hyphen_cache_{field}",
+                    lambda stats=stats, field=field: getattr(stats, field),
+                    tier=tier,
+                )
+        metrics.register_gauge(
+            "hyphen_cache_negative_hits", lambda: self.cache.negative_hits
+        )
+
+    def _record_request(
+        self, url_path: str, base_url: str, outcome: str, start: float
+    ) -> None:
+        """Record the outcome and duration of a request attempt."""
+        if self.metrics is None:
+            return
+        self.metrics.inc(
+            "hyphen_http_requests_total",
+            endpoint=url_path,
+            url=base_url,
+            outcome=outcome,
         )
+        self.metrics.observe(
+            "hyphen_http_request_duration_seconds",
+            time.perf_counter() - start,
+            endpoint=url_path,
+        )
+
+    def _encode_payload(self, payload: Dict) -> Tuple[Any, Dict[str, str]]:
+        """Encode and compress the payload when request compression is enabled.
+
+        Returns:
+            The payload or encoded body to send, and the request headers
+        """
+        if self.compression is None:
+            return payload, self.headers
+        body = json.dumps(payload, separators=(",", ":")).encode()
+        if len(body) < self.options.request_compression_min_bytes:
+            return body, self.headers
+        return compress_body(body, self.compression), self._compressed_headers
+
+    def _start_request(self, span: Any, url_path: str, body: Any) -> None:
+        """Annotate the request span and drop idle connections before a request."""
+        if self.tracer is not None:
+            span.set_attributes(
+                {
+                    "hyphen.endpoint": url_path,
+                    "hyphen.payload_size": len(
+                        body if isinstance(body, bytes) else json.dumps(body)
+                    ),
+                }
+            )
+        if self.idle_timeout_seconds is not None:
+            self._close_idle_connections()
+
+    def _start_attempt(self, url_path: str, attempt: int) -> float:
+        """Record a failover to the next URL and return the attempt start time."""
+        if attempt and self.metrics is not None:
+            self.metrics.inc("hyphen_failovers_total", endpoint=url_path)
+        return time.perf_counter()
 
-    def _try_urls(self, url_path: str, payload: Dict) -> requests.Response:
+    def _annotate_success(
+        self, span: Any, base_url: str, attempt: int, response: Any
+    ) -> None:
+        """Annotate the request span with the URL that answered."""
+        if self.tracer is not None:
+            span.set_attributes(
+                {
+                    "hyphen.url": base_url,
+                    "hyphen.retry_count": attempt,
+                    "http.status_code": response.status_code,
+                }
+            )
+
+    def _try_urls(self, url_path: str, payload: Dict) -> Any:
         """Try to make a request to each URL until one succeeds.
 
         Args:
@@ -50,19 +365,134 @@ class HyphenClient:
         Raises:
             Exception: If all URLs fail
         """
-        last_error = None
+        with start_span(self.tracer, "hyphen.request") as span:
+            body, headers = self._encode_payload(payload)
+            self._start_request(span, url_path, body)
+            last_error = None
 
-        for base_url in self.horizon_urls:
-            try:
-                url = build_url(base_url, url_path)
-                response = self.session.post(url, json=payload)
-                response.raise_for_status()
+            for attempt, base_url in enumerate(self.horizon_urls):
+                start = self._start_attempt(url_path, attempt)
+                try:
+                    url = build_url(base_url, url_path)
+                    response = self.transport.post(url, body, headers)
+                    response.raise_for_status()
+                except Exception as error:
+                    last_error = error
+                    self._record_request(url_path, base_url, "error", start)
+                    continue
+                self._record_request(url_path, base_url, "success", start)
+                self._annotate_success(span, base_url, attempt, response)
+                return response
+
+            if self.tracer is not None:
+                span.set_attribute("hyphen.retry_count", len(self.horizon_urls) - 1)
+            raise last_error or Exception("Something went wrong")
+
+    async def _try_urls_async(self, url_path: str, payload: Dict) -> Any:
+        """Async variant of `_try_urls` sending requests with the async transport."""
+        with start_span(self.tracer, "hyphen.request") as span:
+            body, headers = self._encode_payload(payload)
+            self._start_request(span, url_path, body)
+            last_error = None
+
+            for attempt, base_url in enumerate(self.horizon_urls):
+                start = self._start_attempt(url_path, attempt)
+                try:
+                    url = build_url(base_url, url_path)
+                    response = await self.async_transport.post(url, body, headers)
+                    response.raise_for_status()
+                except Exception as error:
+                    last_error = error
+                    self._record_request(url_path, base_url, "error", start)
+                    continue
+                self._record_request(url_path, base_url, "success", start)
+                self._annotate_success(span, base_url, attempt, response)
                 return response
+
+            if self.tracer is not None:
+                span.set_attribute("hyphen.retry_count", len(self.horizon_urls) - 1)
+            raise last_error or Exception("Something went wrong")
+
+    def _get_cached(self, context: HyphenEvaluationContext) -> Any:
+        """Get a cached evaluation, re-raising a cached failure."""
+        cached_response = self.cache.get(context)
+        if isinstance(cached_response, CachedError):
+            raise cached_response.to_exception()
+        return cached_response
+
+    def _cache_response(
+        self, context: HyphenEvaluationContext, response_data: Any
+    ) -> EvaluationResponse:
+        """Parse an evaluate response and cache it."""
+        with profile_phase("decode"):
+            evaluation_response = parse_evaluation_response(response_data)
+
+        if evaluation_response:
+            evaluation_response = self.cache.set(context, evaluation_response)
+            if self.stale_responses is not None:
+                key = self.cache.generate_cache_key_fn(context)
+                with self._stale_lock:
+                    self.stale_responses[key] = evaluation_response
+            if self.change_tracker is not None:
+                self._detect_changes(context, evaluation_response)
+
+        return evaluation_response
+
+    def _detect_changes(
+        self, context: HyphenEvaluationContext, response: EvaluationResponse
+    ) -> None:
+        """Notify `on_flags_changed` of flags that changed since the last refresh.
+
+        Shared clients notify the listener of the context's partition instead.
+        """
+        key = self.cache.generate_cache_key_fn(context)
+        changed = self.change_tracker.update(key, response)
+        if not changed:
+            return
+        if self.metrics is not None:
+            self.metrics.inc("hyphen_flag_changes_total", len(changed))
+        listener = self.on_flags_changed
+        if self.shared:
+            listener = self.partition_listeners.get(context_partition(context))
+        if listener is not None:
+            try:
+                listener(changed)
             except Exception as error:
-                last_error = error
-                continue
+                logger.debug("Error notifying flag changes: %s", error)
+
+    def _fetch_evaluation(self, payload: Dict) -> Any:
+        """Post to the evaluate endpoint, within a limiter slot if enabled."""
+        if self.limiter is None:
+            return self._try_urls("/toggle/evaluate", payload)
+        with self.limiter.slot():
+            return self._try_urls("/toggle/evaluate", payload)
 
-        raise last_error or Exception("Something went wrong")
+    async def _fetch_evaluation_async(self, payload: Dict) -> Any:
+        """Async variant of `_fetch_evaluation`."""
+        if self.limiter is None:
+            return await self._try_urls_async("/toggle/evaluate", payload)
+        async with self.limiter.slot_async():
+            return await self._try_urls_async("/toggle/evaluate", payload)
+
+    def _get_stale(
+        self, context: HyphenEvaluationContext
+    ) -> Optional[EvaluationResponse]:
+        """Get the last known response of a context, even if it expired."""
+        key = self.cache.generate_cache_key_fn(context)
+        with self._stale_lock:
+            return self.stale_responses.get(key)
+
+    def _fall_back(
+        self, context: HyphenEvaluationContext, error: ConcurrencyLimitExceeded
+    ) -> EvaluationResponse:
+        """Serve the last known response of a context turned away by the limiter."""
+        stale = self._get_stale(context)
+        if self.metrics is not None:
+            fallback = "none" if stale is None else "stale"
+            self.metrics.inc("hyphen_limiter_rejections_total", fallback=fallback)
+        if stale is None:
+            raise error
+        return stale
 
     def evaluate(self, context: HyphenEvaluationContext) -> EvaluationResponse:
         """Evaluate feature flags for the given context.
@@ -75,7 +505,7 @@ class HyphenClient:
             The evaluation response containing flag values
         """
         # Check cache first
-        cached_response = self.cache.get(context)
+        cached_response = self._get_cached(context)
         if cached_response:
             return cached_response
 
@@ -83,38 +513,182 @@ class HyphenClient:
         payload = prepare_evaluate_payload(context)
 
         # Make API request
-        response = self._try_urls("/toggle/evaluate", payload)
-        response_data = response.json()
-
-        # Convert raw response to EvaluationResponse
-        toggles = {}
-        for key, value in response_data.get("toggles", {}).items():
-            toggles[key] = Evaluation(
-                key=key,
-                value=value.get("value"),
-                type=value.get("type"),
-                reason=value.get("reason"),
-                error_message=value.get("errorMessage"),
-                variant=value.get("variant"),
-            )
+        try:
+            with profile_phase("network"):
+                response = self._fetch_evaluation(payload)
+            with profile_phase("decode"):
+                response_data = response.json()
+        except ConcurrencyLimitExceeded as error:
+            return self._fall_back(context, error)
+        except Exception as error:
+            self.cache.set_error(context, error)
+            raise
 
-        evaluation_response = EvaluationResponse(toggles=toggles)
+        return self._cache_response(context, response_data)
 
-        # Cache the response
-        if evaluation_response:
-            self.cache.set(context, evaluation_response)
+    def evaluate_nowait(
+        self, context: HyphenEvaluationContext
+    ) -> Tuple[Optional[EvaluationResponse], bool]:
+        """Evaluate feature flags from the in-process cache without any I/O.
 
-        return evaluation_response
+        On a miss, the evaluation is fetched into the cache in the background,
+        so a later call for the context gets it.
+
+        Args:
+            context: The evaluation context
+
+        Returns:
+            The cached response and True, or on a miss or a cached failure the
+            last known response (None if there is none) and False
+
+        Raises:
+            Exception: The cached failure of a context without a last known response
+        """
+        cached_response = self.cache.get(context, local_only=True)
+        if isinstance(cached_response, CachedError):
+            stale = self._get_stale(context)
+            if stale is None:
+                raise cached_response.to_exception()
+            return stale, False
+        if cached_response:
+            return cached_response, True
+        stale = self._get_stale(context)
+        self.background_fetcher.schedule(context)
+        return stale, False
+
+    def refresh(self, context: HyphenEvaluationContext) -> EvaluationResponse:
+        """Fetch the evaluation for the context and update the cache.
+
+        Unlike `evaluate`, cached values are ignored and failures are not cached,
+        so a failed refresh leaves the current cache entry in place.
+
+        Args:
+            context: The evaluation context
+
+        Returns:
+            The evaluation response containing flag values
+        """
+        response = self._fetch_evaluation(prepare_evaluate_payload(context))
+        return self._cache_response(context, response.json())
+
+    async def evaluate_async(
+        self, context: HyphenEvaluationContext
+    ) -> EvaluationResponse:
+        """Evaluate feature flags for the given context without blocking the event loop.
+
+        Args:
+            context: The evaluation context
+
+        Returns:
+            The evaluation response containing flag values
+        """
+        cached_response = self._get_cached(context)
+        if cached_response:
+            return cached_response
+
+        payload = prepare_evaluate_payload(context)
+
+        try:
+            with profile_phase("network"):
+                response = await self._fetch_evaluation_async(payload)
+            with profile_phase("decode"):
+                response_data = response.json()
+        except ConcurrencyLimitExceeded as error:
+            return self._fall_back(context, error)
+        except Exception as error:
+            self.cache.set_error(context, error)
+            raise
+
+        return self._cache_response(context, response_data)
 
     def post_telemetry(self, payload: TelemetryPayload) -> None:
         """Send telemetry data to the API.
 
+        With `background_telemetry` enabled the payload is queued and sent from
+        a background thread instead.
+
         Args:
             payload: The telemetry payload to send
         """
-        try:
-            telemetry_payload = payload.__dict__.copy()
-            telemetry_payload = transform_dict_keys(telemetry_payload)
+        if self.telemetry_worker is not None:
+            self.telemetry_worker.submit(payload)
+        else:
+            self._send_telemetry(payload)
+
+    def _post_telemetry(self, telemetry_payload: Dict[str, Any]) -> None:
+        """Post a transformed telemetry payload, raising when it fails."""
+        with start_span(self.tracer, "hyphen.telemetry"):
             self._try_urls("/toggle/telemetry", telemetry_payload)
+
+    def _send_telemetry(self, payload: TelemetryPayload) -> None:
+        """Send telemetry data to the API now.
+
+        When it fails and a spool is configured, the payload is spooled to be
+        replayed later.
+        """
+        telemetry_payload = transform_dict_keys(payload.__dict__.copy())
+        try:
+            self._post_telemetry(telemetry_payload)
+            outcome = "sent"
         except Exception as e:
             logger.debug("Error sending telemetry: %s", e)
+            outcome = "failed"
+            if self.telemetry_spool is not None:
+                try:
+                    self.telemetry_spool.append(telemetry_payload)
+                    outcome = "spooled"
+                except OSError as error:
+                    logger.warning("Unable to spool telemetry: %s", error)
+        self._record_telemetry(1, outcome)
+
+    def _record_telemetry(self, count: int, outcome: str) -> None:
+        if self.metrics is not None:
+            self.metrics.inc("hyphen_telemetry_events_total", count, outcome=outcome)
+
+    async def post_telemetry_async(self, payload: TelemetryPayload) -> None:
+        """Send telemetry data to the API without blocking the event loop.
+
+        Args:
+            payload: The telemetry payload to send
+        """
+        with start_span(self.tracer, "hyphen.telemetry"):
+            try:
+                telemetry_payload = transform_dict_keys(payload.__dict__.copy())
+                await self._try_urls_async("/toggle/telemetry", telemetry_payload)
+                outcome = "sent"
+            except Exception as e:
+                logger.debug("Error sending telemetry: %s", e)
+                outcome = "failed"
+        if self.metrics is not None:
+            self.metrics.inc("hyphen_telemetry_events_total", outcome=outcome)
+
+    def _record_dropped_telemetry(self) -> None:
+        if self.metrics is not None:
+            self.metrics.inc("hyphen_telemetry_events_total", outcome="dropped")
+
+    def close(self, timeout: float = 5.0) -> bool:
+        """Send queued telemetry and close pooled connections.
+
+        Args:
+            timeout: Maximum time in seconds to wait for queued telemetry and
+                the telemetry spool, in total
+
+        Returns:
+            Whether all queued telemetry was sent in time
+        """
+        deadline = time.monotonic() + timeout
+        drained = True
+        if self.telemetry_worker is not None:
+            drained = self.telemetry_worker.close(timeout)
+            if not drained:
+                logger.warning(
+                    "%d queued telemetry events were not sent within the shutdown "
+                    "timeout and are still in flight",
+                    self.telemetry_worker.pending(),
+                )
+        if self.background_fetcher is not None:
+            self.background_fetcher.close()
+        if self.telemetry_spool is not None:
+            self.telemetry_spool.close(max(0.0, deadline - time.monotonic()))
+        self.transport.close()
+        return drained
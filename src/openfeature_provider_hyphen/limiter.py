@@ -0,0 +1,174 @@
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Dict, Iterator
+
+
+class ConcurrencyLimitExceeded(Exception):
+    """Raised when no request slot became free within the queue timeout."""
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits concurrent requests to Horizon, adapting the limit with AIMD.
+
+    The limit grows by about one for every `limit` requests that succeed
+    within `latency_threshold_seconds`, and is multiplied by `backoff_ratio`
+    when a request fails or is slower. Callers wait for a slot in a bounded
+    queue for at most `queue_timeout_seconds`; when the queue is full or the
+    timeout expires, `ConcurrencyLimitExceeded` is raised so they can fall
+    back without piling onto an overloaded endpoint.
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 20,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        max_queue_size: int = 50,
+        queue_timeout_seconds: float = 0.05,
+        latency_threshold_seconds: float = 1.0,
+        backoff_ratio: float = 0.9,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Number of concurrent requests allowed at first
+            min_limit: Lowest limit the backoff can reach
+            max_limit: Highest limit the increases can reach
+            max_queue_size: Maximum number of callers waiting for a slot
+            queue_timeout_seconds: Maximum time a caller waits for a slot
+            latency_threshold_seconds: Latency above which a request counts as a drop
+            backoff_ratio: Factor applied to the limit on every drop
+        """
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = float(min(max(initial_limit, min_limit), max_limit))
+        self.max_queue_size = max_queue_size
+        self.queue_timeout_seconds = queue_timeout_seconds
+        self.latency_threshold_seconds = latency_threshold_seconds
+        self.backoff_ratio = backoff_ratio
+        self.in_flight = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._condition = threading.Condition()
+
+    def _after_fork_in_child(self) -> None:
+        # Requests in flight belong to the parent's threads
+        self._condition = threading.Condition()
+        self.in_flight = 0
+        self.waiting = 0
+
+    def _has_slot(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    def acquire(self) -> None:
+        """Take a request slot, waiting in the queue if none is free.
+
+        Raises:
+            ConcurrencyLimitExceeded: If the queue is full or no slot became
+                free within `queue_timeout_seconds`
+        """
+        with self._condition:
+            if not self._has_slot():
+                if self.waiting >= self.max_queue_size:
+                    self.rejected += 1
+                    raise ConcurrencyLimitExceeded("Request queue is full")
+                self.waiting += 1
+                try:
+                    acquired = self._condition.wait_for(
+                        self._has_slot, self.queue_timeout_seconds
+                    )
+                finally:
+                    self.waiting -= 1
+                if not acquired:
+                    self.rejected += 1
+                    raise ConcurrencyLimitExceeded("Timed out waiting for a slot")
+            self.in_flight += 1
+
+    def try_acquire(self) -> bool:
+        """Take a request slot if one is free, without waiting.
+
+        Returns:
+            Whether a slot was taken
+        """
+        with self._condition:
+            if not self._has_slot():
+                return False
+            self.in_flight += 1
+            return True
+
+    def _return_unused_slot(self, acquired: Any) -> None:
+        # Frees a slot taken for a cancelled caller, leaving the limit unchanged
+        if acquired.cancelled() or acquired.exception() is not None:
+            return
+        with self._condition:
+            self.in_flight -= 1
+            if self.waiting:
+                self._condition.notify()
+
+    def release(self, latency_seconds: float, dropped: bool = False) -> None:
+        """Free a request slot and adapt the limit to the request's outcome.
+
+        Args:
+            latency_seconds: How long the request took
+            dropped: Whether the request failed
+        """
+        with self._condition:
+            self.in_flight -= 1
+            if dropped or latency_seconds > self.latency_threshold_seconds:
+                self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+            free = int(self.limit) - self.in_flight
+            if free > 0 and self.waiting:
+                self._condition.notify(free)
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a request slot for the duration of the block.
+
+        The request counts as dropped if the block raises.
+        """
+        self.acquire()
+        start = time.perf_counter()
+        dropped = True
+        try:
+            yield
+            dropped = False
+        finally:
+            self.release(time.perf_counter() - start, dropped)
+
+    @asynccontextmanager
+    async def slot_async(self) -> AsyncIterator[None]:
+        """Async variant of `slot` that does not block the event loop.
+
+        When no slot is free, waiting for one runs in the loop's default
+        executor, for at most `queue_timeout_seconds`.
+        """
+        if not self.try_acquire():
+            import asyncio
+
+            future = asyncio.get_running_loop().run_in_executor(None, self.acquire)
+            try:
+                await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # The slot may still be taken after the caller gave up on it
+                future.add_done_callback(self._return_unused_slot)
+                raise
+        start = time.perf_counter()
+        dropped = True
+        try:
+            yield
+            dropped = False
+        finally:
+            self.release(time.perf_counter() - start, dropped)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get the current limit, requests in flight and waiting, and rejections."""
+        with self._condition:
+            return {
+                "limit": int(self.limit),
+                "in_flight": self.in_flight,
+                "waiting": self.waiting,
+                "rejected": self.rejected,
+            }
@@ -0,0 +1,234 @@
+import bisect
+import threading
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+"""Default histogram buckets in seconds, from 100µs (cache hits) to 5s."""
+
+
+class Histogram:
+    """Fixed-bucket histogram of observed values."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative = []
+        total = 0
+        for bound, count in zip(self.buckets, self.counts):
+            total += count
+            cumulative.append((bound, total))
+        return {"count": self.count, "sum": self.sum, "buckets": cumulative}
+
+
+class Metrics:
+    """In-process counters, histograms and gauges for the provider.
+
+    Metric names follow Prometheus conventions. Collection is disabled unless
+    `enable_metrics` is set on the provider options, in which case the hot paths
+    only pay for a lock and a dictionary update per recorded value.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters: Dict[str, Dict[Labels, float]] = {}
+        self.histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self.gauges: Dict[str, Dict[Labels, Callable[[], float]]] = {}
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, amount: float = 1, **labels: str) -> None:
+        """Increment a counter.
+
+        Args:
+            name: The counter name
+            amount: The amount to add
+            labels: Label values for the counter
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.counters.setdefault(name, {})
+            series[key] = series.get(key, 0) + amount
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Record a value in a histogram.
+
+        Args:
+            name: The histogram name
+            value: The observed value, in seconds for durations
+            labels: Label values for the histogram
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram()
+            histogram.observe(value)
+
+    def register_gauge(self, name: str, fn: Callable[[], float], **labels: str) -> None:
+        """Register a gauge whose value is read when metrics are collected.
+
+        Args:
+            name: The gauge name
+            fn: Function returning the current value
+            labels: Label values for the gauge
+        """
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self.gauges.setdefault(name, {})[key] = fn
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get a point-in-time copy of all metrics."""
+        with self._lock:
+            counters = {
+                name: [
+                    {"labels": dict(labels), "value": value}
+                    for labels, value in series.items()
+                ]
+                for name, series in self.counters.items()
+            }
+            histograms = {
+                name: [
+                    {"labels": dict(labels), **histogram.snapshot()}
+                    for labels, histogram in series.items()
+                ]
+                for name, series in self.histograms.items()
+            }
+            gauge_fns = {
+                name: list(series.items()) for name, series in self.gauges.items()
+            }
+        gauges = {
+            name: [{"labels": dict(labels), "value": fn()} for labels, fn in series]
+            for name, series in gauge_fns.items()
+        }
+        return {"counters": counters, "histograms": histograms, "gauges": gauges}
+
+    def to_prometheus(self) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+
+        for kind in ("counters", "gauges"):
+            for name, series in sorted(snapshot[kind].items()):
+                lines.append(f"# TYPE {name} {kind[:-1]}")
+                for sample in series:
+                    lines.append(
+                        f"{name}{_format_labels(sample['labels'])} {sample['value']}"
+                    )
+
+        for name, series in sorted(snapshot["histograms"].items()):
+            lines.append(f"# TYPE {name} histogram")
+            for sample in series:
+                labels = sample["labels"]
+                for bound, count in sample["buckets"]:
+                    bucket_labels = _format_labels({**labels, "le": repr(bound)})
+                    lines.append(f"{name}_bucket{bucket_labels} {count}")
+                inf_labels = _format_labels({**labels, "le": "+Inf"})
+                lines.append(f"{name}_bucket{inf_labels} {sample['count']}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {sample['sum']}")
+                lines.append(f"{name}_count{_format_labels(labels)} {sample['count']}")
+
+        return "\n".join(lines) + "\n"
+
+    def register_opentelemetry(self, meter: Any) -> None:
+        """Expose counters and gauges as OpenTelemetry observable instruments.
+
+        Requires the `opentelemetry-api` package. Histograms are exported as
+        observable counters of their count and sum.
+
+        Args:
+            meter: An OpenTelemetry `Meter`
+        """
+        from opentelemetry.metrics import Observation
+
+        def counter_callback(name: str):
+            def callback(options):
+                with self._lock:
+                    series = list(self.counters.get(name, {}).items())
+                return [Observation(value, dict(labels)) for labels, value in series]
+
+            return callback
+
+        def histogram_callback(name: str, field: str):
+            def callback(options):
+                with self._lock:
+                    series = list(self.histograms.get(name, {}).items())
+                return [
+                    Observation(getattr(histogram, field), dict(labels))
+                    for labels, histogram in series
+                ]
+
+            return callback
+
+        def gauge_callback(name: str):
+            def callback(options):
+                with self._lock:
+                    series = list(self.gauges.get(name, {}).items())
+                return [Observation(fn(), dict(labels)) for labels, fn in series]
+
+            return callback
+
+        for name in METRIC_NAMES["counters"]:
+            meter.create_observable_counter(name, callbacks=[counter_callback(name)])
+        for name in METRIC_NAMES["histograms"]:
+            for field in ("count", "sum"):
+                meter.create_observable_counter(
+                    f"{name}_{field}", callbacks=[histogram_callback(name, field)]
+                )
+        for name in list(self.gauges):
+            meter.create_observable_gauge(name, callbacks=[gauge_callback(name)])
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for key, value in sorted(labels.items())
+    )
+    return "{" + pairs + "}"
+
+
+METRIC_NAMES = {
+    "counters": (
+        "hyphen_evaluations_total",
+        "hyphen_http_requests_total",
+        "hyphen_failovers_total",
+        "hyphen_telemetry_events_total",
+        "hyphen_flag_changes_total",
+        "hyphen_limiter_rejections_total",
+    ),
+    "histograms": (
+        "hyphen_evaluation_duration_seconds",
+        "hyphen_http_request_duration_seconds",
+    ),
+}
+"""Metrics recorded by the provider, used to register OpenTelemetry instruments."""
@@ -0,0 +1,69 @@
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, Optional
+
+from openfeature.evaluation_context import EvaluationContext
+
+if TYPE_CHECKING:
+    from .provider import HyphenProvider
+
+
+class WSGIPinningMiddleware:
+    """WSGI middleware pinning the evaluation of each request's context.
+
+    Flags evaluated while the application handles the request read the pinned
+    response (see `HyphenProvider.pin`). Flags evaluated while a streamed
+    response body is iterated, after the application returned, are not pinned.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        provider: "HyphenProvider",
+        get_context: Callable[[Dict[str, Any]], Optional[EvaluationContext]],
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The WSGI application
+            provider: The provider whose evaluations are pinned
+            get_context: Function building the evaluation context of a WSGI environ
+        """
+        self.app = app
+        self.provider = provider
+        self.get_context = get_context
+
+    def __call__(self, environ: Dict[str, Any], start_response: Callable) -> Iterable:
+        with self.provider.pin(self.get_context(environ)):
+            return self.app(environ, start_response)
+
+
+class ASGIPinningMiddleware:
+    """ASGI middleware pinning the evaluation of each HTTP request's context.
+
+    The evaluation is fetched without blocking the event loop (see
+    `HyphenProvider.pin_async`). Other scopes, such as lifespan, are passed
+    through.
+    """
+
+    def __init__(
+        self,
+        app: Callable,
+        provider: "HyphenProvider",
+        get_context: Callable[[Dict[str, Any]], Optional[EvaluationContext]],
+    ):
+        """Initialize the middleware.
+
+        Args:
+            app: The ASGI application
+            provider: The provider whose evaluations are pinned
+            get_context: Function building the evaluation context of an ASGI scope
+        """
+        self.app = app
+        self.provider = provider
+        self.get_context = get_context
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable):
+        if scope.get("type") not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        async with self.provider.pin_async(self.get_context(scope)):
+            await self.app(scope, receive, send)
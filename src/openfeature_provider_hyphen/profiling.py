@@ -0,0 +1,150 @@
+import functools
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import (Any, Callable, ContextManager, Dict, Iterator, List,
+                    Optional)
+
+_current_profile: ContextVar[Optional["EvaluationProfile"]] = ContextVar(
+    "hyphen_current_profile", default=None
+)
+_last_profile: ContextVar[Optional["EvaluationProfile"]] = ContextVar(
+    "hyphen_last_profile", default=None
+)
+
+_NOOP_PHASE = nullcontext()
+
+
+class EvaluationProfile:
+    """Per-phase timings of a single flag evaluation."""
+
+    __slots__ = ("flag_key", "targeting_key", "timestamp", "total_seconds", "phases")
+
+    def __init__(self, flag_key: str):
+        self.flag_key = flag_key
+        self.targeting_key: Optional[str] = None
+        self.timestamp = time.time()
+        self.total_seconds = 0.0
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        """Add time spent in a phase. Repeated phases (e.g. retries) accumulate."""
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "flag_key": self.flag_key,
+            "targeting_key": self.targeting_key,
+            "timestamp": self.timestamp,
+            "total_ms": self.total_seconds * 1000,
+            "phases_ms": {name: value * 1000 for name, value in self.phases.items()},
+        }
+
+
+class _Phase:
+    __slots__ = ("profile", "name", "start")
+
+    def __init__(self, profile: EvaluationProfile, name: str):
+        self.profile = profile
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.profile.add(self.name, time.perf_counter() - self.start)
+
+
+def current_profile() -> Optional[EvaluationProfile]:
+    """Get the profile of the evaluation running in this context, if any."""
+    return _current_profile.get()
+
+
+def profile_phase(name: str) -> ContextManager[None]:
+    """Time a phase of the evaluation running in this context.
+
+    Returns a shared no-op context manager when profiling is disabled.
+
+    Args:
+        name: The phase name, e.g. `cache_lookup` or `network`
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        return _NOOP_PHASE
+    return _Phase(profile, name)
+
+
+@contextmanager
+def profile_hook() -> Iterator[None]:
+    """Time provider hooks and add them to the evaluation that just finished.
+
+    Hooks run after the provider has resolved the flag, so their time is
+    attributed to the last profile recorded in this context.
+    """
+    profile = _last_profile.get()
+    if profile is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        profile.add("hooks", elapsed)
+        profile.total_seconds += elapsed
+
+
+class Profiler:
+    """Ring buffer of per-phase timings for recent evaluations."""
+
+    def __init__(self, buffer_size: int = 1000):
+        """Initialize the profiler.
+
+        Args:
+            buffer_size: Number of most recent evaluations to keep
+        """
+        self.profiles: deque = deque(maxlen=buffer_size)
+
+    @contextmanager
+    def profile(self, flag_key: str) -> Iterator[EvaluationProfile]:
+        """Record the phases of an evaluation run inside this block.
+
+        Args:
+            flag_key: The key of the flag being evaluated
+        """
+        profile = EvaluationProfile(flag_key)
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            yield profile
+        finally:
+            profile.total_seconds = time.perf_counter() - start
+            _current_profile.reset(token)
+            _last_profile.set(profile)
+            self.profiles.append(profile)
+
+    def dump(self, clear: bool = False) -> List[Dict[str, Any]]:
+        """Get the recorded profiles, oldest first.
+
+        Args:
+            clear: Whether to empty the buffer afterwards
+        """
+        profiles = list(self.profiles)
+        if clear:
+            self.profiles.clear()
+        return [profile.to_dict() for profile in profiles]
+
+
+def profiled(method: Callable) -> Callable:
+    """Profile a provider `resolve_*_details` method when profiling is enabled."""
+
+    @functools.wraps(method)
+    def wrapper(self, flag_key: str, *args: Any, **kwargs: Any) -> Any:
+        profiler = self.profiler
+        if profiler is None:
+            return method(self, flag_key, *args, **kwargs)
+        with profiler.profile(flag_key):
+            return method(self, flag_key, *args, **kwargs)
+
+    return wrapper
@@ -1,17 +1,41 @@
+import copy
+import gc
 import json
+import logging
 import re
-from typing import Any, Dict, List, Optional, Union
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar, Token
+from typing import (TYPE_CHECKING, Any, AsyncIterator, Dict, Iterator, List,
+                    Mapping, Optional, Sequence, Tuple, Union)
 
 from openfeature.evaluation_context import EvaluationContext
+from openfeature.event import ProviderEventDetails
 from openfeature.exception import (ErrorCode, FlagNotFoundError, GeneralError,
                                    TypeMismatchError)
 from openfeature.flag_evaluation import FlagResolutionDetails, Reason
 from openfeature.hook import Hook
 from openfeature.provider import AbstractProvider, Metadata
 
+from .fork import register_fork_handler
 from .hooks import TelemetryHook
-from .hyphen_client import HyphenClient
-from .types import HyphenEvaluationContext, HyphenProviderOptions
+from .profiling import Profiler, current_profile, profile_phase, profiled
+from .sampling import TelemetrySampler
+from .tracing import start_span
+from .types import (CACHE_MISS_REASON, STALE_REASON, EvaluationResponse,
+                    HyphenEvaluationContext, HyphenProviderOptions)
+from .utils import resolve_client_options
+
+if TYPE_CHECKING:
+    from .bulk import BulkEvaluationResult
+    from .hyphen_client import HyphenClient
+    from .warming import CacheWarmer
+
+logger = logging.getLogger(__name__)
+
+# Targeting key, response and reason override of an evaluation pinned with `pin`
+Pinned = Tuple[str, EvaluationResponse, Optional[str]]
 
 
 class HyphenProvider(AbstractProvider):
@@ -27,7 +51,79 @@ class HyphenProvider(AbstractProvider):
         self._validate_options(options)
 
         self.options = options
-        self.hyphen_client = HyphenClient(public_key, options)
+        self.public_key = public_key
+        self.profiler = (
+            Profiler(options.profiling_buffer_size)
+            if options.enable_profiling
+            else None
+        )
+        self.telemetry_sampler = TelemetrySampler(
+            options.telemetry_sample_rate, options.telemetry_sample_rates_by_flag
+        )
+        self._hyphen_client: Optional["HyphenClient"] = None
+        self._warmer: Optional["CacheWarmer"] = None
+        self._setup_lock = threading.Lock()
+        self._pinned: ContextVar[Optional[Pinned]] = ContextVar(
+            f"hyphen_pinned_{id(self)}", default=None
+        )
+        register_fork_handler(self)
+
+    def _after_fork_in_child(self) -> None:
+        self._setup_lock = threading.Lock()
+        if self._warmer is not None:
+            self._warmer._after_fork_in_child()
+
+    @property
+    def hyphen_client(self) -> "HyphenClient":
+        """The client for the Hyphen API, created on first use.
+
+        Creating it imports the HTTP stack and sets up the session and cache, so
+        this is deferred until the first evaluation (or `initialize`).
+        """
+        client = self._hyphen_client
+        if client is None:
+            with self._setup_lock:
+                if self._hyphen_client is None:
+                    self._hyphen_client = self._create_client()
+                client = self._hyphen_client
+        return client
+
+    def _create_client(self) -> "HyphenClient":
+        """Create the client, or acquire the shared one with `share_client`."""
+        if self.options.share_client:
+            from .registry import shared_clients
+
+            client = shared_clients.acquire(self.public_key, self.options)
+            if self.options.notify_flag_changes:
+                partition = (self.options.application, self.options.environment)
+                client.partition_listeners[partition] = self._emit_flags_changed
+            return client
+
+        from .hyphen_client import HyphenClient
+
+        client = HyphenClient(self.public_key, self.options)
+        if self.options.notify_flag_changes:
+            client.on_flags_changed = self._emit_flags_changed
+        return client
+
+    @property
+    def warmer(self) -> "CacheWarmer":
+        """The cache warmer, created on first use."""
+        warmer = self._warmer
+        if warmer is None:
+            from .warming import CacheWarmer
+
+            client = self.hyphen_client
+            with self._setup_lock:
+                if self._warmer is None:
+                    self._warmer = CacheWarmer(
+                        client.refresh,
+                        client.cache.generate_cache_key_fn,
+                        max_workers=self.options.warm_max_workers,
+                        interval_seconds=self.options.rewarm_interval_seconds,
+                    )
+                warmer = self._warmer
+        return warmer
 
     def _validate_options(self, options: HyphenProviderOptions):
         """Validate the provider options."""
@@ -38,6 +134,9 @@ class HyphenProvider(AbstractProvider):
 
         self._validate_environment_format(options.environment)
 
+        # The client is only created on the first evaluation
+        resolve_client_options(options)
+
     def _validate_environment_format(self, environment: str):
         """Validate the environment identifier format."""
         is_environment_id = environment.startswith("pevr_")
@@ -52,6 +151,119 @@ class HyphenProvider(AbstractProvider):
                 'and not containing the word "environments").'
             )
 
+    def initialize(self, evaluation_context: EvaluationContext) -> None:
+        """Prepare the provider when it is registered with OpenFeature."""
+        if self.options.prewarm_connections:
+            self.hyphen_client.prewarm_connections()
+        if self.options.prefetch_contexts:
+            contexts = self.options.prefetch_contexts
+            warmed = self.warm(contexts)
+            if warmed < len(contexts):
+                logger.warning(
+                    "Unable to prefetch evaluations for %d of %d contexts",
+                    len(contexts) - warmed,
+                    len(contexts),
+                )
+
+    def _emit_flags_changed(self, flag_keys: List[str]) -> None:
+        """Emit a configuration changed event for flags that changed on refresh."""
+        self.emit_provider_configuration_changed(
+            ProviderEventDetails(flags_changed=flag_keys)
+        )
+
+    def warm(self, contexts: List[EvaluationContext]) -> int:
+        """Fetch and cache evaluations for known high-traffic contexts concurrently.
+
+        With `rewarm_interval_seconds` set, these contexts are also refreshed in
+        the background so they never see a cache miss.
+
+        Args:
+            contexts: The evaluation contexts to warm
+
+        Returns:
+            The number of contexts warmed successfully
+        """
+        return self.warmer.warm(
+            [self._prepare_context(context) for context in contexts]
+        )
+
+    def evaluate_bulk(
+        self,
+        flag_key: str,
+        default_value: Any,
+        targeting_keys: Sequence[Any],
+        ip_addresses: Optional[Sequence[Any]] = None,
+        custom_attributes: Optional[Mapping[str, Sequence[Any]]] = None,
+    ) -> "BulkEvaluationResult":
+        """Evaluate a flag for many users held in columns.
+
+        Columns can be lists, NumPy arrays, pandas Series or Arrow arrays of the
+        same length, one row per user. Rows with identical targeting key and
+        attributes are evaluated once, and distinct contexts are evaluated
+        concurrently (up to `warm_max_workers`). Hooks and telemetry are skipped.
+
+        Args:
+            flag_key: The flag to evaluate
+            default_value: The value of rows whose evaluation fails; its type
+                selects the flag type and the type of the result array
+            targeting_keys: The targeting key of each row
+            ip_addresses: Optional IP address of each row
+            custom_attributes: Optional custom attribute columns, keyed by name
+
+        Returns:
+            The values in row order, as a typed array for boolean and numeric flags
+        """
+        from .bulk import evaluate_columns
+
+        return evaluate_columns(
+            self,
+            flag_key,
+            default_value,
+            targeting_keys,
+            ip_addresses=ip_addresses,
+            custom_attributes=custom_attributes,
+            max_workers=self.options.warm_max_workers,
+        )
+
+    def prepare_for_fork(self, freeze_gc: bool = True) -> None:
+        """Prepare a pre-fork server master to fork workers that share its cache.
+
+        Call this in the master after warming the cache (see `warm`) and before
+        workers are forked. Pooled connections are closed so no socket is
+        shared with the workers; each worker opens its own on first use.
+        Freezing the garbage collector keeps the cached objects from being
+        copied into every worker when the collector scans them.
+
+        Args:
+            freeze_gc: Whether to move all current objects to the permanent
+                garbage collector generation with `gc.freeze()`
+        """
+        if self._hyphen_client is not None:
+            self._hyphen_client.transport.close()
+        if freeze_gc and hasattr(gc, "freeze"):
+            gc.collect()
+            gc.freeze()
+
+    def shutdown(self) -> None:
+        """Send queued telemetry and close connections within `shutdown_timeout_seconds`."""
+        deadline = time.monotonic() + self.options.shutdown_timeout_seconds
+        if self._warmer is not None:
+            self._warmer.stop(self.options.shutdown_timeout_seconds)
+        client = self._hyphen_client
+        if client is None:
+            return
+        timeout = max(0.0, deadline - time.monotonic())
+        if self.options.share_client:
+            from .registry import shared_clients
+
+            partition = (self.options.application, self.options.environment)
+            if client.partition_listeners.get(partition) == self._emit_flags_changed:
+                del client.partition_listeners[partition]
+            shared_clients.release(client, timeout)
+            self._hyphen_client = None
+        else:
+            client.close(timeout)
+
     def get_metadata(self) -> Metadata:
         """Get provider metadata."""
         return Metadata(name="hyphen-toggle-python")
@@ -102,6 +314,28 @@ class HyphenProvider(AbstractProvider):
         """Create an error resolution for wrong type."""
         raise TypeMismatchError()
 
+    def stats(self) -> Dict[str, Any]:
+        """Get a snapshot of cache statistics and, if enabled, performance metrics."""
+        stats: Dict[str, Any] = {"cache": self.hyphen_client.cache.stats()}
+        if self.hyphen_client.limiter is not None:
+            stats["limiter"] = self.hyphen_client.limiter.stats()
+        if self.hyphen_client.metrics is not None:
+            stats["metrics"] = self.hyphen_client.metrics.snapshot()
+        return stats
+
+    def dump_profiles(self, clear: bool = False) -> List[Dict[str, Any]]:
+        """Get per-phase timings of recent evaluations when profiling is enabled.
+
+        Args:
+            clear: Whether to empty the profile buffer afterwards
+
+        Returns:
+            The recorded profiles, oldest first
+        """
+        if self.profiler is None:
+            return []
+        return self.profiler.dump(clear)
+
     def _get_evaluation(
         self,
         flag_key: str,
@@ -110,8 +344,142 @@ class HyphenProvider(AbstractProvider):
         default_value: Any,
     ) -> FlagResolutionDetails:
         """Get flag evaluation from the client."""
+        metrics = self.hyphen_client.metrics
+        tracer = self.options.tracer
+        attributes = (
+            {"feature_flag.key": flag_key, "hyphen.flag_type": expected_type}
+            if tracer is not None
+            else None
+        )
+
+        with start_span(tracer, "hyphen.evaluate", attributes):
+            if metrics is None:
+                return self._evaluate(flag_key, context, expected_type, default_value)
+
+            start = time.perf_counter()
+            outcome = "error"
+            try:
+                details = self._evaluate(
+                    flag_key, context, expected_type, default_value
+                )
+                outcome = "success"
+                return details
+            finally:
+                metrics.observe(
+                    "hyphen_evaluation_duration_seconds", time.perf_counter() - start
+                )
+                metrics.inc("hyphen_evaluations_total", outcome=outcome)
+
+    def _fetch_response(
+        self, context: HyphenEvaluationContext
+    ) -> Tuple[Optional[EvaluationResponse], Optional[str]]:
+        """Get the evaluation response of a prepared context.
+
+        Returns:
+            The response, None on a non-blocking cache miss, and the reason
+            overriding the evaluation reasons if any
+        """
+        if not self.options.non_blocking_evaluation:
+            return self.hyphen_client.evaluate(context), None
+        response, fresh = self.hyphen_client.evaluate_nowait(context)
+        if response is None:
+            return None, CACHE_MISS_REASON
+        return response, None if fresh else STALE_REASON
+
+    def _pin(
+        self,
+        context: HyphenEvaluationContext,
+        response: Optional[EvaluationResponse],
+        reason: Optional[str],
+    ) -> Optional[Token]:
+        if response is None:
+            return None
+        return self._pinned.set((context.targeting_key, response, reason))
+
+    @contextmanager
+    def pin(
+        self, context: Optional[EvaluationContext] = None
+    ) -> Iterator[Optional[EvaluationResponse]]:
+        """Pin the evaluation of a context for the duration of the block.
+
+        Evaluations in the block, in the current thread or asyncio task, whose
+        context has the same targeting key (or none) read the pinned response
+        instead of preparing the context and looking it up in the cache. Their
+        values stay consistent even if the cache is refreshed meanwhile. Use it
+        around the handling of a web request.
+
+        Args:
+            context: The evaluation context of the request
+
+        Yields:
+            The pinned response, or None when it could not be fetched (or on a
+            non-blocking cache miss), in which case nothing is pinned
+        """
+        prepared_context = self._prepare_context(context)
+        try:
+            response, reason = self._fetch_response(prepared_context)
+        except Exception as error:
+            logger.debug("Unable to pin evaluation: %s", error)
+            response, reason = None, None
+        token = self._pin(prepared_context, response, reason)
+        try:
+            yield response
+        finally:
+            if token is not None:
+                self._pinned.reset(token)
+
+    @asynccontextmanager
+    async def pin_async(
+        self, context: Optional[EvaluationContext] = None
+    ) -> AsyncIterator[Optional[EvaluationResponse]]:
+        """Like `pin`, without blocking the event loop on a cache miss.
+
+        Args:
+            context: The evaluation context of the request
+
+        Yields:
+            The pinned response, or None when nothing is pinned
+        """
         prepared_context = self._prepare_context(context)
-        response = self.hyphen_client.evaluate(prepared_context)
+        response, reason = None, None
+        try:
+            if self.options.non_blocking_evaluation:
+                response, reason = self._fetch_response(prepared_context)
+            else:
+                response = await self.hyphen_client.evaluate_async(prepared_context)
+        except Exception as error:
+            logger.debug("Unable to pin evaluation: %s", error)
+        token = self._pin(prepared_context, response, reason)
+        try:
+            yield response
+        finally:
+            if token is not None:
+                self._pinned.reset(token)
+
+    def _evaluate(
+        self,
+        flag_key: str,
+        context: Optional[EvaluationContext],
+        expected_type: str,
+        default_value: Any,
+    ) -> FlagResolutionDetails:
+        """Evaluate a flag for the context."""
+        pinned = self._pinned.get()
+        if pinned is not None and (
+            context is None
+            or not context.targeting_key
+            or context.targeting_key == pinned[0]
+        ):
+            _, response, reason = pinned
+        else:
+            with profile_phase("context_prep"):
+                prepared_context = self._prepare_context(context)
+            profile = current_profile()
+            if profile is not None:
+                profile.targeting_key = prepared_context.targeting_key
+            response, reason = self._fetch_response(prepared_context)
+        if response is None:
+            return FlagResolutionDetails(value=default_value, reason=CACHE_MISS_REASON)
         evaluation = response.toggles.get(flag_key)
 
         if evaluation is None:
@@ -126,10 +494,11 @@ class HyphenProvider(AbstractProvider):
         return FlagResolutionDetails(
             value=evaluation.value,
             variant=str(evaluation.value),
-            reason=evaluation.reason or Reason.TARGETING_MATCH,
+            reason=reason or evaluation.reason or Reason.TARGETING_MATCH,
             flag_metadata={"type": evaluation.type},
         )
 
+    @profiled
     def resolve_boolean_details(
         self,
         flag_key: str,
@@ -140,20 +509,25 @@ class HyphenProvider(AbstractProvider):
         evaluation = self._get_evaluation(flag_key, context, "boolean", default_value)
 
         # Handle the value based on its type
-        if isinstance(evaluation.value, bool):
-            value = evaluation.value
-        elif isinstance(evaluation.value, str):
-            value = evaluation.value.lower() == "true"
-        else:
-            value = bool(evaluation.value)
-
+        with profile_phase("type_coercion"):
+            if isinstance(evaluation.value, bool):
+                value = evaluation.value
+            elif isinstance(evaluation.value, str):
+                value = evaluation.value.lower() == "true"
+            else:
+                value = bool(evaluation.value)
+
+        reason = evaluation.reason
+        if reason not in (STALE_REASON, CACHE_MISS_REASON):
+            reason = Reason.TARGETING_MATCH
         return FlagResolutionDetails(
             value=value,
             variant=str(value),
-            reason=Reason.TARGETING_MATCH,
+            reason=reason,
             flag_metadata={"type": "boolean"},
         )
 
+    @profiled
     def resolve_string_details(
         self,
         flag_key: str,
@@ -163,6 +537,7 @@ class HyphenProvider(AbstractProvider):
         """Resolve string flag values."""
         return self._get_evaluation(flag_key, context, "string", default_value)
 
+    @profiled
     def resolve_integer_details(
         self,
         flag_key: str,
@@ -171,9 +546,11 @@ class HyphenProvider(AbstractProvider):
     ) -> FlagResolutionDetails[int]:
         """Resolve integer flag values."""
         details = self._get_evaluation(flag_key, context, "number", default_value)
-        details.value = int(details.value)
+        with profile_phase("type_coercion"):
+            details.value = int(details.value)
         return details
 
+    @profiled
     def resolve_float_details(
         self,
         flag_key: str,
@@ -183,9 +560,11 @@ class HyphenProvider(AbstractProvider):
         """Resolve float flag values."""
 
         details = self._get_evaluation(flag_key, context, "number", default_value)
-        details.value = float(details.value)
+        with profile_phase("type_coercion"):
+            details.value = float(details.value)
         return details
 
+    @profiled
     def resolve_object_details(
         self,
         flag_key: str,
@@ -195,8 +574,13 @@ class HyphenProvider(AbstractProvider):
         """Resolve object flag values."""
         details = self._get_evaluation(flag_key, context, "object", default_value)
         try:
-            if isinstance(details.value, str):
-                details.value = json.loads(details.value)
+            with profile_phase("type_coercion"):
+                if isinstance(details.value, str):
+                    details.value = json.loads(details.value)
+                else:
+                    # Cached values are shared with later evaluations (and, when
+                    # interning, other contexts), so callers get their own copy
+                    details.value = copy.deepcopy(details.value)
             return details
         except (json.JSONDecodeError, TypeError):
             return FlagResolutionDetails(
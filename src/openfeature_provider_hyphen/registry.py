@@ -0,0 +1,158 @@
+import logging
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .fork import register_fork_handler
+from .types import HyphenProviderOptions
+
+if TYPE_CHECKING:
+    from .hyphen_client import HyphenClient
+
+logger = logging.getLogger(__name__)
+
+RegistryKey = Tuple[str, Tuple[str, ...]]
+
+# Options read by the client, which only take effect for the provider creating it
+CLIENT_OPTIONS = (
+    "transport",
+    "async_transport",
+    "http_adapter_factory",
+    "http_pool_maxsize",
+    "http_pool_maxsize_by_url",
+    "http_pool_block",
+    "http_max_retries",
+    "http_idle_timeout_seconds",
+    "request_compression",
+    "request_compression_min_bytes",
+    "cache_ttl_seconds",
+    "cache_l1_max_size",
+    "cache_l1_ttl_seconds",
+    "cache_backend",
+    "cache_intern_responses",
+    "generate_cache_key_fn",
+    "cache_key_include_attributes",
+    "cache_key_exclude_attributes",
+    "negative_cache_ttl_seconds",
+    "adaptive_cache_ttl",
+    "cache_min_ttl_seconds",
+    "cache_max_ttl_seconds",
+    "notify_flag_changes",
+    "enable_metrics",
+    "tracer",
+    "background_telemetry",
+    "telemetry_queue_size",
+    "telemetry_spool_dir",
+    "telemetry_spool_max_bytes",
+    "telemetry_spool_segment_bytes",
+    "telemetry_spool_retry_seconds",
+    "telemetry_spool_max_backoff_seconds",
+    "adaptive_concurrency",
+    "concurrency_initial_limit",
+    "concurrency_max_limit",
+    "concurrency_queue_size",
+    "concurrency_queue_timeout_seconds",
+    "concurrency_latency_threshold_seconds",
+    "non_blocking_evaluation",
+    "background_fetch_max_pending",
+    "warm_max_workers",
+)
+
+
+def differing_options(
+    options: HyphenProviderOptions, other: HyphenProviderOptions
+) -> List[str]:
+    """Get the names of the client options that differ between two providers."""
+    return [
+        name
+        for name in CLIENT_OPTIONS
+        if getattr(options, name) != getattr(other, name)
+    ]
+
+
+class ClientRegistry:
+    """Shares one `HyphenClient` between providers using the same Horizon endpoints.
+
+    Clients are keyed by public key and Horizon URLs. The first provider to
+    acquire a key creates its client with its own options; providers for other
+    applications and environments reuse it, and with it its connection pools,
+    background workers and cache. The cache is partitioned by application and
+    environment, and its size limits apply to all partitions together. A client
+    is closed when the last provider using it releases it. Client options of
+    later providers that differ from the first one's are logged and ignored.
+    """
+
+    def __init__(self):
+        self.clients: Dict[RegistryKey, "HyphenClient"] = {}
+        self.references: Dict[RegistryKey, int] = {}
+        self._lock = threading.Lock()
+        register_fork_handler(self)
+
+    def _after_fork_in_child(self) -> None:
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(public_key: str, options: HyphenProviderOptions) -> RegistryKey:
+        """The key of the client shared by providers with these options."""
+        return public_key, tuple(options.horizon_urls or ())
+
+    def acquire(
+        self, public_key: str, options: HyphenProviderOptions
+    ) -> "HyphenClient":
+        """Get the shared client for a provider, creating it if needed.
+
+        Args:
+            public_key: The public API key for authentication
+            options: The provider options, used if the client is created
+
+        Returns:
+            The shared client
+        """
+        key = self.key(public_key, options)
+        with self._lock:
+            client = self.clients.get(key)
+            if client is None:
+                from .hyphen_client import HyphenClient
+
+                client = HyphenClient(public_key, options, shared=True)
+                self.clients[key] = client
+            else:
+                ignored = differing_options(client.options, options)
+                if ignored:
+                    logger.warning(
+                        "Reusing the shared client created with other options "
+                        "for %s/%s, ignoring: %s",
+                        options.application,
+                        options.environment,
+                        ", ".join(ignored),
+                    )
+            self.references[key] = self.references.get(key, 0) + 1
+            return client
+
+    def release(self, client: "HyphenClient", timeout: float = 5.0) -> Optional[bool]:
+        """Release a provider's reference to a shared client.
+
+        Args:
+            client: The client returned by `acquire`
+            timeout: Maximum time in seconds to wait for queued telemetry when
+                the client is closed
+
+        Returns:
+            Whether all queued telemetry was sent when this was the last
+            reference and the client was closed, None otherwise
+        """
+        with self._lock:
+            for key, shared in self.clients.items():
+                if shared is client:
+                    break
+            else:
+                return None
+            self.references[key] -= 1
+            if self.references[key] > 0:
+                return None
+            del self.clients[key]
+            del self.references[key]
+        return client.close(timeout)
+
+
+shared_clients = ClientRegistry()
+"""The registry used by providers created with `share_client=True`."""
@@ -0,0 +1,67 @@
+from typing import Dict, Optional
+
+_HASH_SPACE = float(1 << 64)
+
+
+def sample_position(targeting_key: str) -> float:
+    """Map a targeting key to a stable position in [0, 1).
+
+    The position only depends on the key, so it is the same in every process
+    and across restarts.
+    """
+    import hashlib
+
+    digest = hashlib.blake2b(targeting_key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big") / _HASH_SPACE
+
+
+def _validate_rate(rate: float, name: str) -> None:
+    if not 0.0 <= rate <= 1.0:
+        raise ValueError(f"{name} must be between 0 and 1, got {rate}")
+
+
+class TelemetrySampler:
+    """Decides which evaluations are reported as telemetry.
+
+    Sampling is deterministic on the targeting key: a user is reported when its
+    position is below the flag's sample rate, so the same user is consistently
+    in or out, and a user sampled at a lower rate is also sampled at any higher
+    one.
+    """
+
+    def __init__(
+        self, rate: float = 1.0, rates_by_flag: Optional[Dict[str, float]] = None
+    ):
+        """Initialize the sampler.
+
+        Args:
+            rate: Fraction of targeting keys reported, between 0 and 1
+            rates_by_flag: Per-flag overrides of `rate`, keyed by flag key
+        """
+        _validate_rate(rate, "telemetry_sample_rate")
+        for flag_key, flag_rate in (rates_by_flag or {}).items():
+            _validate_rate(flag_rate, f"telemetry_sample_rates_by_flag[{flag_key!r}]")
+        self.rate = rate
+        self.rates_by_flag = dict(rates_by_flag or {})
+
+    def rate_for(self, flag_key: str) -> float:
+        """The sample rate of a flag."""
+        return self.rates_by_flag.get(flag_key, self.rate)
+
+    def sample_weight(self, flag_key: str, targeting_key: str) -> Optional[float]:
+        """Decide whether an evaluation is reported.
+
+        Args:
+            flag_key: The evaluated flag
+            targeting_key: The targeting key of the evaluation context
+
+        Returns:
+            None when the evaluation is sampled out, otherwise the number of
+            evaluations the reported event stands for (the inverse of the rate)
+        """
+        rate = self.rate_for(flag_key)
+        if rate >= 1.0:
+            return 1.0
+        if rate <= 0.0 or sample_position(targeting_key) >= rate:
+            return None
+        return 1.0 / rate
@@ -0,0 +1,276 @@
+import json
+import logging
+import os
+import threading
+import time
+from typing import IO, Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_SEGMENT_SUFFIX = ".ndjson"
+_CLAIMED_SUFFIX = ".sending"
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        # os.kill terminates the process on Windows. Renaming a segment that is
+        # still open fails there instead, which leaves it to its writer.
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+class TelemetrySpool:
+    """Bounded on-disk buffer for telemetry that could not be sent.
+
+    Records are appended as NDJSON to segment files of at most `segment_bytes`.
+    Once the spool holds more than `max_bytes`, the oldest segments are
+    deleted. A background thread replays segments oldest first, backing off
+    exponentially while the endpoint keeps failing.
+
+    Segment names carry the writing process id, and segments are claimed by
+    renaming them before they are replayed, so processes forked from the same
+    parent can share a directory.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        send: Callable[[Dict[str, Any]], None],
+        max_bytes: int = 64 * 1024 * 1024,
+        segment_bytes: int = 1024 * 1024,
+        retry_seconds: float = 5.0,
+        max_backoff_seconds: float = 300.0,
+        on_replay: Optional[Callable[[int], None]] = None,
+        on_evict: Optional[Callable[[int], None]] = None,
+    ):
+        """Initialize the spool.
+
+        Args:
+            directory: Directory holding the segment files, created if missing
+            send: Function sending a single record, raising when it fails
+            max_bytes: Maximum total size of the segments
+            segment_bytes: Size after which a new segment is started
+            retry_seconds: Delay between replays, and the initial backoff
+            max_backoff_seconds: Maximum delay between replays while sends fail
+            on_replay: Called with the number of records replayed from a segment
+            on_evict: Called with the number of records deleted to stay under `max_bytes`
+        """
+        self.directory = directory
+        self.send = send
+        self.max_bytes = max_bytes
+        self.segment_bytes = segment_bytes
+        self.retry_seconds = retry_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self.on_replay = on_replay
+        self.on_evict = on_evict
+        self.evicted = 0
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._file: Optional[IO[str]] = None
+        self._path: Optional[str] = None
+        self._recover_claimed()
+        if self.pending_segments():
+            self.start()
+
+    def _recover_claimed(self) -> None:
+        # Segments claimed by a process that died mid-replay are released
+        for name in os.listdir(self.directory):
+            if not name.endswith(_CLAIMED_SUFFIX):
+                continue
+            segment, _, pid = name[: -len(_CLAIMED_SUFFIX)].rpartition(".")
+            if pid.isdigit() and not _pid_alive(int(pid)):
+                try:
+                    os.replace(
+                        os.path.join(self.directory, name),
+                        os.path.join(self.directory, segment),
+                    )
+                except OSError:
+                    pass
+
+    def _new_segment_path(self) -> str:
+        name = f"telemetry-{time.time_ns():020d}-{os.getpid()}{_SEGMENT_SUFFIX}"
+        return os.path.join(self.directory, name)
+
+    def _close_segment(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._path = None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append a record to the current segment and schedule a replay."""
+        line = json.dumps(record, separators=(",", ":"), default=str) + "\n"
+        with self._lock:
+            if self._file is None:
+                self._path = self._new_segment_path()
+                self._file = open(self._path, "a", encoding="utf-8")
+            self._file.write(line)
+            self._file.flush()
+            if self._file.tell() >= self.segment_bytes:
+                self._close_segment()
+                self._enforce_max_bytes()
+        self.start()
+
+    def _segment_sizes(self) -> List[Tuple[str, int]]:
+        sizes = []
+        for name in sorted(os.listdir(self.directory)):
+            path = os.path.join(self.directory, name)
+            if name.endswith(_SEGMENT_SUFFIX) or name.endswith(_CLAIMED_SUFFIX):
+                try:
+                    sizes.append((path, os.path.getsize(path)))
+                except OSError:
+                    pass
+        return sizes
+
+    def _enforce_max_bytes(self) -> None:
+        sizes = self._segment_sizes()
+        total = sum(size for _, size in sizes)
+        for path, size in sizes:
+            if total <= self.max_bytes:
+                return
+            if path == self._path or not path.endswith(_SEGMENT_SUFFIX):
+                continue
+            try:
+                with open(path, encoding="utf-8") as segment:
+                    records = sum(1 for _ in segment)
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.evicted += records
+            if self.on_evict is not None:
+                self.on_evict(records)
+            logger.warning("Telemetry spool is full, deleted %d records", records)
+
+    def pending_segments(self) -> List[str]:
+        """Paths of the segments waiting to be replayed, oldest first.
+
+        Segments of other live processes are left to them, as they may still
+        be writing to them, and so is the segment this spool is writing to.
+        """
+        own_pid = os.getpid()
+        segments = []
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(_SEGMENT_SUFFIX):
+                continue
+            pid = name[: -len(_SEGMENT_SUFFIX)].rpartition("-")[2]
+            if pid.isdigit() and int(pid) != own_pid and _pid_alive(int(pid)):
+                continue
+            path = os.path.join(self.directory, name)
+            if path != self._path:
+                segments.append(path)
+        return segments
+
+    def _replay_segment(self, path: str) -> bool:
+        claimed = f"{path}.{os.getpid()}{_CLAIMED_SUFFIX}"
+        try:
+            os.replace(path, claimed)
+        except OSError:
+            # Claimed by another process
+            return True
+        with open(claimed, encoding="utf-8") as segment:
+            lines = segment.readlines()
+        sent = 0
+        try:
+            for line in lines:
+                if line.strip():
+                    self.send(json.loads(line))
+                sent += 1
+        except Exception as error:
+            logger.debug("Error replaying spooled telemetry: %s", error)
+            with open(claimed, "w", encoding="utf-8") as segment:
+                segment.writelines(lines[sent:])
+            os.replace(claimed, path)
+            return False
+        finally:
+            if sent and self.on_replay is not None:
+                self.on_replay(sent)
+        os.remove(claimed)
+        return True
+
+    def replay(self) -> bool:
+        """Send the spooled records, oldest first.
+
+        Returns:
+            Whether every record was sent; replaying stops at the first failure
+        """
+        # Listed under the lock, so a concurrent append opens a new segment that
+        # is left for the next replay instead of being claimed while written
+        with self._lock:
+            self._close_segment()
+            segments = self.pending_segments()
+        for path in segments:
+            if not self._replay_segment(path):
+                return False
+        return True
+
+    def _run(self) -> None:
+        delay = self.retry_seconds
+        while True:
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                return
+            try:
+                succeeded = self.replay()
+            except Exception as error:
+                logger.debug("Error replaying spooled telemetry: %s", error)
+                succeeded = False
+            if succeeded:
+                delay = self.retry_seconds
+                with self._lock:
+                    if self._file is None and not self.pending_segments():
+                        self._thread = None
+                        return
+            else:
+                delay = min(delay * 2, self.max_backoff_seconds)
+
+    def start(self) -> None:
+        """Start the replay thread, if not already running."""
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="hyphen-telemetry-spool", daemon=True
+            )
+            self._thread.start()
+
+    def _after_fork_in_child(self) -> None:
+        # The parent keeps writing and replaying its own segments
+        running = self._thread is not None and not self._stop.is_set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self._file = None
+        self._path = None
+        if running:
+            self.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop the replay thread and close the current segment.
+
+        Spooled records stay on disk and are replayed by the next spool using
+        the same directory.
+
+        Args:
+            timeout: Maximum time in seconds to wait for a running replay
+        """
+        self._stop.set()
+        self._wakeup.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._lock:
+            self._close_segment()
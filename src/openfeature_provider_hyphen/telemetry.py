@@ -0,0 +1,108 @@
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Optional
+
+from .types import TelemetryPayload
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class TelemetryWorker:
+    """Sends telemetry from a background thread so evaluations do not wait on it.
+
+    Payloads are queued and sent in order by a single daemon thread, started
+    on the first submitted payload. When the queue is full, new payloads are
+    dropped instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[TelemetryPayload], None],
+        max_queue_size: int = 1000,
+        on_drop: Optional[Callable[[], None]] = None,
+    ):
+        """Initialize the worker.
+
+        Args:
+            send: Function sending a single payload
+            max_queue_size: Maximum number of payloads waiting to be sent
+            on_drop: Called for every payload dropped because the queue is full
+        """
+        self.send = send
+        self.on_drop = on_drop
+        self.queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self.dropped = 0
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="hyphen-telemetry", daemon=True
+                )
+                self._thread.start()
+
+    def _after_fork_in_child(self) -> None:
+        # Queued events belong to the parent, which still sends them
+        self.queue = queue.Queue(maxsize=self.queue.maxsize)
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def _run(self) -> None:
+        events = self.queue
+        while True:
+            payload = events.get()
+            try:
+                if payload is _STOP:
+                    return
+                self.send(payload)
+            except Exception as error:
+                logger.debug("Error sending telemetry: %s", error)
+            finally:
+                events.task_done()
+
+    def submit(self, payload: TelemetryPayload) -> None:
+        """Queue a payload to be sent."""
+        if self._closed:
+            return
+        self._ensure_started()
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            self.dropped += 1
+            if self.on_drop is not None:
+                self.on_drop()
+
+    def pending(self) -> int:
+        """The number of queued payloads not sent yet."""
+        with self.queue.mutex:
+            return sum(payload is not _STOP for payload in self.queue.queue)
+
+    def close(self, timeout: float) -> bool:
+        """Send the queued payloads and stop the worker thread.
+
+        Args:
+            timeout: Maximum time in seconds to wait for the queue to drain
+
+        Returns:
+            Whether all queued payloads were sent in time
+        """
+        self._closed = True
+        thread = self._thread
+        if thread is None:
+            return True
+        deadline = time.monotonic() + timeout
+        try:
+            self.queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            return False
+        thread.join(max(0.0, deadline - time.monotonic()))
+        return not thread.is_alive()
@@ -0,0 +1,37 @@
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, Optional
+
+
+class _NoopSpan:
+    """Span used when tracing is not configured."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def set_attributes(self, attributes: Dict[str, Any]) -> None:
+        pass
+
+
+_NOOP_SPAN_CONTEXT = nullcontext(_NoopSpan())
+
+
+def start_span(
+    tracer: Optional[Any], name: str, attributes: Optional[Dict[str, Any]] = None
+) -> ContextManager[Any]:
+    """Start a span on the tracer, or return a no-op span if tracing is disabled.
+
+    The tracer is any object with an OpenTelemetry-compatible
+    `start_as_current_span` method, so nothing is imported unless the
+    application configures tracing itself.
+
+    Args:
+        tracer: The configured tracer, or None
+        name: The span name
+        attributes: Initial span attributes
+
+    Returns:
+        A context manager yielding the span
+    """
+    if tracer is None:
+        return _NOOP_SPAN_CONTEXT
+    return tracer.start_as_current_span(name, attributes=attributes)
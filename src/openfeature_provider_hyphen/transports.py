@@ -0,0 +1,213 @@
+import json
+from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from urllib.parse import urlparse
+
+import requests
+import urllib3
+
+from .utils import decompress_body
+
+Payload = Union[Dict, bytes]
+
+
+class TransportError(Exception):
+    """Raised when Horizon answers with an error status code."""
+
+    def __init__(self, url: str, status_code: int):
+        super().__init__(f"{status_code} error for url: {url}")
+        self.url = url
+        self.status_code = status_code
+
+
+@dataclass
+class TransportResponse:
+    """A response returned by a transport other than `RequestsTransport`."""
+
+    url: str
+    status_code: int
+    content: bytes = b""
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise TransportError(self.url, self.status_code)
+
+
+class Transport(ABC):
+    """Sends requests to Horizon for a `HyphenClient`.
+
+    The payload is either a dictionary to send as JSON, or an already encoded
+    (and possibly compressed, see the `Content-Encoding` header) JSON body.
+    Responses need `status_code`, `json()` and `raise_for_status()`, as provided
+    by both `requests.Response` and `TransportResponse`.
+    """
+
+    @abstractmethod
+    def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        """Send a JSON payload and return the response."""
+
+    def prewarm(self, url: str, timeout: float) -> None:
+        """Open a connection to the URL so the next request can reuse it."""
+
+    def close(self) -> None:
+        """Drop pooled connections. The transport stays usable."""
+
+
+class AsyncTransport(ABC):
+    """Sends requests to Horizon for the `*_async` methods of `HyphenClient`."""
+
+    @abstractmethod
+    async def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        """Send a JSON payload and return the response."""
+
+    async def close(self) -> None:
+        """Drop pooled connections. The transport stays usable."""
+
+
+class RequestsTransport(Transport):
+    """Transport backed by a `requests.Session`."""
+
+    def __init__(self, session: Optional[requests.Session] = None):
+        """Initialize the transport.
+
+        Args:
+            session: The session to send requests with
+        """
+        self.session = session or requests.Session()
+
+    def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        if isinstance(payload, bytes):
+            return self.session.post(url, data=payload, headers=headers)
+        return self.session.post(url, json=payload, headers=headers)
+
+    def prewarm(self, url: str, timeout: float) -> None:
+        self.session.head(url, timeout=timeout)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Transport backed by a `urllib3.PoolManager`.
+
+    Skips the per-request session and hook processing of `requests`, which
+    makes it the cheaper choice for high request rates. Compressed responses
+    are accepted and decoded.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 10,
+        block: bool = False,
+        retries: int = 0,
+        timeout: Optional[float] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            maxsize: Maximum pooled connections per host
+            block: Whether to wait for a free connection when the pool is exhausted
+            retries: Number of connection-level retries per request
+            timeout: Request timeout in seconds
+        """
+        self.timeout = timeout
+        self.headers = urllib3.make_headers(accept_encoding=True)
+        self.pool = urllib3.PoolManager(
+            maxsize=maxsize,
+            block=block,
+            retries=urllib3.Retry(total=retries, redirect=False, raise_on_status=False),
+        )
+
+    def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode()
+        response = self.pool.request(
+            "POST",
+            url,
+            body=payload,
+            headers={**self.headers, **headers},
+            timeout=self.timeout,
+        )
+        return TransportResponse(url, response.status, response.data)
+
+    def prewarm(self, url: str, timeout: float) -> None:
+        self.pool.request("HEAD", url, timeout=timeout)
+
+    def close(self) -> None:
+        self.pool.clear()
+
+
+@dataclass
+class RecordedRequest:
+    """A request received by an `InMemoryTransport`."""
+
+    url: str
+    payload: Dict
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+class InMemoryTransport(Transport):
+    """Transport answering requests in-process, for tests and benchmarks.
+
+    Responses are looked up by URL path. A handler can be given instead to
+    compute responses, or to raise errors to simulate an unreachable URL.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Dict[str, Any]] = None,
+        handler: Optional[Callable[[str, Dict], Tuple[int, Any]]] = None,
+    ):
+        """Initialize the transport.
+
+        Args:
+            responses: JSON bodies keyed by URL path, e.g. `/toggle/evaluate`
+            handler: Function returning a `(status_code, body)` tuple for a URL and payload
+        """
+        self.responses = responses or {}
+        self.handler = handler
+        self.requests: List[RecordedRequest] = []
+
+    def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        if isinstance(payload, bytes):
+            encoding = headers.get("Content-Encoding")
+            payload = json.loads(decompress_body(payload, encoding))
+        self.requests.append(RecordedRequest(url, payload, dict(headers)))
+        if self.handler is not None:
+            status_code, body = self.handler(url, payload)
+        else:
+            path = urlparse(url).path
+            status_code, body = (
+                (200, self.responses[path]) if path in self.responses else (404, {})
+            )
+        return TransportResponse(url, status_code, json.dumps(body).encode())
+
+
+class ThreadedAsyncTransport(AsyncTransport):
+    """Async transport running a synchronous transport in an executor."""
+
+    def __init__(self, transport: Transport, executor: Optional[Executor] = None):
+        """Initialize the transport.
+
+        Args:
+            transport: The synchronous transport to send requests with
+            executor: Executor to run requests in (default: the loop's default executor)
+        """
+        self.transport = transport
+        self.executor = executor
+
+    async def post(self, url: str, payload: Payload, headers: Dict[str, str]) -> Any:
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, self.transport.post, url, payload, headers
+        )
+
+    async def close(self) -> None:
+        self.transport.close()
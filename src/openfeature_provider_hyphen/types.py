@@ -1,8 +1,20 @@
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from openfeature.flag_evaluation import FlagEvaluationDetails, Reason
 
+if TYPE_CHECKING:
+    from requests.adapters import BaseAdapter
+
+    from .cache_backends import CacheBackend
+    from .transports import AsyncTransport, Transport
+
+
+STALE_REASON = "STALE"
+"""Reason of non-blocking evaluations served the last known value of an expired entry."""
+CACHE_MISS_REASON = "CACHE_MISS"
+"""Reason of non-blocking evaluations that returned the default value on a cache miss."""
+
 
 @dataclass
 class HyphenProviderOptions:
@@ -19,12 +31,190 @@ class HyphenProviderOptions:
     """
     horizon_urls: Optional[List[str]] = None
     """The Hyphen server URL"""
+    share_client: bool = False
+    """
+    Flag to share the client, connection pools, background workers and cache with
+    other providers using the same public key and Horizon URLs. The client is
+    configured by the options of the first of these providers; differing client
+    options of the others are logged and ignored.
+    """
     enable_toggle_usage: bool = True
     """Flag to enable toggle usage"""
+    background_telemetry: bool = False
+    """
+    Flag to send toggle usage telemetry from a background thread instead of
+    during the evaluation. Queued telemetry is sent on `shutdown()`.
+    """
+    telemetry_queue_size: int = 1000
+    """Maximum telemetry events waiting to be sent in the background; more are dropped."""
+    telemetry_spool_dir: Optional[str] = None
+    """
+    Directory where telemetry that could not be sent is buffered and replayed from
+    in the background. Setting it sends telemetry from a background thread.
+    """
+    telemetry_spool_max_bytes: int = 64 * 1024 * 1024
+    """Maximum size of the telemetry spool; the oldest events are deleted beyond it."""
+    telemetry_spool_segment_bytes: int = 1024 * 1024
+    """Size of each telemetry spool file."""
+    telemetry_spool_retry_seconds: float = 5.0
+    """Delay before replaying spooled telemetry, doubled after every failed replay."""
+    telemetry_spool_max_backoff_seconds: float = 300.0
+    """Maximum delay between replays of spooled telemetry while the endpoint is down."""
+    telemetry_sample_rate: float = 1.0
+    """
+    Fraction of targeting keys whose evaluations are reported as telemetry. Sampling
+    is deterministic, so a given user is consistently in or out.
+    """
+    telemetry_sample_rates_by_flag: Optional[Dict[str, float]] = None
+    """Per-flag overrides of `telemetry_sample_rate`, keyed by flag key."""
+    shutdown_timeout_seconds: float = 5.0
+    """Maximum time `shutdown()` waits for queued telemetry to be sent."""
+    prefetch_contexts: Optional[List[Any]] = None
+    """Evaluation contexts to evaluate and cache when the provider is initialized."""
+    warm_max_workers: int = 8
+    """Maximum number of concurrent requests when warming the cache."""
+    rewarm_interval_seconds: Optional[float] = None
+    """
+    Interval at which warmed contexts are refreshed in the background. Set it below
+    `cache_ttl_seconds` so warmed contexts never expire.
+    """
+    http_pool_maxsize: Optional[int] = None
+    """The number of connections kept open to each Horizon URL (default: 10)."""
+    http_pool_maxsize_by_url: Optional[Dict[str, int]] = None
+    """Per-URL overrides of `http_pool_maxsize`, keyed by Horizon URL."""
+    http_pool_block: bool = False
+    """
+    Flag to make requests wait for a free connection when the pool is exhausted,
+    instead of opening (and then discarding) extra connections.
+    """
+    http_max_retries: int = 0
+    """The number of connection-level retries for each Horizon URL."""
+    http_idle_timeout_seconds: Optional[float] = None
+    """
+    Pooled connections idle for longer than this are dropped before the next
+    request instead of being reused after the server may have closed them.
+    """
+    http_adapter_factory: Optional[Callable[[str], "BaseAdapter"]] = None
+    """
+    Function returning the `requests` transport adapter for a Horizon URL, e.g. an
+    HTTP/2-capable adapter. Overrides the pool options above.
+    """
+    non_blocking_evaluation: bool = False
+    """
+    Flag to never wait on the network when evaluating. A cache miss returns the last
+    known value of the context with reason `STALE`, or the default value with reason
+    `CACHE_MISS`, and fetches the evaluation into the cache in the background.
+    Telemetry is sent from a background thread, as with `background_telemetry`.
+    """
+    background_fetch_max_pending: int = 1000
+    """Maximum number of cache misses waiting to be fetched in the background."""
+    adaptive_concurrency: bool = False
+    """
+    Flag to limit concurrent evaluate requests with a limit adapted to observed
+    latency and failures. Evaluations that cannot get a slot in time fall back to
+    the last known response of their context, or fail so the default is used.
+    """
+    concurrency_initial_limit: int = 20
+    """The initial number of concurrent evaluate requests with `adaptive_concurrency`."""
+    concurrency_max_limit: int = 200
+    """The maximum number of concurrent evaluate requests with `adaptive_concurrency`."""
+    concurrency_queue_size: int = 50
+    """Maximum number of evaluations waiting for a request slot; more fall back at once."""
+    concurrency_queue_timeout_seconds: float = 0.05
+    """Maximum time an evaluation waits for a request slot before falling back."""
+    concurrency_latency_threshold_seconds: float = 1.0
+    """Request latency above which the concurrency limit is decreased."""
+    prewarm_connections: bool = False
+    """Flag to open connections to all Horizon URLs when the provider is initialized."""
+    transport: Optional["Transport"] = None
+    """
+    The transport used to send requests to Horizon, e.g. `Urllib3Transport()` or
+    `InMemoryTransport()` in tests. Defaults to `requests` with the pool options above.
+    """
+    async_transport: Optional["AsyncTransport"] = None
+    """
+    The transport used by the async client methods. Defaults to running `transport`
+    in the event loop's executor.
+    """
+    request_compression: Optional[str] = None
+    """
+    Compress request bodies with `gzip` or `zstd` (requires the `zstandard`
+    package). Compressed responses are always accepted.
+    """
+    request_compression_min_bytes: int = 1024
+    """Request bodies smaller than this are sent uncompressed."""
+    enable_metrics: bool = False
+    """
+    Flag to collect in-process performance metrics (evaluation latency, cache
+    stats, requests per endpoint, failovers). Read them with `provider.stats()`.
+    """
+    tracer: Optional[Any] = None
+    """
+    An OpenTelemetry tracer (e.g. `trace.get_tracer(__name__)`) used to create
+    spans for evaluations, cache lookups, HTTP requests and telemetry. Tracing is
+    disabled and nothing is imported when this is not set.
+    """
+    enable_profiling: bool = False
+    """
+    Flag to record a per-phase timing breakdown of each evaluation (context prep,
+    key generation, cache lookup, network, decode, type coercion, hooks). Read
+    them with `provider.dump_profiles()`. Intended for debugging.
+    """
+    profiling_buffer_size: int = 1000
+    """The number of most recent evaluation profiles to keep."""
     cache_ttl_seconds: Optional[int] = None
     """The time-to-live (TTL) in seconds for the cache."""
     generate_cache_key_fn: Optional[Callable[["HyphenEvaluationContext"], str]] = None
     """Generate a cache key function for the evaluation context."""
+    cache_key_include_attributes: Optional[List[str]] = None
+    """
+    Dot-separated context attribute paths that make up the cache key, such as
+    `targeting_key` or `custom_attributes.plan`. Other attributes are ignored.
+    """
+    cache_key_exclude_attributes: Optional[List[str]] = None
+    """
+    Dot-separated context attribute paths left out of the cache key, such as
+    `ip_address` or `custom_attributes.request_id`. Cannot be combined with
+    `cache_key_include_attributes`.
+    """
+    cache_backend: Optional["CacheBackend"] = None
+    """
+    Storage backend for cached evaluations. Defaults to an in-process cache.
+    Use `SqliteCacheBackend` to share one cache between worker processes.
+    """
+    cache_l1_max_size: Optional[int] = None
+    """The maximum number of entries in the in-process cache (default: 100)."""
+    cache_l1_ttl_seconds: Optional[int] = None
+    """
+    An optional shorter time-to-live in seconds for the in-process cache, so that
+    updates written to a shared `cache_backend` are picked up sooner.
+    """
+    cache_intern_responses: bool = True
+    """
+    Flag to deduplicate cached evaluation responses by content, so contexts with the
+    same flag outcomes share one response object.
+    """
+    adaptive_cache_ttl: bool = False
+    """
+    Flag to choose the TTL of each cache entry from its hit frequency and whether
+    refreshed responses changed, between `cache_min_ttl_seconds` and
+    `cache_max_ttl_seconds`.
+    """
+    cache_min_ttl_seconds: Optional[float] = None
+    """Lower bound for adaptive TTLs (default: a quarter of `cache_ttl_seconds`)."""
+    cache_max_ttl_seconds: Optional[float] = None
+    """Upper bound for adaptive TTLs (default: four times `cache_ttl_seconds`)."""
+    notify_flag_changes: bool = False
+    """
+    Flag to compare refreshed evaluations with the previous ones for the same
+    context and emit `PROVIDER_CONFIGURATION_CHANGED` events with the keys of
+    the flags that changed.
+    """
+    negative_cache_ttl_seconds: Optional[float] = None
+    """
+    The time-to-live in seconds for failed evaluations. When set, a context whose
+    evaluation failed is not retried over the network until the entry expires.
+    """
 
 
 @dataclass
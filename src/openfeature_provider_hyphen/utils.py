@@ -1,12 +1,15 @@
 import base64
+import gzip
+import json
 import re
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.flag_evaluation import FlagEvaluationDetails
 
-from .types import HyphenUser
+from .types import (Evaluation, EvaluationResponse, HyphenProviderOptions,
+                    HyphenUser)
 
 
 def to_camel_case(snake_str: str) -> str:
@@ -61,6 +64,55 @@ def prepare_telemetry_details(details: FlagEvaluationDetails) -> dict:
     }
 
 
+def parse_evaluation_response(data: Dict[str, Any]) -> EvaluationResponse:
+    """Build an EvaluationResponse from a raw evaluate response body.
+
+    Args:
+        data: The decoded JSON body returned by the evaluate endpoint
+
+    Returns:
+        The evaluation response containing flag values
+    """
+    toggles = {}
+    for key, value in data.get("toggles", {}).items():
+        toggles[key] = Evaluation(
+            key=key,
+            value=value.get("value"),
+            type=value.get("type"),
+            reason=value.get("reason"),
+            error_message=value.get("errorMessage"),
+            variant=value.get("variant"),
+        )
+    return EvaluationResponse(toggles=toggles)
+
+
+def serialize_evaluation_response(response: EvaluationResponse) -> Dict[str, Any]:
+    """Convert an EvaluationResponse back into the evaluate response body format.
+
+    This is the inverse of `parse_evaluation_response` and is used by cache
+    backends that store evaluations outside of the current process.
+
+    Args:
+        response: The evaluation response to convert
+
+    Returns:
+        A JSON-serializable dictionary
+    """
+    return {
+        "toggles": {
+            key: {
+                "key": evaluation.key,
+                "value": evaluation.value,
+                "type": evaluation.type,
+                "reason": evaluation.reason,
+                "errorMessage": evaluation.error_message,
+                "variant": evaluation.variant,
+            }
+            for key, evaluation in response.toggles.items()
+        }
+    }
+
+
 def transform_dict_keys(d: Dict[str, Any]) -> Dict[str, Any]:
     """Recursively transform all dictionary keys from snake_case to camelCase."""
     new_dict = {}
@@ -120,3 +172,93 @@ def build_url(base_url: str, path: str) -> str:
     # Reconstruct URL with new path
     parsed = parsed._replace(path=full_path)
     return parsed.geturl()
+
+
+def hashable_value(value: Any) -> Any:
+    """Get a hashable form of a flag value; object values become their sorted JSON."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, sort_keys=True, default=str)
+    return value
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    """Compress a request body.
+
+    Args:
+        body: The encoded request body
+        encoding: `gzip`, or `zstd` (requires the `zstandard` package)
+
+    Returns:
+        The compressed body
+    """
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    if encoding == "zstd":
+        return _zstandard().ZstdCompressor().compress(body)
+    raise ValueError(f"Unsupported compression: {encoding}")
+
+
+def decompress_body(body: bytes, encoding: Optional[str]) -> bytes:
+    """Decompress a body compressed with `compress_body`."""
+    if not encoding:
+        return body
+    if encoding == "gzip":
+        return gzip.decompress(body)
+    if encoding == "zstd":
+        return _zstandard().ZstdDecompressor().decompress(body)
+    raise ValueError(f"Unsupported compression: {encoding}")
+
+
+def _zstandard() -> Any:
+    try:
+        import zstandard
+    except ImportError as error:
+        raise ImportError(
+            "zstd compression requires the zstandard package: pip install zstandard"
+        ) from error
+    return zstandard
+
+
+def validate_cache_key_attributes(
+    include: Optional[Sequence[str]], exclude: Optional[Sequence[str]]
+) -> None:
+    """Check that cache key attributes are either included or excluded."""
+    if include and exclude:
+        raise ValueError(
+            "cache_key_include_attributes and cache_key_exclude_attributes "
+            "cannot be used together"
+        )
+
+
+def resolve_client_options(
+    options: HyphenProviderOptions,
+) -> Tuple[float, Optional[Tuple[float, float]]]:
+    """Validate the options used to set up the client and resolve its cache TTLs.
+
+    Args:
+        options: The provider options
+
+    Returns:
+        The cache TTL, and the lower and upper bounds of adaptive TTLs when
+        `adaptive_cache_ttl` is set
+
+    Raises:
+        ValueError: If the compression is unsupported, cache key attributes are
+            both included and excluded, or the adaptive TTL bounds are inverted
+        ImportError: If the package needed by the compression is missing
+    """
+    if options.request_compression is not None:
+        compress_body(b"", options.request_compression)
+    validate_cache_key_attributes(
+        options.cache_key_include_attributes, options.cache_key_exclude_attributes
+    )
+    ttl_seconds = options.cache_ttl_seconds or 30
+    if not options.adaptive_cache_ttl:
+        return ttl_seconds, None
+    min_ttl_seconds = options.cache_min_ttl_seconds or ttl_seconds / 4
+    max_ttl_seconds = options.cache_max_ttl_seconds or ttl_seconds * 4
+    if min_ttl_seconds > max_ttl_seconds:
+        raise ValueError(
+            "cache_min_ttl_seconds must not be greater than cache_max_ttl_seconds"
+        )
+    return ttl_seconds, (min_ttl_seconds, max_ttl_seconds)
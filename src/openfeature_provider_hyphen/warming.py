@@ -0,0 +1,195 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Sequence, Set
+
+from .types import HyphenEvaluationContext
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """Prefetches evaluations for known contexts and keeps them fresh.
+
+    Warmed contexts are remembered by cache key. When a re-warm interval is
+    set, a background thread refreshes all of them on that interval, so hot
+    contexts are refreshed before their cache entries expire.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[HyphenEvaluationContext], Any],
+        generate_cache_key_fn: Callable[[HyphenEvaluationContext], str],
+        max_workers: int = 8,
+        interval_seconds: Optional[float] = None,
+    ):
+        """Initialize the warmer.
+
+        Args:
+            refresh: Function fetching and caching the evaluation of a context
+            generate_cache_key_fn: Function generating the cache key of a context
+            max_workers: Maximum number of concurrent refreshes
+            interval_seconds: Interval between scheduled re-warms, None disables them
+        """
+        self.refresh = refresh
+        self.generate_cache_key_fn = generate_cache_key_fn
+        self.max_workers = max_workers
+        self.interval_seconds = interval_seconds
+        self.contexts: Dict[str, HyphenEvaluationContext] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _refresh(self, context: HyphenEvaluationContext) -> bool:
+        try:
+            self.refresh(context)
+            return True
+        except Exception as error:
+            logger.debug("Error warming cache for %s: %s", context.targeting_key, error)
+            return False
+
+    def _refresh_all(self, contexts: Sequence[HyphenEvaluationContext]) -> int:
+        if not contexts:
+            return 0
+        workers = min(self.max_workers, len(contexts))
+        with ThreadPoolExecutor(workers, thread_name_prefix="hyphen-warm") as pool:
+            return sum(pool.map(self._refresh, contexts))
+
+    def warm(self, contexts: Sequence[HyphenEvaluationContext]) -> int:
+        """Fetch and cache evaluations for the contexts concurrently.
+
+        The contexts are also refreshed by the scheduled re-warms.
+
+        Args:
+            contexts: Prepared evaluation contexts
+
+        Returns:
+            The number of contexts warmed successfully
+        """
+        with self._lock:
+            for context in contexts:
+                self.contexts[self.generate_cache_key_fn(context)] = context
+        if self.interval_seconds is not None:
+            self.start()
+        return self._refresh_all(contexts)
+
+    def rewarm(self) -> int:
+        """Refresh every warmed context now.
+
+        Returns:
+            The number of contexts refreshed successfully
+        """
+        with self._lock:
+            contexts = list(self.contexts.values())
+        return self._refresh_all(contexts)
+
+    def _after_fork_in_child(self) -> None:
+        running = self._thread is not None and not self._stop.is_set()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        if running:
+            self.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds):
+            self.rewarm()
+
+    def start(self) -> None:
+        """Start the scheduled re-warms, if not already running."""
+        with self._lock:
+            if self._thread is not None or self._stop.is_set():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="hyphen-rewarm", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Stop the scheduled re-warms.
+
+        Args:
+            timeout: Maximum time in seconds to wait for a running re-warm
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+class BackgroundFetcher:
+    """Fetches evaluations of cache misses in the background.
+
+    Each context is fetched at most once at a time, and at most `max_pending`
+    contexts wait to be fetched; later misses are not scheduled until a fetch
+    finishes.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[HyphenEvaluationContext], Any],
+        generate_cache_key_fn: Callable[[HyphenEvaluationContext], str],
+        max_workers: int = 8,
+        max_pending: int = 1000,
+    ):
+        """Initialize the fetcher.
+
+        Args:
+            fetch: Function fetching and caching the evaluation of a context
+            generate_cache_key_fn: Function generating the cache key of a context
+            max_workers: Maximum number of concurrent fetches
+            max_pending: Maximum number of contexts scheduled and not yet fetched
+        """
+        self.fetch = fetch
+        self.generate_cache_key_fn = generate_cache_key_fn
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.pending: Set[str] = set()
+        self.skipped = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def _fetch(self, key: str, context: HyphenEvaluationContext) -> None:
+        try:
+            self.fetch(context)
+        except Exception as error:
+            logger.debug("Error fetching %s in the background: %s", key, error)
+        finally:
+            with self._lock:
+                self.pending.discard(key)
+
+    def schedule(self, context: HyphenEvaluationContext) -> bool:
+        """Schedule a fetch of the context, unless one is already pending.
+
+        Returns:
+            Whether a fetch was scheduled
+        """
+        key = self.generate_cache_key_fn(context)
+        with self._lock:
+            if self._closed or key in self.pending:
+                return False
+            if len(self.pending) >= self.max_pending:
+                self.skipped += 1
+                return False
+            self.pending.add(key)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers, thread_name_prefix="hyphen-fetch"
+                )
+            executor = self._executor
+        executor.submit(self._fetch, key, context)
+        return True
+
+    def _after_fork_in_child(self) -> None:
+        # Fetches in flight belong to the parent's threads
+        self._lock = threading.Lock()
+        self.pending = set()
+        self._executor = None
+
+    def close(self) -> None:
+        """Stop scheduling fetches; fetches already scheduled still run."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
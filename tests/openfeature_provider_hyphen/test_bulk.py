@@ -0,0 +1,132 @@
+from array import array
+
+import pytest
+
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import HyphenProviderOptions
+
+
+def make_provider(handler):
+    transport = InMemoryTransport(handler=handler)
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", transport=transport
+    )
+    return HyphenProvider("test-key", options), transport
+
+
+def plan_handler(url, payload):
+    plan = payload.get("customAttributes", {}).get("plan")
+    if plan == "broken":
+        return 500, {}
+    return 200, {
+        "toggles": {
+            "premium": {"key": "premium", "value": plan == "pro", "type": "boolean"},
+            "limit": {"key": "limit", "value": 10.0, "type": "number"},
+        }
+    }
+
+
+def test_evaluate_bulk_groups_identical_rows():
+    provider, transport = make_provider(plan_handler)
+
+    result = provider.evaluate_bulk(
+        "premium",
+        False,
+        ["a", "b", "a", "a", "b"],
+        custom_attributes={"plan": ["pro", "free", "pro", "pro", "free"]},
+    )
+
+    assert result.values == array("b", [1, 0, 1, 1, 0])
+    assert result.distinct_contexts == 2
+    assert result.errors == 0
+    assert len(transport.requests) == 2
+
+
+def test_evaluate_bulk_typed_values_and_errors():
+    provider, _ = make_provider(plan_handler)
+
+    result = provider.evaluate_bulk(
+        "limit", 0, ["a", "b", "c"], custom_attributes={"plan": ["pro", "broken", None]}
+    )
+
+    assert result.values == array("q", [10, 0, 10])
+    assert result.errors == 1
+
+    missing = provider.evaluate_bulk("missing", "off", ["a", "b"])
+    assert missing.values == ["off", "off"]
+    assert missing.errors == 2
+
+
+def test_evaluate_bulk_counts_missing_targeting_keys_as_errors():
+    provider, transport = make_provider(plan_handler)
+
+    result = provider.evaluate_bulk(
+        "premium",
+        False,
+        ["a", None, "b", float("nan")],
+        custom_attributes={"plan": ["pro", "pro", float("nan"), "pro"]},
+    )
+
+    assert result.values == array("b", [1, 0, 0, 0])
+    assert result.errors == 2
+    # NaN attributes are left out of the request like None
+    payloads = {
+        request.payload["targetingKey"]: request.payload
+        for request in transport.requests
+    }
+    assert sorted(payloads) == ["a", "b"]
+    assert "plan" not in payloads["b"].get("customAttributes", {})
+
+
+def test_evaluate_bulk_groups_cells_by_type_and_value():
+    provider, transport = make_provider(plan_handler)
+
+    result = provider.evaluate_bulk(
+        "premium",
+        False,
+        ["a"] * 6,
+        custom_attributes={
+            "flag": [True, 1, 1.0, True, ["x", 1], ["x", 1]],
+        },
+    )
+
+    assert result.distinct_contexts == 4
+    assert result.errors == 0
+    assert len(transport.requests) == 4
+    sent = sorted(
+        repr(request.payload["customAttributes"]["flag"])
+        for request in transport.requests
+    )
+    assert sent == ["1", "1.0", "True", "['x', 1]"]
+
+
+def test_evaluate_bulk_accepts_array_columns():
+    provider, _ = make_provider(plan_handler)
+
+    class Column:
+        def __init__(self, values):
+            self.values = values
+
+        def tolist(self):
+            return list(self.values)
+
+    result = provider.evaluate_bulk(
+        "premium", False, Column(["a", "b"]), custom_attributes={"plan": ["pro", "x"]}
+    )
+    assert list(result.values) == [1, 0]
+
+    with pytest.raises(ValueError, match="same length"):
+        provider.evaluate_bulk("premium", False, ["a"], custom_attributes={"plan": []})
+
+
+def test_bulk_result_to_numpy():
+    numpy = pytest.importorskip("numpy")
+    provider, _ = make_provider(plan_handler)
+
+    result = provider.evaluate_bulk(
+        "premium", False, ["a", "b"], custom_attributes={"plan": ["pro", "free"]}
+    )
+
+    assert result.to_numpy().dtype == numpy.bool_
+    assert result.to_numpy().tolist() == [True, False]
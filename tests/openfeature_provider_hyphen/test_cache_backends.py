@@ -0,0 +1,192 @@
+import socketserver
+import threading
+import time
+
+import pytest
+
+from openfeature_provider_hyphen.cache_backends import (
+    MemoryCacheBackend, RedisCacheBackend, SqliteCacheBackend,
+    decode_evaluation_response, encode_evaluation_response)
+from openfeature_provider_hyphen.cache_client import CacheClient
+from openfeature_provider_hyphen.types import (Evaluation, EvaluationResponse,
+                                               HyphenEvaluationContext)
+
+
+def make_response():
+    return EvaluationResponse(
+        toggles={
+            "test-flag": Evaluation(
+                key="test-flag", value=True, type="boolean", reason="STATIC"
+            )
+        }
+    )
+
+
+def test_memory_backend_operations():
+    backend = MemoryCacheBackend()
+
+    assert backend.get("key") is None
+
+    backend.set("key", "value", 30)
+    assert backend.get("key") == "value"
+
+    # Entries with no TTL expire immediately
+    backend.set("expired", "value", 0)
+    assert backend.get("expired") is None
+
+
+def test_evaluation_response_encoding():
+    response = make_response()
+    assert decode_evaluation_response(encode_evaluation_response(response)) == response
+
+
+def test_sqlite_backend_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = SqliteCacheBackend(path)
+    reader = SqliteCacheBackend(path)
+
+    assert reader.get("key") is None
+
+    # A value written by one worker is visible to another
+    writer.set("key", make_response(), 30)
+    assert reader.get("key") == make_response()
+
+    writer.close()
+    reader.close()
+
+
+def test_sqlite_backend_ttl(tmp_path):
+    backend = SqliteCacheBackend(str(tmp_path / "cache.db"), purge_interval=1)
+
+    backend.set("key", make_response(), 0.05)
+    assert backend.get("key") == make_response()
+
+    time.sleep(0.1)
+    assert backend.get("key") is None
+
+    # Expired rows are purged on write
+    backend.set("other", make_response(), 30)
+    count = backend._connect().execute("SELECT COUNT(*) FROM hyphen_cache").fetchone()
+    assert count[0] == 1
+
+
+def test_cache_client_with_sqlite_backend(tmp_path):
+    path = str(tmp_path / "cache.db")
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    CacheClient(backend=SqliteCacheBackend(path)).set(context, make_response())
+
+    other_worker = CacheClient(backend=SqliteCacheBackend(path))
+    assert other_worker.get(context) == make_response()
+
+
+class FakeRedisServer:
+    """Minimal Redis-compatible server supporting the commands the backend uses."""
+
+    def __init__(self):
+        self.data = {}
+        self.commands = []
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), self._handler())
+        self.server.daemon_threads = True
+        self.url = "redis://127.0.0.1:%d/0" % self.server.server_address[1]
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def _handler(self):
+        fake = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                while True:
+                    line = self.rfile.readline()
+                    if not line:
+                        return
+                    args = []
+                    for _ in range(int(line[1:])):
+                        length = int(self.rfile.readline()[1:])
+                        args.append(self.rfile.read(length + 2)[:-2])
+                    self.wfile.write(fake.execute(args))
+
+        return Handler
+
+    def execute(self, args):
+        command = args[0].upper()
+        self.commands.append(command)
+        if command == b"SET":
+            self.data[args[1]] = (args[2], time.time() + int(args[4]) / 1000)
+            return b"+OK\r\n"
+        if command == b"MGET":
+            reply = [b"*%d\r\n" % (len(args) - 1)]
+            for key in args[1:]:
+                value, expires_at = self.data.get(key, (None, 0))
+                if value is None or expires_at <= time.time():
+                    reply.append(b"$-1\r\n")
+                else:
+                    reply.append(b"$%d\r\n%s\r\n" % (len(value), value))
+            return b"".join(reply)
+        return b"-ERR unknown command\r\n"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def redis_server():
+    server = FakeRedisServer()
+    yield server
+    server.close()
+
+
+def test_redis_backend_operations(redis_server):
+    backend = RedisCacheBackend(redis_server.url)
+
+    assert backend.get("key") is None
+
+    backend.set("key", make_response(), 30)
+    assert backend.get("key") == make_response()
+    assert b"hyphen:key" in redis_server.data
+
+    backend.close()
+
+
+def test_redis_backend_bulk_operations_are_pipelined(redis_server):
+    backend = RedisCacheBackend(redis_server.url)
+
+    backend.set_many({"a": make_response(), "b": make_response()}, 30)
+    assert backend.get_many(["a", "missing", "b"]) == [
+        make_response(),
+        None,
+        make_response(),
+    ]
+
+    # One MGET serves the whole bulk lookup
+    assert redis_server.commands == [b"SET", b"SET", b"MGET"]
+
+
+def test_redis_backend_unavailable_is_a_cache_miss():
+    backend = RedisCacheBackend("redis://127.0.0.1:1/0", socket_timeout=0.1)
+    client = CacheClient(backend=backend)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    client.set(context, make_response())
+    assert client.get(context) == make_response()  # Served from L1
+
+    assert CacheClient(backend=backend).get(context) is None
+
+
+def test_cache_client_uses_l2_behind_l1(redis_server):
+    backend = RedisCacheBackend(redis_server.url)
+    context1 = HyphenEvaluationContext(targeting_key="user1")
+    context2 = HyphenEvaluationContext(targeting_key="user2")
+
+    CacheClient(backend=backend).set_many(
+        [(context1, make_response()), (context2, make_response())]
+    )
+
+    client = CacheClient(backend=RedisCacheBackend(redis_server.url))
+    assert client.get_many([context1, context2]) == [make_response(), make_response()]
+
+    # L2 hits are promoted to L1, so later reads do not reach the server
+    redis_server.commands.clear()
+    assert client.get(context1) == make_response()
+    assert redis_server.commands == []
@@ -1,5 +1,12 @@
-from openfeature_provider_hyphen.cache_client import CacheClient
-from openfeature_provider_hyphen.types import HyphenEvaluationContext
+import pytest
+
+from openfeature_provider_hyphen.cache_backends import MemoryCacheBackend
+from openfeature_provider_hyphen.cache_client import (
+    AdaptiveTTLPolicy, AttributeCacheKeyGenerator, CacheClient, CachedError,
+    ResponseInterner)
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenUser)
+from openfeature_provider_hyphen.utils import parse_evaluation_response
 
 
 def test_cache_operations():
@@ -56,3 +63,219 @@ def test_ttl():
 
     client.set(context, value)
     assert client.get(context) is None  # Should expire immediately
+
+
+def test_negative_cache():
+    context = HyphenEvaluationContext(targeting_key="user1")
+    error = Exception("Network error")
+
+    # Disabled by default
+    client = CacheClient()
+    client.set_error(context, error)
+    assert client.get(context) is None
+
+    client = CacheClient(negative_ttl_seconds=30)
+    client.set_error(context, error)
+    cached = client.get(context)
+    assert isinstance(cached, CachedError)
+    assert cached.error_type is Exception
+    assert str(cached.to_exception()) == "Network error"
+    # Every hit gets a new exception
+    assert cached.to_exception() is not cached.to_exception()
+    assert client.stats()["negative_hits"] == 1
+
+
+def test_tier_stats():
+    l2 = MemoryCacheBackend(maxsize=1000)
+    client = CacheClient(backend=l2, l1_maxsize=1)
+    context1 = HyphenEvaluationContext(targeting_key="user1")
+    context2 = HyphenEvaluationContext(targeting_key="user2")
+
+    client.set(context1, "value1")
+    client.set(context2, "value2")  # Evicts context1 from L1
+
+    assert client.get(context2) == "value2"
+    assert client.get(context1) == "value1"  # Served from L2
+    assert client.get(HyphenEvaluationContext(targeting_key="user3")) is None
+
+    stats = client.stats()
+    assert stats["l1"]["hits"] == 1
+    assert stats["l1"]["misses"] == 2
+    assert stats["l2"]["hits"] == 1
+    assert stats["l2"]["misses"] == 1
+    assert stats["l2"]["errors"] == 0
+
+
+def test_l1_ttl():
+    client = CacheClient(ttl_seconds=30, backend=MemoryCacheBackend(), l1_ttl_seconds=0)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    client.set(context, "value")
+    assert client.l1.get(client.generate_cache_key_fn(context)) is None
+    assert client.get(context) == "value"
+
+
+def test_default_key_with_user():
+    client = CacheClient()
+    context = HyphenEvaluationContext(
+        targeting_key="user1", attributes={"user": HyphenUser(id="user1")}
+    )
+    assert client.generate_cache_key_fn(context)
+
+
+def test_attribute_key_generator_exclude():
+    generate = AttributeCacheKeyGenerator(
+        exclude=["ip_address", "custom_attributes.request_id", "user.email"]
+    )
+
+    def make_context(ip_address, request_id, email, plan="free"):
+        return HyphenEvaluationContext(
+            targeting_key="user1",
+            attributes={
+                "ip_address": ip_address,
+                "user": HyphenUser(id="user1", email=email),
+                "custom_attributes": {"request_id": request_id, "plan": plan},
+            },
+        )
+
+    key = generate(make_context("10.0.0.1", "req-1", "a@example.com"))
+    assert key == generate(make_context("10.0.0.2", "req-2", "b@example.com"))
+    assert key != generate(make_context("10.0.0.1", "req-1", "a@example.com", "pro"))
+
+
+def test_attribute_key_generator_include():
+    generate = AttributeCacheKeyGenerator(
+        include=["targeting_key", "custom_attributes.plan"]
+    )
+    context1 = HyphenEvaluationContext(
+        targeting_key="user1",
+        attributes={"ip_address": "10.0.0.1", "custom_attributes": {"plan": "pro"}},
+    )
+    context2 = HyphenEvaluationContext(
+        targeting_key="user1",
+        attributes={"ip_address": "10.0.0.2", "custom_attributes": {"plan": "pro"}},
+    )
+    context3 = HyphenEvaluationContext(
+        targeting_key="user2",
+        attributes={"ip_address": "10.0.0.1", "custom_attributes": {"plan": "pro"}},
+    )
+
+    assert generate(context1) == generate(context2)
+    assert generate(context1) != generate(context3)
+
+
+def test_attribute_key_generator_include_and_exclude():
+    with pytest.raises(ValueError):
+        AttributeCacheKeyGenerator(include=["targeting_key"], exclude=["ip_address"])
+
+
+def test_adaptive_ttl_policy():
+    policy = AdaptiveTTLPolicy(30, min_ttl_seconds=10, max_ttl_seconds=100)
+
+    assert policy.ttl_for("hot", "a") == 30
+    policy.record_hit("hot")
+    policy.record_hit("hot")
+    assert policy.ttl_for("hot", "a") == 60
+    policy.record_hit("hot")
+    policy.record_hit("hot")
+    assert policy.ttl_for("hot", "a") == 100
+
+    # Changed values halve the TTL
+    assert policy.ttl_for("hot", "b") == 50
+
+    # Entries that were not hit drop to the minimum
+    assert policy.ttl_for("cold", "a") == 30
+    assert policy.ttl_for("cold", "a") == 10
+
+    # Entries hit occasionally keep their TTL
+    policy.record_hit("cold")
+    assert policy.ttl_for("cold", "a") == 10
+
+    stats = policy.stats()
+    assert stats["entries"] == 2
+    assert stats["increases"] == 2
+    assert stats["decreases"] == 2
+    assert stats["mean_ttl_seconds"] == 30
+
+
+def test_adaptive_ttl_policy_bounds():
+    with pytest.raises(ValueError):
+        AdaptiveTTLPolicy(30, min_ttl_seconds=60, max_ttl_seconds=10)
+
+    assert AdaptiveTTLPolicy(30, 1, 5).ttl_for("key", "value") == 5
+
+
+def test_cache_client_adaptive_ttl():
+    backend = MemoryCacheBackend()
+    written = []
+    backend.set_many = lambda items, ttl: written.append((sorted(items), ttl))
+    client = CacheClient(
+        ttl_seconds=30,
+        backend=backend,
+        l1_ttl_seconds=20,
+        ttl_policy=AdaptiveTTLPolicy(30, min_ttl_seconds=10, max_ttl_seconds=100),
+    )
+    context = HyphenEvaluationContext(targeting_key="user1")
+    key = client.generate_cache_key_fn(context)
+
+    client.set(context, "value")
+    client.get(context)
+    client.get(context)
+    client.set(context, "value")
+
+    assert written == [([key], 30), ([key], 60)]
+    assert client.l1.cache[key][0] == 20
+    assert client.stats()["adaptive_ttl"]["increases"] == 1
+
+
+def test_interner_shares_equal_responses_and_evaluations():
+    interner = ResponseInterner()
+
+    def make(value):
+        return parse_evaluation_response(
+            {
+                "toggles": {
+                    "a": {"key": "a", "value": value, "type": "number"},
+                    "b": {"key": "b", "value": {"x": [1]}, "type": "object"},
+                }
+            }
+        )
+
+    first = interner.intern(make(1))
+    assert interner.intern(make(1)) is first
+    assert interner.intern(first) is first
+
+    other = interner.intern(make(2))
+    assert other is not first
+    assert other.toggles["b"] is first.toggles["b"]
+    assert interner.stats() == {"responses": 2, "evaluations": 3, "hits": 1}
+
+    boolean = parse_evaluation_response(
+        {"toggles": {"a": {"key": "a", "value": True, "type": "number"}}}
+    )
+    number = parse_evaluation_response(
+        {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}}
+    )
+    assert interner.intern(boolean) is not interner.intern(number)
+
+
+def test_cache_client_interns_cached_responses():
+    cache = CacheClient(interner=ResponseInterner())
+    body = {"toggles": {"a": {"key": "a", "value": True, "type": "boolean"}}}
+
+    for index in range(10):
+        cache.set(
+            HyphenEvaluationContext(targeting_key=f"user-{index}"),
+            parse_evaluation_response(body),
+        )
+
+    first = cache.get(HyphenEvaluationContext(targeting_key="user-0"))
+    last = cache.get(HyphenEvaluationContext(targeting_key="user-9"))
+    assert first is last
+    # set returns the shared instance, so callers need not intern again
+    stored = cache.set(
+        HyphenEvaluationContext(targeting_key="user-10"),
+        parse_evaluation_response(body),
+    )
+    assert stored is first
+    assert cache.stats()["interned"] == {"responses": 1, "evaluations": 1, "hits": 10}
@@ -0,0 +1,42 @@
+from openfeature_provider_hyphen.changes import (FlagChangeTracker,
+                                                 fingerprint_evaluation)
+from openfeature_provider_hyphen.types import Evaluation, EvaluationResponse
+
+
+def make_response(**values) -> EvaluationResponse:
+    return EvaluationResponse(
+        toggles={
+            key: Evaluation(key=key, value=value, type="object")
+            for key, value in values.items()
+        }
+    )
+
+
+def test_fingerprint_evaluation():
+    first = Evaluation(key="flag", value={"a": 1, "b": [1, 2]}, type="object")
+    same = Evaluation(key="flag", value={"b": [1, 2], "a": 1}, type="object")
+    other = Evaluation(key="flag", value={"a": 2, "b": [1, 2]}, type="object")
+
+    assert fingerprint_evaluation(first) == fingerprint_evaluation(same)
+    assert fingerprint_evaluation(first) != fingerprint_evaluation(other)
+
+
+def test_tracker_reports_changed_flags():
+    tracker = FlagChangeTracker()
+
+    assert tracker.update("key", make_response(a=1, b=True, c="x")) == []
+    assert tracker.update("key", make_response(a=1, b=True, c="x")) == []
+    assert tracker.update("key", make_response(a=2, b=True, d="y")) == ["a", "c", "d"]
+
+    # Entries are tracked separately
+    assert tracker.update("other", make_response(a=3)) == []
+
+
+def test_tracker_is_bounded():
+    tracker = FlagChangeTracker(max_entries=2)
+
+    for key in ("first", "second", "third"):
+        tracker.update(key, make_response(a=1))
+
+    assert "first" not in tracker.fingerprints
+    assert len(tracker.fingerprints) == 2
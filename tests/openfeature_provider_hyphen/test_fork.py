@@ -0,0 +1,108 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from openfeature_provider_hyphen.fork import (_after_fork_in_child,
+                                              register_fork_handler)
+from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions,
+                                               TelemetryPayload)
+
+EVALUATE_RESPONSE = {
+    "toggles": {"test-flag": {"key": "test-flag", "value": True, "type": "boolean"}}
+}
+
+
+def make_options(transport, **options) -> HyphenProviderOptions:
+    return HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        transport=transport,
+        **options,
+    )
+
+
+def test_handlers_are_called_and_weakly_referenced():
+    calls = []
+
+    class Handler:
+        def _after_fork_in_child(self):
+            calls.append(self)
+
+    handler = Handler()
+    register_fork_handler(handler)
+    _after_fork_in_child()
+    assert calls == [handler]
+
+    del handler, calls[:]
+    _after_fork_in_child()
+    assert calls == []
+
+
+def test_client_resets_after_fork():
+    transport = InMemoryTransport({"/toggle/telemetry": {}})
+    client = HyphenClient(
+        "test-key", make_options(transport, background_telemetry=True)
+    )
+    worker = client.telemetry_worker
+    worker.submit(TelemetryPayload(context={}, data={}))
+    parent_queue = worker.queue
+
+    with patch.object(transport, "close") as mock_close:
+        client._after_fork_in_child()
+        mock_close.assert_called_once()
+
+    assert worker.queue is not parent_queue
+    assert worker.queue.qsize() == 0
+    assert worker._thread is None
+    assert client.close(timeout=1) is True
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_inherits_warm_cache():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+    provider = HyphenProvider("test-key", make_options(transport))
+    provider.warm([HyphenEvaluationContext(targeting_key="user1")])
+    with patch("gc.freeze"):
+        provider.prepare_for_fork()
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            details = provider.resolve_boolean_details(
+                "test-flag", False, HyphenEvaluationContext(targeting_key="user1")
+            )
+            result = {"value": details.value, "requests": len(transport.requests)}
+        except Exception as error:
+            result = {"error": repr(error)}
+        os.write(write_fd, json.dumps(result).encode())
+        os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as pipe:
+        result = json.loads(pipe.read())
+    os.waitpid(pid, 0)
+
+    assert result == {"value": True, "requests": 1}
+
+
+@patch("gc.freeze")
+def test_prepare_for_fork(mock_freeze):
+    transport = InMemoryTransport()
+    provider = HyphenProvider("test-key", make_options(transport))
+    provider.hyphen_client
+
+    with patch.object(transport, "close") as mock_close:
+        provider.prepare_for_fork()
+        mock_close.assert_called_once()
+    mock_freeze.assert_called_once()
+
+    provider.prepare_for_fork(freeze_gc=False)
+    mock_freeze.assert_called_once()
@@ -4,6 +4,8 @@ import pytest
 import requests
 
 from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.transports import (InMemoryTransport,
+                                                    TransportError)
 from openfeature_provider_hyphen.types import (Evaluation, EvaluationResponse,
                                                HyphenEvaluationContext,
                                                HyphenProviderOptions,
@@ -209,3 +211,180 @@ def test_try_urls_all_fail(mock_post, client):
 
     # Verify all URLs were tried
     assert mock_post.call_count == len(client.horizon_urls)
+
+
+@patch("requests.Session.post")
+def test_evaluate_negative_cache(mock_post):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        negative_cache_ttl_seconds=30,
+    )
+    client = HyphenClient("test-key", options)
+    mock_post.side_effect = requests.RequestException("Network error")
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    with pytest.raises(requests.RequestException):
+        client.evaluate(context)
+    assert mock_post.call_count == len(client.horizon_urls)
+
+    # The failure is served from the cache without another request
+    with pytest.raises(requests.RequestException) as first:
+        client.evaluate(context)
+    assert mock_post.call_count == len(client.horizon_urls)
+    with pytest.raises(requests.RequestException) as second:
+        client.evaluate(context)
+    assert first.value is not second.value
+    assert str(second.value) == "Network error"
+
+
+def test_negative_cache_keeps_transport_error_attributes():
+    transport = InMemoryTransport(handler=lambda url, payload: (503, {}))
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        negative_cache_ttl_seconds=30,
+    )
+    client = HyphenClient("test-key", options)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    with pytest.raises(TransportError) as first:
+        client.evaluate(context)
+    with pytest.raises(TransportError) as cached:
+        client.evaluate(context)
+
+    assert len(transport.requests) == 1
+    assert cached.value is not first.value
+    assert cached.value.status_code == 503
+    assert cached.value.url == first.value.url
+    assert str(cached.value) == str(first.value)
+
+
+@patch("requests.Session.post")
+def test_request_metrics(mock_post, mock_response):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        enable_metrics=True,
+    )
+    client = HyphenClient("test-key", options)
+    mock_post.side_effect = [requests.RequestException("Failed"), mock_response]
+
+    client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+
+    snapshot = client.metrics.snapshot()
+    requests_total = {
+        sample["labels"]["outcome"]: sample["value"]
+        for sample in snapshot["counters"]["hyphen_http_requests_total"]
+    }
+    assert requests_total == {"error": 1, "success": 1}
+    assert snapshot["counters"]["hyphen_failovers_total"][0]["value"] == 1
+    assert (
+        snapshot["histograms"]["hyphen_http_request_duration_seconds"][0]["count"] == 2
+    )
+    cache_misses = snapshot["gauges"]["hyphen_cache_misses"]
+    assert cache_misses == [{"labels": {"tier": "l1"}, "value": 1}]
+
+
+def test_connection_pool_options():
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://a.example.com", "https://b.example.com/"],
+        http_pool_maxsize=50,
+        http_pool_maxsize_by_url={"https://b.example.com/": 5},
+        http_pool_block=True,
+        http_max_retries=2,
+    )
+    client = HyphenClient("test-key", options)
+
+    adapter_a = client.session.get_adapter("https://a.example.com/toggle/evaluate")
+    adapter_b = client.session.get_adapter("https://b.example.com/toggle/evaluate")
+    assert adapter_a._pool_maxsize == 50
+    assert adapter_a._pool_block is True
+    assert adapter_a.max_retries.total == 2
+    assert adapter_b._pool_maxsize == 5
+
+
+def test_http_adapter_factory():
+    adapter = requests.adapters.HTTPAdapter()
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        http_adapter_factory=lambda base_url: adapter,
+    )
+    client = HyphenClient("test-key", options)
+
+    assert client.session.get_adapter("https://test.example.com/toggle") is adapter
+
+
+@patch("requests.Session.head")
+def test_prewarm_connections(mock_head, client):
+    client.prewarm_connections()
+
+    warmed = sorted(args[0] for args, _ in mock_head.call_args_list)
+    assert warmed == sorted(client.horizon_urls)
+
+
+@patch("requests.Session.post")
+def test_idle_connections_are_closed(mock_post, mock_response):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        http_idle_timeout_seconds=60,
+    )
+    client = HyphenClient("test-key", options)
+    mock_post.return_value = mock_response
+
+    with patch.object(client.session, "close") as mock_close:
+        client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+        mock_close.assert_not_called()
+
+        client._last_request_at -= 120
+        client.evaluate(HyphenEvaluationContext(targeting_key="user2"))
+        mock_close.assert_called_once()
+
+
+@patch("requests.Session.post")
+def test_background_telemetry(mock_post, mock_response):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        background_telemetry=True,
+        enable_metrics=True,
+    )
+    client = HyphenClient("test-key", options)
+    mock_post.return_value = mock_response
+
+    client.post_telemetry(
+        TelemetryPayload(context={"targetingKey": "user1"}, data={"toggle": {}})
+    )
+    with patch.object(client.session, "close") as mock_close:
+        assert client.close(timeout=1) is True
+        mock_close.assert_called_once()
+
+    mock_post.assert_called_once()
+    assert "toggle/telemetry" in mock_post.call_args[0][0]
+    gauges = client.metrics.snapshot()["gauges"]
+    assert gauges["hyphen_telemetry_queue_depth"][0]["value"] == 0
+
+
+def test_adaptive_cache_ttl_options():
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        cache_ttl_seconds=40,
+        adaptive_cache_ttl=True,
+        cache_max_ttl_seconds=300,
+    )
+    policy = HyphenClient("test-key", options).cache.ttl_policy
+
+    assert policy.initial_ttl_seconds == 40
+    assert policy.min_ttl_seconds == 10
+    assert policy.max_ttl_seconds == 300
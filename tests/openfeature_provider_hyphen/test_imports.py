@@ -0,0 +1,70 @@
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+HEAVY_MODULES = ("requests", "urllib3", "cachetools", "hashlib", "sqlite3", "asyncio")
+
+CONSTRUCT_PROVIDER = """
+from openfeature_provider_hyphen import HyphenProvider, HyphenProviderOptions
+HyphenProvider("public-key", HyphenProviderOptions(application="app", environment="production"))
+"""
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """Run code with `-X importtime` and get the self time in us of each imported module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:") :].split("|")
+        if self_us.strip().isdigit():
+            times[name.strip()] = int(self_us)
+    return times
+
+
+def test_import_is_lazy():
+    times = import_times("import openfeature_provider_hyphen")
+
+    assert [name for name in times if name.startswith("openfeature")] == [
+        "openfeature_provider_hyphen"
+    ]
+
+
+def test_provider_construction_defers_network_stack():
+    times = import_times(CONSTRUCT_PROVIDER)
+
+    assert [name for name in HEAVY_MODULES if name in times] == []
+    assert "openfeature_provider_hyphen.hyphen_client" not in times
+
+
+def test_provider_import_time_budget():
+    times = import_times(CONSTRUCT_PROVIDER)
+
+    # Generous budget for the package's own modules, excluding dependencies
+    own = sum(
+        us for name, us in times.items() if name.startswith("openfeature_provider")
+    )
+    assert own < 100_000, times
+
+
+@pytest.mark.parametrize("name", ["HyphenProvider", "RedisCacheBackend", "Transport"])
+def test_lazy_exports(name):
+    import openfeature_provider_hyphen
+
+    assert getattr(openfeature_provider_hyphen, name).__name__ == name
+    assert name in dir(openfeature_provider_hyphen)
+
+
+def test_unknown_export():
+    import openfeature_provider_hyphen
+
+    with pytest.raises(AttributeError):
+        openfeature_provider_hyphen.Missing
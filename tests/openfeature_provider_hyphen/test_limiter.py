@@ -0,0 +1,166 @@
+import asyncio
+import threading
+
+import pytest
+
+from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.limiter import (AdaptiveConcurrencyLimiter,
+                                                 ConcurrencyLimitExceeded)
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions)
+
+
+def test_limiter_increases_additively_and_decreases_multiplicatively():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4, latency_threshold_seconds=1)
+
+    for _ in range(8):
+        limiter.acquire()
+        limiter.release(0.01)
+    assert int(limiter.limit) == 5
+
+    limit = limiter.limit
+    limiter.acquire()
+    limiter.release(0.01, dropped=True)
+    assert limiter.limit == pytest.approx(limit * 0.9)
+
+    for _ in range(100):
+        limiter.acquire()
+        limiter.release(2.0)
+    assert limiter.limit == limiter.min_limit
+
+
+def test_limiter_rejects_when_queue_is_full():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, max_queue_size=0)
+    limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceeded, match="queue is full"):
+        limiter.acquire()
+    assert limiter.stats() == {"limit": 1, "in_flight": 1, "waiting": 0, "rejected": 1}
+
+
+def test_limiter_waits_for_a_free_slot():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=0.01)
+    limiter.acquire()
+
+    with pytest.raises(ConcurrencyLimitExceeded, match="Timed out"):
+        limiter.acquire()
+
+    limiter.queue_timeout_seconds = 5
+    timer = threading.Timer(0.05, limiter.release, args=(0.05,))
+    timer.start()
+    limiter.acquire()
+    timer.join()
+    assert limiter.in_flight == 1
+
+
+def test_slot_counts_exceptions_as_drops():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+
+    with pytest.raises(RuntimeError):
+        with limiter.slot():
+            raise RuntimeError("boom")
+
+    assert limiter.limit == 9
+    assert limiter.in_flight == 0
+
+
+def test_client_falls_back_to_last_known_response():
+    release = threading.Event()
+    entered = threading.Event()
+    value = {"current": 1}
+
+    def handler(url, payload):
+        if value["current"] == 2:
+            entered.set()
+            release.wait(5)
+        toggles = {"a": {"key": "a", "value": value["current"], "type": "number"}}
+        return 200, {"toggles": toggles}
+
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=InMemoryTransport(handler=handler),
+        adaptive_concurrency=True,
+        concurrency_initial_limit=1,
+        concurrency_queue_timeout_seconds=0.01,
+        enable_metrics=True,
+    )
+    client = HyphenClient("test-key", options)
+    client.limiter.min_limit = client.limiter.max_limit = 1
+    known = HyphenEvaluationContext(targeting_key="known")
+    unknown = HyphenEvaluationContext(targeting_key="unknown")
+
+    assert client.evaluate(known).toggles["a"].value == 1
+    client.cache.l1.cache.clear()
+
+    value["current"] = 2
+    blocker = threading.Thread(
+        target=client.refresh, args=(HyphenEvaluationContext(targeting_key="slow"),)
+    )
+    blocker.start()
+    entered.wait(5)
+    try:
+        assert client.evaluate(known).toggles["a"].value == 1
+        with pytest.raises(ConcurrencyLimitExceeded):
+            client.evaluate(unknown)
+    finally:
+        release.set()
+        blocker.join()
+
+    counters = client.metrics.counters["hyphen_limiter_rejections_total"]
+    assert counters == {(("fallback", "stale"),): 1, (("fallback", "none"),): 1}
+    assert client.cache.get(unknown) is None
+
+
+def test_slot_async_waits_without_blocking_the_event_loop():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1, queue_timeout_seconds=1)
+    limiter.acquire()
+    ticks = []
+
+    async def tick():
+        for _ in range(3):
+            ticks.append(1)
+            await asyncio.sleep(0.01)
+        limiter.release(0.0)
+
+    async def request():
+        async with limiter.slot_async():
+            return len(ticks)
+
+    async def main():
+        return (await asyncio.gather(request(), tick()))[0]
+
+    assert asyncio.run(main()) == 3
+    assert limiter.in_flight == 0
+
+
+def test_client_async_falls_back_to_last_known_response():
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=InMemoryTransport(
+            handler=lambda url, payload: (
+                200,
+                {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+            )
+        ),
+        adaptive_concurrency=True,
+        concurrency_initial_limit=1,
+        concurrency_queue_timeout_seconds=0.01,
+    )
+    client = HyphenClient("test-key", options)
+    client.limiter.min_limit = client.limiter.max_limit = 1
+    known = HyphenEvaluationContext(targeting_key="known")
+
+    assert asyncio.run(client.evaluate_async(known)).toggles["a"].value == 1
+    client.cache.l1.cache.clear()
+
+    # Another request holds the only slot
+    client.limiter.acquire()
+    assert asyncio.run(client.evaluate_async(known)).toggles["a"].value == 1
+    with pytest.raises(ConcurrencyLimitExceeded):
+        asyncio.run(
+            client.evaluate_async(HyphenEvaluationContext(targeting_key="unknown"))
+        )
+    assert client.limiter.rejected == 2
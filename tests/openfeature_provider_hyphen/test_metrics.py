@@ -0,0 +1,77 @@
+import sys
+import types
+from unittest.mock import Mock
+
+from openfeature_provider_hyphen.metrics import Histogram, Metrics
+
+
+def test_counters():
+    metrics = Metrics()
+    metrics.inc("requests_total", endpoint="/a")
+    metrics.inc("requests_total", endpoint="/a")
+    metrics.inc("requests_total", 3, endpoint="/b")
+
+    snapshot = metrics.snapshot()
+    assert snapshot["counters"]["requests_total"] == [
+        {"labels": {"endpoint": "/a"}, "value": 2},
+        {"labels": {"endpoint": "/b"}, "value": 3},
+    ]
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    histogram.observe(0.05)
+    histogram.observe(0.5)
+    histogram.observe(5)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["count"] == 3
+    assert snapshot["sum"] == 5.55
+    assert snapshot["buckets"] == [(0.1, 1), (1.0, 2)]
+
+
+def test_gauges():
+    metrics = Metrics()
+    depth = [4]
+    metrics.register_gauge("queue_depth", lambda: depth[0], queue="telemetry")
+
+    depth[0] = 7
+    assert metrics.snapshot()["gauges"]["queue_depth"] == [
+        {"labels": {"queue": "telemetry"}, "value": 7}
+    ]
+
+
+def test_to_prometheus():
+    metrics = Metrics()
+    metrics.inc("requests_total", endpoint="/a")
+    metrics.observe("duration_seconds", 0.002)
+    metrics.register_gauge("queue_depth", lambda: 1)
+
+    text = metrics.to_prometheus()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{endpoint="/a"} 1' in text
+    assert "# TYPE duration_seconds histogram" in text
+    assert 'duration_seconds_bucket{le="0.0025"} 1' in text
+    assert 'duration_seconds_bucket{le="+Inf"} 1' in text
+    assert "duration_seconds_count 1" in text
+    assert "# TYPE queue_depth gauge" in text
+    assert "queue_depth 1" in text
+
+
+def test_register_opentelemetry(monkeypatch):
+    otel_metrics = types.ModuleType("opentelemetry.metrics")
+    otel_metrics.Observation = lambda value, attributes=None: (value, attributes)
+    monkeypatch.setitem(sys.modules, "opentelemetry", types.ModuleType("opentelemetry"))
+    monkeypatch.setitem(sys.modules, "opentelemetry.metrics", otel_metrics)
+
+    metrics = Metrics()
+    metrics.inc("hyphen_evaluations_total", outcome="success")
+    meter = Mock()
+    metrics.register_opentelemetry(meter)
+
+    callbacks = {
+        call.args[0]: call.kwargs["callbacks"][0]
+        for call in meter.create_observable_counter.call_args_list
+    }
+    assert callbacks["hyphen_evaluations_total"](None) == [(1, {"outcome": "success"})]
+    assert "hyphen_evaluation_duration_seconds_count" in callbacks
@@ -0,0 +1,98 @@
+import asyncio
+from unittest.mock import patch
+
+from openfeature.evaluation_context import EvaluationContext
+
+from openfeature_provider_hyphen.middleware import (ASGIPinningMiddleware,
+                                                    WSGIPinningMiddleware)
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import HyphenProviderOptions
+
+
+def make_provider():
+    values = iter(range(1, 100))
+
+    def handler(url, payload):
+        toggles = {"a": {"key": "a", "value": next(values), "type": "number"}}
+        return 200, {"toggles": toggles}
+
+    transport = InMemoryTransport(handler=handler)
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", transport=transport
+    )
+    return HyphenProvider("test-key", options), transport
+
+
+def test_pin_serves_consistent_values_without_preparing_context():
+    provider, transport = make_provider()
+    context = EvaluationContext(targeting_key="user1")
+
+    with provider.pin(context) as response:
+        assert response.toggles["a"].value == 1
+        provider.hyphen_client.refresh(context)
+        with patch.object(provider, "_prepare_context") as mock_prepare:
+            assert provider.resolve_integer_details("a", 0, context).value == 1
+            assert provider.resolve_integer_details("a", 0).value == 1
+            mock_prepare.assert_not_called()
+
+        other = EvaluationContext(targeting_key="user2")
+        assert provider.resolve_integer_details("a", 0, other).value == 3
+
+    assert provider.resolve_integer_details("a", 0, context).value == 2
+    assert len(transport.requests) == 3
+
+
+def test_pin_does_not_fail_when_evaluation_fails():
+    provider, _ = make_provider()
+
+    with patch.object(provider.hyphen_client, "evaluate", side_effect=IOError):
+        with provider.pin(EvaluationContext(targeting_key="user1")) as response:
+            assert response is None
+            assert provider._pinned.get() is None
+
+
+def test_pin_is_scoped_to_the_asyncio_task():
+    provider, _ = make_provider()
+
+    async def request(targeting_key):
+        async with provider.pin_async(EvaluationContext(targeting_key=targeting_key)):
+            await asyncio.sleep(0.01)
+            return provider.resolve_integer_details("a", 0).value
+
+    async def main():
+        return await asyncio.gather(request("user1"), request("user2"))
+
+    assert sorted(asyncio.run(main())) == [1, 2]
+    assert provider._pinned.get() is None
+
+
+def test_wsgi_middleware_pins_each_request():
+    provider, transport = make_provider()
+
+    def app(environ, start_response):
+        values = [provider.resolve_integer_details("a", 0).value for _ in range(5)]
+        return values
+
+    middleware = WSGIPinningMiddleware(
+        app, provider, lambda environ: EvaluationContext(targeting_key=environ["user"])
+    )
+
+    assert middleware({"user": "user1"}, None) == [1] * 5
+    assert len(transport.requests) == 1
+
+
+def test_asgi_middleware_pins_http_requests():
+    provider, _ = make_provider()
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(provider._pinned.get() is not None)
+
+    middleware = ASGIPinningMiddleware(
+        app, provider, lambda scope: EvaluationContext(targeting_key="user1")
+    )
+
+    asyncio.run(middleware({"type": "http"}, None, None))
+    asyncio.run(middleware({"type": "lifespan"}, None, None))
+    assert seen == [True, False]
@@ -0,0 +1,84 @@
+from unittest.mock import Mock, patch
+
+from openfeature.evaluation_context import EvaluationContext
+from openfeature.flag_evaluation import FlagEvaluationDetails
+
+from openfeature_provider_hyphen.profiling import (Profiler, profile_hook,
+                                                   profile_phase)
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions)
+
+
+def test_profile_phase_without_profiler():
+    with profile_phase("network"):
+        pass
+    with profile_hook():
+        pass
+
+
+def test_profiler_ring_buffer():
+    profiler = Profiler(buffer_size=2)
+    for flag_key in ("a", "b", "c"):
+        with profiler.profile(flag_key):
+            with profile_phase("network"):
+                pass
+            with profile_phase("network"):
+                pass
+
+    profiles = profiler.dump()
+    assert [profile["flag_key"] for profile in profiles] == ["b", "c"]
+    assert list(profiles[0]["phases_ms"]) == ["network"]
+
+    assert len(profiler.dump(clear=True)) == 2
+    assert profiler.dump() == []
+
+
+@patch("requests.Session.post")
+def test_provider_profiling(mock_post):
+    mock_response = Mock()
+    mock_response.json.return_value = {
+        "toggles": {"test-flag": {"key": "test-flag", "value": 42, "type": "number"}}
+    }
+    mock_post.return_value = mock_response
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        enable_profiling=True,
+    )
+    provider = HyphenProvider("test-key", options)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    provider.resolve_integer_details("test-flag", 0, context)
+    provider.resolve_integer_details("test-flag", 0, context)
+
+    hook = provider._create_telemetry_hook()
+    details = FlagEvaluationDetails(
+        flag_key="test-flag", value=42, flag_metadata={"type": "number"}
+    )
+    hook_context = Mock()
+    hook_context.evaluation_context = EvaluationContext(targeting_key="user1")
+    hook.after(hook_context, details, {})
+
+    miss, hit = provider.dump_profiles()
+    assert miss["flag_key"] == "test-flag"
+    assert miss["targeting_key"] == "user1"
+    assert set(miss["phases_ms"]) == {
+        "context_prep",
+        "key_generation",
+        "cache_lookup",
+        "network",
+        "decode",
+        "type_coercion",
+    }
+    assert "network" not in hit["phases_ms"]
+    assert "hooks" in hit["phases_ms"]
+    assert hit["total_ms"] >= hit["phases_ms"]["hooks"]
+
+
+def test_profiling_disabled():
+    options = HyphenProviderOptions(application="test-app", environment="test")
+    provider = HyphenProvider("test-key", options)
+    assert provider.profiler is None
+    assert provider.dump_profiles() == []
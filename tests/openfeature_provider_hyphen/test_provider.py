@@ -1,12 +1,15 @@
+import time
 from unittest.mock import Mock, patch
 
 import pytest
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.exception import (FlagNotFoundError, GeneralError,
                                    TypeMismatchError)
-from openfeature.flag_evaluation import FlagResolutionDetails, Reason
+from openfeature.flag_evaluation import (FlagEvaluationDetails,
+                                         FlagResolutionDetails, Reason)
 
 from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.transports import InMemoryTransport
 from openfeature_provider_hyphen.types import (Evaluation, EvaluationResponse,
                                                HyphenEvaluationContext,
                                                HyphenProviderOptions,
@@ -327,3 +330,377 @@ def test_telemetry_hook(provider):
         assert toggle_data["type"] == "boolean"
         assert toggle_data["value"] is True
         assert toggle_data["reason"] == Reason.TARGETING_MATCH
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.evaluate")
+def test_stats(mock_evaluate, mock_evaluation):
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", enable_metrics=True
+    )
+    provider = HyphenProvider("test-key", options)
+    mock_evaluate.return_value = EvaluationResponse(toggles=mock_evaluation)
+
+    provider.resolve_boolean_details(
+        "test-flag", False, HyphenEvaluationContext(targeting_key="user1")
+    )
+    with pytest.raises(FlagNotFoundError):
+        provider.resolve_boolean_details(
+            "missing-flag", False, HyphenEvaluationContext(targeting_key="user1")
+        )
+
+    stats = provider.stats()
+    assert "l1" in stats["cache"]
+    evaluations = {
+        sample["labels"]["outcome"]: sample["value"]
+        for sample in stats["metrics"]["counters"]["hyphen_evaluations_total"]
+    }
+    assert evaluations == {"success": 1, "error": 1}
+    duration = stats["metrics"]["histograms"]["hyphen_evaluation_duration_seconds"]
+    assert duration[0]["count"] == 2
+
+
+def test_stats_without_metrics(provider):
+    assert "metrics" not in provider.stats()
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.prewarm_connections")
+def test_initialize_prewarms_connections(mock_prewarm):
+    options = HyphenProviderOptions(application="test-app", environment="test")
+    HyphenProvider("test-key", options).initialize(EvaluationContext())
+    mock_prewarm.assert_not_called()
+
+    options.prewarm_connections = True
+    HyphenProvider("test-key", options).initialize(EvaluationContext())
+    mock_prewarm.assert_called_once()
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.refresh")
+def test_initialize_prefetches_contexts(mock_refresh):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        prefetch_contexts=[
+            HyphenEvaluationContext(targeting_key="user1"),
+            HyphenEvaluationContext(targeting_key="user2"),
+        ],
+    )
+
+    def refresh(context):
+        if context.targeting_key == "user1":
+            raise Exception("Network error")
+
+    mock_refresh.side_effect = refresh
+
+    HyphenProvider("test-key", options).initialize(EvaluationContext())
+
+    contexts = [args[0] for args, _ in mock_refresh.call_args_list]
+    assert sorted(context.targeting_key for context in contexts) == ["user1", "user2"]
+    assert contexts[0].application == "test-app"
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.close")
+def test_shutdown_closes_client(mock_close):
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", shutdown_timeout_seconds=2
+    )
+    provider = HyphenProvider("test-key", options)
+
+    # Nothing to close when the client was never used
+    provider.shutdown()
+    mock_close.assert_not_called()
+
+    provider.hyphen_client
+    provider.shutdown()
+    mock_close.assert_called_once()
+    assert 1.9 < mock_close.call_args[0][0] <= 2
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.close")
+def test_shutdown_shares_timeout_with_warmer(mock_close):
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", shutdown_timeout_seconds=0.3
+    )
+    provider = HyphenProvider("test-key", options)
+    with patch("openfeature_provider_hyphen.warming.CacheWarmer.stop") as mock_stop:
+        mock_stop.side_effect = lambda timeout: time.sleep(0.2)
+        provider.warmer
+        provider.shutdown()
+
+    mock_stop.assert_called_once_with(0.3)
+    assert mock_close.call_args[0][0] <= 0.1
+
+
+@patch("openfeature_provider_hyphen.hyphen_client.HyphenClient.refresh")
+def test_warm(mock_refresh):
+    options = HyphenProviderOptions(application="test-app", environment="test")
+    provider = HyphenProvider("test-key", options)
+
+    warmed = provider.warm(
+        [EvaluationContext(targeting_key=f"user{index}") for index in range(20)]
+    )
+
+    assert warmed == 20
+    assert mock_refresh.call_count == 20
+    assert len(provider.warmer.contexts) == 20
+
+
+def test_flag_changes_emit_configuration_changed():
+    responses = [
+        {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+        {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+        {"toggles": {"a": {"key": "a", "value": 2, "type": "number"}}},
+    ]
+    transport = InMemoryTransport(handler=lambda url, payload: (200, responses.pop(0)))
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        notify_flag_changes=True,
+    )
+    provider = HyphenProvider("test-key", options)
+    context = provider._prepare_context(EvaluationContext(targeting_key="user1"))
+
+    with patch.object(provider, "emit_provider_configuration_changed") as mock_emit:
+        provider.hyphen_client.evaluate(context)
+        provider.hyphen_client.refresh(context)
+        mock_emit.assert_not_called()
+
+        provider.hyphen_client.refresh(context)
+        mock_emit.assert_called_once()
+        assert mock_emit.call_args[0][0].flags_changed == ["a"]
+
+
+def test_telemetry_hook_sampling():
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        telemetry_sample_rate=0.0,
+        telemetry_sample_rates_by_flag={"sampled-flag": 0.999999},
+    )
+    provider = HyphenProvider("test-key", options)
+    hook = provider._create_telemetry_hook()
+    hook_context = Mock()
+    hook_context.evaluation_context = EvaluationContext(targeting_key="user1")
+    details = FlagResolutionDetails(value=True, reason=Reason.TARGETING_MATCH)
+
+    with patch(
+        "openfeature_provider_hyphen.hooks.prepare_evaluate_payload"
+    ) as mock_prepare, patch(
+        "openfeature_provider_hyphen.hyphen_client.HyphenClient.post_telemetry"
+    ) as mock_post:
+        details.flag_key = "other-flag"
+        hook.after(hook_context, details, {})
+        mock_prepare.assert_not_called()
+        mock_post.assert_not_called()
+
+    with patch(
+        "openfeature_provider_hyphen.hyphen_client.HyphenClient.post_telemetry"
+    ) as mock_post:
+        details.flag_key = "sampled-flag"
+        hook.after(hook_context, details, {})
+        payload = mock_post.call_args[0][0]
+        assert payload.data["toggle"]["sampleWeight"] == pytest.approx(1.000001)
+
+
+def test_provider_rejects_invalid_sample_rate():
+    with pytest.raises(ValueError, match="telemetry_sample_rate"):
+        HyphenProvider(
+            "test-key",
+            HyphenProviderOptions(
+                application="test-app", environment="test", telemetry_sample_rate=2
+            ),
+        )
+
+
+@pytest.mark.parametrize(
+    "options,message",
+    [
+        ({"request_compression": "br"}, "Unsupported compression"),
+        (
+            {
+                "cache_key_include_attributes": ["targeting_key"],
+                "cache_key_exclude_attributes": ["ip_address"],
+            },
+            "cannot be used together",
+        ),
+        (
+            {"adaptive_cache_ttl": True, "cache_min_ttl_seconds": 600},
+            "cache_min_ttl_seconds",
+        ),
+    ],
+)
+def test_provider_rejects_invalid_client_options(options, message):
+    # Rejected when the provider is constructed, before the client is created
+    with pytest.raises(ValueError, match=message):
+        HyphenProvider(
+            "test-key",
+            HyphenProviderOptions(
+                application="test-app", environment="test", **options
+            ),
+        )
+
+
+def test_non_blocking_evaluation():
+    transport = InMemoryTransport(
+        handler=lambda url, payload: (
+            200,
+            {
+                "toggles": {
+                    "a": {"key": "a", "value": 1, "type": "number"},
+                    "b": {"key": "b", "value": True, "type": "boolean"},
+                }
+            },
+        )
+    )
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        non_blocking_evaluation=True,
+    )
+    provider = HyphenProvider("test-key", options)
+    context = EvaluationContext(targeting_key="user1")
+    client = provider.hyphen_client
+
+    details = provider.resolve_integer_details("a", 0, context)
+    assert details.value == 0
+    assert details.reason == "CACHE_MISS"
+
+    for _ in range(100):
+        if not client.background_fetcher.pending:
+            break
+        time.sleep(0.01)
+    assert len(transport.requests) == 1
+
+    details = provider.resolve_integer_details("a", 0, context)
+    assert details.value == 1
+    assert details.reason == Reason.TARGETING_MATCH
+
+    client.cache.l1.cache.clear()
+    with patch.object(client.background_fetcher, "schedule") as mock_schedule:
+        assert provider.resolve_integer_details("a", 0, context).reason == "STALE"
+        assert provider.resolve_boolean_details("b", False, context).reason == "STALE"
+        assert mock_schedule.call_count == 2
+    provider.shutdown()
+
+
+@pytest.mark.parametrize("intern", [True, False])
+def test_object_values_are_copied(intern):
+    transport = InMemoryTransport(
+        handler=lambda url, payload: (
+            200,
+            {"toggles": {"o": {"key": "o", "value": {"a": [1]}, "type": "object"}}},
+        )
+    )
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        cache_intern_responses=intern,
+    )
+    provider = HyphenProvider("test-key", options)
+
+    value = provider.resolve_object_details(
+        "o", {}, EvaluationContext(targeting_key="u1")
+    ).value
+    value["a"].append(99)
+
+    for targeting_key in ("u1", "u2"):
+        details = provider.resolve_object_details(
+            "o", {}, EvaluationContext(targeting_key=targeting_key)
+        )
+        assert details.value == {"a": [1]}
+
+
+def test_cache_miss_interns_the_response_once():
+    transport = InMemoryTransport(
+        handler=lambda url, payload: (
+            200,
+            {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+        )
+    )
+    options = HyphenProviderOptions(
+        application="test-app", environment="test", transport=transport
+    )
+    provider = HyphenProvider("test-key", options)
+    interner = provider.hyphen_client.cache.interner
+
+    with patch.object(interner, "intern", wraps=interner.intern) as mock_intern:
+        provider.resolve_integer_details("a", 0, EvaluationContext(targeting_key="u1"))
+    mock_intern.assert_called_once()
+
+
+def test_non_blocking_evaluation_serves_stale_on_cached_failure():
+    transport = InMemoryTransport(
+        handler=lambda url, payload: (
+            200,
+            {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+        )
+    )
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        non_blocking_evaluation=True,
+        negative_cache_ttl_seconds=30,
+    )
+    provider = HyphenProvider("test-key", options)
+    client = provider.hyphen_client
+    known = provider._prepare_context(EvaluationContext(targeting_key="known"))
+    client.evaluate(known)
+
+    # A background fetch failed after the entry expired
+    client.cache.l1.cache.clear()
+    client.cache.set_error(known, RuntimeError("503 error"))
+    details = provider.resolve_integer_details("a", 0, known)
+    assert details.value == 1
+    assert details.reason == "STALE"
+
+    unknown = provider._prepare_context(EvaluationContext(targeting_key="unknown"))
+    client.cache.set_error(unknown, RuntimeError("503 error"))
+    with pytest.raises(RuntimeError, match="503 error"):
+        provider.resolve_integer_details("a", 0, unknown)
+    provider.shutdown()
+
+
+def test_telemetry_skips_non_blocking_cache_misses():
+    options = HyphenProviderOptions(application="test-app", environment="test")
+    provider = HyphenProvider("test-key", options)
+    hook = provider.get_provider_hooks()[0]
+    hook_context = Mock()
+    hook_context.evaluation_context = EvaluationContext(targeting_key="user1")
+    details = FlagEvaluationDetails("b", False, reason="CACHE_MISS")
+
+    with patch(
+        "openfeature_provider_hyphen.hyphen_client.HyphenClient.post_telemetry"
+    ) as mock_post:
+        hook.after(hook_context, details, {})
+        mock_post.assert_not_called()
+
+
+def test_non_blocking_evaluation_does_not_wait_on_telemetry():
+    def handler(url, payload):
+        if "telemetry" in url:
+            time.sleep(0.2)
+            return 200, {}
+        return 200, {"toggles": {"b": {"key": "b", "value": True, "type": "boolean"}}}
+
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=InMemoryTransport(handler=handler),
+        non_blocking_evaluation=True,
+    )
+    provider = HyphenProvider("test-key", options)
+    context = EvaluationContext(targeting_key="user1")
+    provider.hyphen_client.evaluate(provider._prepare_context(context))
+    hook = provider.get_provider_hooks()[0]
+    hook_context = Mock()
+    hook_context.evaluation_context = context
+
+    start = time.perf_counter()
+    details = provider.resolve_boolean_details("b", False, context)
+    hook.after(hook_context, FlagEvaluationDetails("b", details.value), {})
+    assert time.perf_counter() - start < 0.1
+    assert provider.hyphen_client.telemetry_worker is not None
+    provider.shutdown()
@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+from openfeature.evaluation_context import EvaluationContext
+
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.registry import ClientRegistry, shared_clients
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import HyphenProviderOptions
+
+
+def make_options(application, environment="test", **kwargs):
+    return HyphenProviderOptions(
+        application=application, environment=environment, **kwargs
+    )
+
+
+def test_registry_shares_clients_by_public_key_and_urls():
+    registry = ClientRegistry()
+    first = registry.acquire("key", make_options("app-a"))
+
+    assert registry.acquire("key", make_options("app-b", "prod")) is first
+    assert registry.acquire("other-key", make_options("app-a")) is not first
+    assert (
+        registry.acquire("key", make_options("app-a", horizon_urls=["https://h"]))
+        is not first
+    )
+    assert first.shared
+
+
+def test_registry_warns_about_ignored_options(caplog):
+    registry = ClientRegistry()
+    registry.acquire("key", make_options("app-a", cache_ttl_seconds=30))
+
+    with caplog.at_level("WARNING"):
+        registry.acquire("key", make_options("app-b", cache_ttl_seconds=30))
+    assert caplog.records == []
+
+    with caplog.at_level("WARNING"):
+        registry.acquire(
+            "key",
+            make_options("app-c", cache_ttl_seconds=60, notify_flag_changes=True),
+        )
+    assert "cache_ttl_seconds, notify_flag_changes" in caplog.text
+    assert "app-c/test" in caplog.text
+
+
+def test_registry_closes_client_on_last_release():
+    registry = ClientRegistry()
+    client = registry.acquire("key", make_options("app-a"))
+    registry.acquire("key", make_options("app-b"))
+
+    with patch.object(client, "close", return_value=True) as mock_close:
+        assert registry.release(client) is None
+        mock_close.assert_not_called()
+        assert registry.release(client) is True
+        mock_close.assert_called_once()
+
+    assert registry.acquire("key", make_options("app-a")) is not client
+
+
+def test_shared_providers_partition_the_cache():
+    transport = InMemoryTransport(
+        handler=lambda url, payload: (
+            200,
+            {
+                "toggles": {
+                    "flag": {
+                        "key": "flag",
+                        "value": payload["application"],
+                        "type": "string",
+                    }
+                }
+            },
+        )
+    )
+    providers = [
+        HyphenProvider(
+            "shared-key",
+            make_options(application, transport=transport, share_client=True),
+        )
+        for application in ("app-a", "app-b")
+    ]
+    try:
+        assert providers[0].hyphen_client is providers[1].hyphen_client
+
+        values = [
+            provider.resolve_string_details(
+                "flag", "default", EvaluationContext(targeting_key="user1")
+            ).value
+            for provider in providers
+        ]
+
+        assert values == ["app-a", "app-b"]
+        assert len(transport.requests) == 2
+    finally:
+        for provider in providers:
+            provider.shutdown()
+    assert ("shared-key", ()) not in shared_clients.clients
+
+
+def test_shared_client_notifies_the_partition_listener():
+    responses = [
+        {"toggles": {"a": {"key": "a", "value": 1, "type": "number"}}},
+        {"toggles": {"a": {"key": "a", "value": 2, "type": "number"}}},
+    ]
+    transport = InMemoryTransport(handler=lambda url, payload: (200, responses.pop(0)))
+    providers = [
+        HyphenProvider(
+            "notify-key",
+            make_options(
+                application,
+                transport=transport,
+                share_client=True,
+                notify_flag_changes=True,
+            ),
+        )
+        for application in ("app-a", "app-b")
+    ]
+    client = providers[0].hyphen_client
+    assert providers[1].hyphen_client is client
+    context = providers[0]._prepare_context(EvaluationContext(targeting_key="user1"))
+
+    with patch.object(
+        providers[0], "emit_provider_configuration_changed"
+    ) as mock_a, patch.object(
+        providers[1], "emit_provider_configuration_changed"
+    ) as mock_b:
+        client.refresh(context)
+        client.refresh(context)
+
+    mock_a.assert_called_once()
+    mock_b.assert_not_called()
+    for provider in providers:
+        provider.shutdown()
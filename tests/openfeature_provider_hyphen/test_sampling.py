@@ -0,0 +1,53 @@
+import pytest
+
+from openfeature_provider_hyphen.sampling import (TelemetrySampler,
+                                                  sample_position)
+
+
+def test_sample_position_is_stable():
+    assert sample_position("user1") == sample_position("user1")
+    assert 0.0 <= sample_position("user1") < 1.0
+
+
+def test_sampler_is_consistent_per_targeting_key():
+    sampler = TelemetrySampler(rate=0.5)
+    decisions = {
+        key: sampler.sample_weight("flag", key) for key in map(str, range(100))
+    }
+
+    for key, weight in decisions.items():
+        assert sampler.sample_weight("flag", key) == weight
+        assert weight in (None, 2.0)
+
+
+def test_sampler_rate_is_approximately_respected():
+    sampler = TelemetrySampler(rate=0.1)
+    sampled = sum(
+        sampler.sample_weight("flag", f"user-{i}") is not None for i in range(10000)
+    )
+
+    assert 800 < sampled < 1200
+
+
+def test_sampler_per_flag_overrides():
+    sampler = TelemetrySampler(rate=0.0, rates_by_flag={"hot-flag": 1.0})
+
+    assert sampler.sample_weight("other-flag", "user1") is None
+    assert sampler.sample_weight("hot-flag", "user1") == 1.0
+
+
+def test_sampled_users_are_nested_across_rates():
+    low = TelemetrySampler(rate=0.2)
+    high = TelemetrySampler(rate=0.6)
+
+    for i in range(1000):
+        if low.sample_weight("flag", f"user-{i}") is not None:
+            assert high.sample_weight("flag", f"user-{i}") is not None
+
+
+@pytest.mark.parametrize("rate", [-0.1, 1.5])
+def test_sampler_rejects_invalid_rates(rate):
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        TelemetrySampler(rate=rate)
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        TelemetrySampler(rates_by_flag={"flag": rate})
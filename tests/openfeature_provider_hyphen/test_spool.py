@@ -0,0 +1,149 @@
+import os
+import threading
+import time
+
+from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.spool import TelemetrySpool
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import (HyphenProviderOptions,
+                                               TelemetryPayload)
+
+
+def make_spool(directory, send, **kwargs):
+    spool = TelemetrySpool(str(directory), send, retry_seconds=60, **kwargs)
+    # Replays are triggered by the tests
+    spool.start = lambda: None
+    return spool
+
+
+def test_spool_replays_records_in_order(tmp_path):
+    sent = []
+    spool = make_spool(tmp_path, sent.append)
+
+    for i in range(3):
+        spool.append({"event": i})
+
+    assert spool.replay() is True
+    assert sent == [{"event": 0}, {"event": 1}, {"event": 2}]
+    assert spool.pending_segments() == []
+
+
+def test_spool_keeps_unsent_records_on_failure(tmp_path):
+    sent = []
+
+    def send(record):
+        if record["event"] == 1:
+            raise ConnectionError("down")
+        sent.append(record)
+
+    spool = make_spool(tmp_path, send)
+    for i in range(3):
+        spool.append({"event": i})
+
+    assert spool.replay() is False
+    assert sent == [{"event": 0}]
+
+    spool.send = sent.append
+    assert spool.replay() is True
+    assert sent == [{"event": 0}, {"event": 1}, {"event": 2}]
+
+
+def test_spool_keeps_records_appended_during_replay(tmp_path):
+    sent = []
+    spool = make_spool(tmp_path, sent.append)
+    spool.append({"event": 1})
+    list_segments = spool.pending_segments
+    appender = threading.Thread(target=spool.append, args=({"event": 2},))
+
+    def pending_segments():
+        # Another thread appends while the replay lists the segments
+        appender.start()
+        appender.join(0.1)
+        return list_segments()
+
+    spool.pending_segments = pending_segments
+    assert spool.replay() is True
+    appender.join(5)
+    spool.pending_segments = list_segments
+
+    spool.append({"event": 3})
+    assert spool.replay() is True
+    assert sent == [{"event": 1}, {"event": 2}, {"event": 3}]
+    assert os.listdir(tmp_path) == []
+
+
+def test_spool_is_durable_across_instances(tmp_path):
+    make_spool(tmp_path, lambda record: None).append({"event": 0})
+
+    sent = []
+    assert make_spool(tmp_path, sent.append).replay() is True
+    assert sent == [{"event": 0}]
+
+
+def test_spool_rotates_segments_and_evicts_oldest(tmp_path):
+    evicted = []
+    spool = make_spool(
+        tmp_path,
+        lambda record: None,
+        segment_bytes=100,
+        max_bytes=300,
+        on_evict=evicted.append,
+    )
+
+    for i in range(40):
+        spool.append({"event": i, "padding": "x" * 20})
+
+    segments = spool.pending_segments()
+    assert len(segments) > 1
+    assert sum(os.path.getsize(path) for path in segments) <= 300 + 100
+    assert spool.evicted == sum(evicted) > 0
+
+
+def test_client_spools_failed_telemetry_in_background(tmp_path):
+    down = True
+
+    def handler(url, payload):
+        return (503, {}) if down else (200, {})
+
+    transport = InMemoryTransport(handler=handler)
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=transport,
+        telemetry_spool_dir=str(tmp_path),
+        telemetry_spool_retry_seconds=0.01,
+        enable_metrics=True,
+    )
+    client = HyphenClient("test-key", options)
+    assert client.telemetry_worker is not None
+
+    payload = TelemetryPayload(
+        context={"targetingKey": "user1"}, data={"toggle": {"key": "flag"}}
+    )
+    client.post_telemetry(payload)
+    client.telemetry_worker.queue.join()
+    counters = client.metrics.counters["hyphen_telemetry_events_total"]
+    assert counters[(("outcome", "spooled"),)] == 1
+
+    down = False
+    client.telemetry_spool._thread.join(5)
+    assert client.telemetry_spool.pending_segments() == []
+    assert counters[(("outcome", "replayed"),)] == 1
+    assert transport.requests[-1].payload["data"] == {"toggle": {"key": "flag"}}
+    client.close()
+
+
+def test_client_close_shares_one_timeout(tmp_path):
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        transport=InMemoryTransport(),
+        telemetry_spool_dir=str(tmp_path),
+    )
+    client = HyphenClient("test-key", options)
+    client.telemetry_worker.close = lambda timeout: time.sleep(0.2) or False
+    timeouts = []
+    client.telemetry_spool.close = timeouts.append
+
+    assert client.close(timeout=0.3) is False
+    assert timeouts[0] <= 0.1
@@ -0,0 +1,93 @@
+import threading
+
+from openfeature_provider_hyphen.telemetry import TelemetryWorker
+
+
+def test_worker_sends_in_order():
+    sent = []
+    worker = TelemetryWorker(sent.append)
+
+    for index in range(5):
+        worker.submit(index)
+
+    assert worker.close(timeout=1) is True
+    assert sent == [0, 1, 2, 3, 4]
+
+
+def test_worker_drops_when_queue_is_full():
+    started = threading.Event()
+    release = threading.Event()
+    sent = []
+    drops = []
+
+    def send(payload):
+        started.set()
+        release.wait()
+        sent.append(payload)
+
+    worker = TelemetryWorker(send, max_queue_size=1, on_drop=lambda: drops.append(1))
+    worker.submit("first")
+    started.wait(1)
+    worker.submit("second")
+    worker.submit("third")
+
+    assert worker.dropped == 1
+    assert drops == [1]
+    release.set()
+    assert worker.close(timeout=1) is True
+    assert sent == ["first", "second"]
+
+
+def test_worker_close_is_bounded():
+    release = threading.Event()
+    worker = TelemetryWorker(lambda payload: release.wait(), max_queue_size=1)
+    worker.submit("first")
+    worker.submit("second")
+
+    assert worker.close(timeout=0.05) is False
+    release.set()
+
+
+def test_worker_pending_excludes_stop_marker():
+    started = threading.Event()
+    release = threading.Event()
+
+    def send(payload):
+        started.set()
+        release.wait()
+
+    worker = TelemetryWorker(send)
+    worker.submit("first")
+    started.wait(1)
+    worker.submit("second")
+
+    assert worker.close(timeout=0.05) is False
+    assert worker.pending() == 1
+    release.set()
+
+
+def test_worker_ignores_submissions_after_close():
+    sent = []
+    worker = TelemetryWorker(sent.append)
+
+    assert worker.close(timeout=1) is True
+    worker.submit("late")
+
+    assert sent == []
+    assert worker._thread is None
+
+
+def test_worker_survives_send_errors():
+    sent = []
+
+    def send(payload):
+        if payload == "bad":
+            raise ValueError("Failed")
+        sent.append(payload)
+
+    worker = TelemetryWorker(send)
+    worker.submit("bad")
+    worker.submit("good")
+
+    assert worker.close(timeout=1) is True
+    assert sent == ["good"]
@@ -0,0 +1,76 @@
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+from openfeature_provider_hyphen.provider import HyphenProvider
+from openfeature_provider_hyphen.tracing import start_span
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions)
+
+
+class FakeSpan:
+    def __init__(self, name, attributes):
+        self.name = name
+        self.attributes = dict(attributes or {})
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def set_attributes(self, attributes):
+        self.attributes.update(attributes)
+
+
+class FakeTracer:
+    def __init__(self):
+        self.spans = []
+
+    @contextmanager
+    def start_as_current_span(self, name, attributes=None):
+        span = FakeSpan(name, attributes)
+        self.spans.append(span)
+        yield span
+
+
+def test_start_span_without_tracer():
+    with start_span(None, "span", {"key": "value"}) as span:
+        span.set_attribute("key", "value")
+        span.set_attributes({"key": "value"})
+
+
+@patch("requests.Session.post")
+def test_evaluation_spans(mock_post):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {
+        "toggles": {"test-flag": {"key": "test-flag", "value": True, "type": "boolean"}}
+    }
+    mock_post.return_value = mock_response
+    tracer = FakeTracer()
+    options = HyphenProviderOptions(
+        application="test-app",
+        environment="test",
+        horizon_urls=["https://test.example.com"],
+        tracer=tracer,
+    )
+    provider = HyphenProvider("test-key", options)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    provider.resolve_boolean_details("test-flag", False, context)
+    provider.resolve_boolean_details("test-flag", False, context)
+
+    spans = {}
+    for span in tracer.spans:
+        spans.setdefault(span.name, []).append(span)
+
+    assert spans["hyphen.evaluate"][0].attributes["feature_flag.key"] == "test-flag"
+    assert len(spans["hyphen.cache.generate_key"]) == 2
+
+    lookups = spans["hyphen.cache.lookup"]
+    assert lookups[0].attributes["hyphen.cache.hit"] is False
+    assert lookups[1].attributes["hyphen.cache.hit"] is True
+
+    (request,) = spans["hyphen.request"]
+    assert request.attributes["hyphen.endpoint"] == "/toggle/evaluate"
+    assert request.attributes["hyphen.url"] == "https://test.example.com"
+    assert request.attributes["hyphen.retry_count"] == 0
+    assert request.attributes["http.status_code"] == 200
+    assert request.attributes["hyphen.payload_size"] > 0
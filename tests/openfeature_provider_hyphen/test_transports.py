@@ -0,0 +1,223 @@
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.transports import (InMemoryTransport,
+                                                    ThreadedAsyncTransport,
+                                                    TransportError,
+                                                    TransportResponse,
+                                                    Urllib3Transport)
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions,
+                                               TelemetryPayload)
+
+EVALUATE_RESPONSE = {
+    "toggles": {
+        "test-flag": {
+            "key": "test-flag",
+            "value": True,
+            "type": "boolean",
+            "reason": "STATIC",
+        }
+    }
+}
+
+
+@pytest.fixture
+def http_server():
+    received = []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers["Content-Length"]))
+            if self.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            received.append((self.path, self.headers, json.loads(body)))
+            status = 500 if self.path == "/fail" else 200
+            data = json.dumps(EVALUATE_RESPONSE).encode()
+            self.send_response(status)
+            if "gzip" in self.headers.get("Accept-Encoding", ""):
+                data = gzip.compress(data)
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.received = received
+    server.url = "http://127.0.0.1:%d" % server.server_address[1]
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(transport, **options) -> HyphenClient:
+    return HyphenClient(
+        "test-key",
+        HyphenProviderOptions(
+            application="test-app",
+            environment="test",
+            horizon_urls=["https://test.example.com"],
+            transport=transport,
+            **options,
+        ),
+    )
+
+
+def test_transport_response():
+    response = TransportResponse("https://test.example.com", 200, b'{"a": 1}')
+    response.raise_for_status()
+    assert response.json() == {"a": 1}
+
+    with pytest.raises(TransportError) as error:
+        TransportResponse("https://test.example.com", 503).raise_for_status()
+    assert error.value.status_code == 503
+
+
+def test_urllib3_transport(http_server):
+    transport = Urllib3Transport()
+
+    response = transport.post(
+        http_server.url + "/toggle/evaluate", {"a": 1}, {"x-api-key": "test-key"}
+    )
+
+    assert response.status_code == 200
+    assert response.json() == EVALUATE_RESPONSE
+    path, headers, payload = http_server.received[0]
+    assert path == "/toggle/evaluate"
+    assert headers["x-api-key"] == "test-key"
+    assert payload == {"a": 1}
+
+    with pytest.raises(TransportError):
+        transport.post(http_server.url + "/fail", {}, {}).raise_for_status()
+
+
+def test_in_memory_transport():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+
+    found = transport.post("https://test.example.com/toggle/evaluate", {}, {})
+    missing = transport.post("https://test.example.com/unknown", {}, {})
+
+    assert found.json() == EVALUATE_RESPONSE
+    assert missing.status_code == 404
+    assert [request.url for request in transport.requests] == [
+        "https://test.example.com/toggle/evaluate",
+        "https://test.example.com/unknown",
+    ]
+
+
+def test_client_uses_transport():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+    client = make_client(transport)
+
+    response = client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+
+    assert response.toggles["test-flag"].value is True
+    assert client.session is None
+    request = transport.requests[0]
+    assert request.payload["targetingKey"] == "user1"
+    assert request.headers["x-api-key"] == "test-key"
+
+
+def test_client_fails_over_with_transport():
+    def handler(url, payload):
+        if url.startswith("https://test.example.com"):
+            raise ConnectionError("Connection refused")
+        return 200, EVALUATE_RESPONSE
+
+    transport = InMemoryTransport(handler=handler)
+    client = make_client(transport)
+
+    client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+
+    assert transport.requests[-1].url.startswith(client.default_horizon_url)
+
+
+def test_evaluate_async():
+    transport = InMemoryTransport(
+        {"/toggle/evaluate": EVALUATE_RESPONSE, "/toggle/telemetry": {}}
+    )
+    client = make_client(transport)
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    async def run():
+        first = await client.evaluate_async(context)
+        second = await client.evaluate_async(context)
+        await client.post_telemetry_async(
+            TelemetryPayload(context={"targetingKey": "user1"}, data={})
+        )
+        return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first.toggles["test-flag"].value is True
+    assert second is first
+    assert [request.url.rsplit("/", 1)[1] for request in transport.requests] == [
+        "evaluate",
+        "telemetry",
+    ]
+
+
+def test_async_transport_option():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+    client = make_client(
+        InMemoryTransport(), async_transport=ThreadedAsyncTransport(transport)
+    )
+
+    asyncio.run(client.evaluate_async(HyphenEvaluationContext(targeting_key="u1")))
+
+    assert len(transport.requests) == 1
+    assert client.transport.requests == []
+
+
+def test_request_compression():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+    client = make_client(
+        transport, request_compression="gzip", request_compression_min_bytes=200
+    )
+
+    client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+    client.evaluate(
+        HyphenEvaluationContext(
+            targeting_key="user2",
+            attributes={"custom_attributes": {"notes": "x" * 500}},
+        )
+    )
+
+    small, large = transport.requests
+    assert "Content-Encoding" not in small.headers
+    assert large.headers["Content-Encoding"] == "gzip"
+    assert large.payload["targetingKey"] == "user2"
+    assert large.payload["customAttributes"]["notes"] == "x" * 500
+
+
+def test_compressed_request_over_http(http_server):
+    client = make_client(
+        Urllib3Transport(), request_compression="gzip", request_compression_min_bytes=0
+    )
+    client.horizon_urls = [http_server.url]
+
+    response = client.evaluate(HyphenEvaluationContext(targeting_key="user1"))
+
+    assert response.toggles["test-flag"].value is True
+    _, headers, payload = http_server.received[0]
+    assert headers["Content-Encoding"] == "gzip"
+    assert "gzip" in headers["Accept-Encoding"]
+    assert payload["targetingKey"] == "user1"
+
+
+def test_unsupported_compression():
+    with pytest.raises(ValueError):
+        make_client(InMemoryTransport(), request_compression="brotli")
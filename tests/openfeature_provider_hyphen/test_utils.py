@@ -1,15 +1,17 @@
 import base64
 
+import pytest
 from openfeature.evaluation_context import EvaluationContext
 from openfeature.flag_evaluation import FlagEvaluationDetails
 
-from openfeature_provider_hyphen.utils import (
-    build_default_horizon_url,
-    build_url,
-    get_org_id_from_public_key,
-    prepare_evaluate_payload,
-    prepare_telemetry_details,
-)
+from openfeature_provider_hyphen.types import HyphenProviderOptions
+from openfeature_provider_hyphen.utils import (build_default_horizon_url,
+                                               build_url, compress_body,
+                                               decompress_body,
+                                               get_org_id_from_public_key,
+                                               prepare_evaluate_payload,
+                                               prepare_telemetry_details,
+                                               resolve_client_options)
 
 
 def test_get_org_id_from_public_key():
@@ -109,3 +111,37 @@ def test_build_url():
     # Test with leading slash in path
     url = build_url("https://example.com/base", "path")
     assert url == "https://example.com/base/path"
+
+
+def test_compress_body():
+    body = b'{"targetingKey": "user1"}' * 10
+
+    compressed = compress_body(body, "gzip")
+    assert len(compressed) < len(body)
+    assert decompress_body(compressed, "gzip") == body
+    assert decompress_body(body, None) == body
+
+    with pytest.raises(ValueError):
+        compress_body(body, "brotli")
+
+
+def test_compress_body_zstd():
+    pytest.importorskip("zstandard")
+    body = b'{"targetingKey": "user1"}' * 10
+
+    assert decompress_body(compress_body(body, "zstd"), "zstd") == body
+
+
+def test_resolve_client_options():
+    options = HyphenProviderOptions(
+        application="app", environment="test", cache_ttl_seconds=40
+    )
+    assert resolve_client_options(options) == (40, None)
+
+    options.adaptive_cache_ttl = True
+    options.cache_max_ttl_seconds = 300
+    assert resolve_client_options(options) == (40, (10, 300))
+
+    options.cache_min_ttl_seconds = 400
+    with pytest.raises(ValueError, match="cache_min_ttl_seconds"):
+        resolve_client_options(options)
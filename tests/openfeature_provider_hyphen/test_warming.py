@@ -0,0 +1,101 @@
+import threading
+import time
+
+from openfeature_provider_hyphen.hyphen_client import HyphenClient
+from openfeature_provider_hyphen.transports import InMemoryTransport
+from openfeature_provider_hyphen.types import (HyphenEvaluationContext,
+                                               HyphenProviderOptions)
+from openfeature_provider_hyphen.warming import BackgroundFetcher, CacheWarmer
+
+EVALUATE_RESPONSE = {
+    "toggles": {"test-flag": {"key": "test-flag", "value": True, "type": "boolean"}}
+}
+
+
+def make_warmer(refresh, **kwargs) -> CacheWarmer:
+    return CacheWarmer(refresh, lambda context: context.targeting_key, **kwargs)
+
+
+def test_warm_refreshes_concurrently():
+    barrier = threading.Barrier(4, timeout=1)
+    warmer = make_warmer(lambda context: barrier.wait(), max_workers=4)
+
+    contexts = [HyphenEvaluationContext(targeting_key=f"user{i}") for i in range(4)]
+
+    assert warmer.warm(contexts) == 4
+
+
+def test_warm_counts_failures():
+    def refresh(context):
+        if context.targeting_key == "bad":
+            raise ValueError("Failed")
+
+    warmer = make_warmer(refresh)
+    contexts = [
+        HyphenEvaluationContext(targeting_key="good"),
+        HyphenEvaluationContext(targeting_key="bad"),
+    ]
+
+    assert warmer.warm(contexts) == 1
+    assert sorted(warmer.contexts) == ["bad", "good"]
+
+
+def test_scheduled_rewarm():
+    refreshed = []
+    warmer = make_warmer(
+        lambda context: refreshed.append(context.targeting_key),
+        interval_seconds=0.01,
+    )
+
+    warmer.warm([HyphenEvaluationContext(targeting_key="user1")])
+    deadline = time.monotonic() + 1
+    while len(refreshed) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    warmer.stop(timeout=1)
+
+    assert len(refreshed) >= 3
+    assert not warmer._thread.is_alive()
+
+
+def test_refresh_bypasses_cache():
+    transport = InMemoryTransport({"/toggle/evaluate": EVALUATE_RESPONSE})
+    client = HyphenClient(
+        "test-key",
+        HyphenProviderOptions(
+            application="test-app",
+            environment="test",
+            horizon_urls=["https://test.example.com"],
+            transport=transport,
+        ),
+    )
+    context = HyphenEvaluationContext(targeting_key="user1")
+
+    client.evaluate(context)
+    refreshed = client.refresh(context)
+
+    assert len(transport.requests) == 2
+    assert client.evaluate(context) is refreshed
+
+
+def test_background_fetcher_deduplicates_and_bounds_pending():
+    release = threading.Event()
+    fetched = []
+
+    def fetch(context):
+        release.wait(5)
+        fetched.append(context.targeting_key)
+
+    fetcher = BackgroundFetcher(
+        fetch, lambda context: context.targeting_key, max_workers=2, max_pending=2
+    )
+
+    assert fetcher.schedule(HyphenEvaluationContext(targeting_key="a")) is True
+    assert fetcher.schedule(HyphenEvaluationContext(targeting_key="a")) is False
+    assert fetcher.schedule(HyphenEvaluationContext(targeting_key="b")) is True
+    assert fetcher.schedule(HyphenEvaluationContext(targeting_key="c")) is False
+    assert fetcher.skipped == 1
+
+    release.set()
+    fetcher._executor.shutdown(wait=True)
+    assert sorted(fetched) == ["a", "b"]
+    assert fetcher.pending == set()